@@ -18,17 +18,23 @@ class ModuleDocFragment(object):
     DOCUMENTATION = r'''
 options:
   idrac_ip:
-    required: true
     type: str
-    description: iDRAC IP Address.
+    description:
+     - iDRAC IP Address.
+     - Required unless the module uses the Redfish API and runs over the C(dellemc.openmanage.idrac_redfish)
+       HttpApi connection.
   idrac_user:
-    required: true
     type: str
-    description: iDRAC username.
+    description:
+     - iDRAC username.
+     - Required unless the module uses the Redfish API and runs over the C(dellemc.openmanage.idrac_redfish)
+       HttpApi connection.
   idrac_password:
-    required: true
     type: str
-    description: iDRAC user password.
+    description:
+     - iDRAC user password.
+     - Required unless the module uses the Redfish API and runs over the C(dellemc.openmanage.idrac_redfish)
+       HttpApi connection.
     aliases: ['idrac_pwd']
   idrac_port:
     type: int
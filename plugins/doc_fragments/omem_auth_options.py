@@ -18,17 +18,20 @@ class ModuleDocFragment(object):
     DOCUMENTATION = r'''
 options:
   hostname:
-    description: OpenManage Enterprise Modular IP address or hostname.
+    description:
+     - OpenManage Enterprise Modular IP address or hostname.
+     - Required unless the module runs over the C(dellemc.openmanage.ome) HttpApi connection.
     type: str
-    required: true
   username:
-    description: OpenManage Enterprise Modular username.
+    description:
+     - OpenManage Enterprise Modular username.
+     - Required unless the module runs over the C(dellemc.openmanage.ome) HttpApi connection.
     type: str
-    required: true
   password:
-    description: OpenManage Enterprise Modular password.
+    description:
+     - OpenManage Enterprise Modular password.
+     - Required unless the module runs over the C(dellemc.openmanage.ome) HttpApi connection.
     type: str
-    required: true
   port:
     description: OpenManage Enterprise Modular HTTPS port.
     type: int
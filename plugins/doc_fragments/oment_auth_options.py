@@ -18,17 +18,20 @@ class ModuleDocFragment(object):
     DOCUMENTATION = r'''
 options:
   hostname:
-    description: OpenManage Enterprise IP address or hostname.
+    description:
+     - OpenManage Enterprise IP address or hostname.
+     - Required unless the module runs over the C(dellemc.openmanage.ome) HttpApi connection.
     type: str
-    required: true
   username:
-    description: OpenManage Enterprise username.
+    description:
+     - OpenManage Enterprise username.
+     - Required unless the module runs over the C(dellemc.openmanage.ome) HttpApi connection.
     type: str
-    required: true
   password:
-    description: OpenManage Enterprise password.
+    description:
+     - OpenManage Enterprise password.
+     - Required unless the module runs over the C(dellemc.openmanage.ome) HttpApi connection.
     type: str
-    required: true
   port:
     description: OpenManage Enterprise HTTPS port.
     type: int
@@ -18,17 +18,20 @@ class ModuleDocFragment(object):
     DOCUMENTATION = r'''
 options:
   baseuri:
-    description: "IP address of the target out-of-band controller. For example- <ipaddress>:<port>."
+    description:
+     - "IP address of the target out-of-band controller. For example- <ipaddress>:<port>."
+     - Required unless the module runs over the C(dellemc.openmanage.idrac_redfish) HttpApi connection.
     type: str
-    required: true
   username:
-    description: Username of the target out-of-band controller.
+    description:
+     - Username of the target out-of-band controller.
+     - Required unless the module runs over the C(dellemc.openmanage.idrac_redfish) HttpApi connection.
     type: str
-    required: true
   password:
-    description: Password of the target out-of-band controller.
+    description:
+     - Password of the target out-of-band controller.
+     - Required unless the module runs over the C(dellemc.openmanage.idrac_redfish) HttpApi connection.
     type: str
-    required: true
   validate_certs:
     description:
      - If C(false), the SSL certificates will not be validated.
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+name: idrac_redfish
+short_description: HttpApi plugin for iDRAC Redfish.
+description:
+  - This HttpApi plugin sends the iDRAC and Redfish module requests through a persistent connection.
+  - The persistent connection process creates one X-Auth-Token session on the iDRAC when the first task runs and
+    shares it with all the tasks of the play for the same host, instead of authenticating every request.
+    The session is deleted when the connection closes.
+  - Set C(ansible_connection) to C(ansible.netcommon.httpapi) and C(ansible_network_os) to
+    C(dellemc.openmanage.idrac_redfish). The modules then use the C(ansible_host), C(ansible_httpapi_port),
+    C(ansible_user), and C(ansible_password) connection variables to reach the iDRAC.
+version_added: "8.6.0"
+requirements:
+  - "ansible.netcommon"
+author:
+  - "Jagadeesh N V (@jagadeeshnv)"
+notes:
+  - The I(idrac_ip), I(idrac_user), and I(idrac_password) or I(baseuri), I(username), and I(password) module options
+    are optional with this plugin. The connection variables are used to send the requests.
+  - The modules that use the OpenManage Python Software Development Kit (OMSDK) do not use this plugin.
+"""
+
+from ansible_collections.dellemc.openmanage.plugins.plugin_utils.httpapi_session import SessionHttpApiBase
+
+
+class HttpApi(SessionHttpApiBase):
+    """Creates the iDRAC Redfish session once for the persistent connection."""
+
+    session_uri = "/redfish/v1/Sessions"
+    session_id_uri = "/redfish/v1/Sessions/{Id}"
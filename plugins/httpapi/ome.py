@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+DOCUMENTATION = """
+---
+name: ome
+short_description: HttpApi plugin for OpenManage Enterprise and OpenManage Enterprise Modular.
+description:
+  - This HttpApi plugin sends the OpenManage Enterprise and OpenManage Enterprise Modular module requests
+    through a persistent connection.
+  - The persistent connection process creates one X-Auth-Token session when the first task runs and
+    shares it with all the tasks of the play for the same host. The session is deleted when the connection closes.
+  - Set C(ansible_connection) to C(ansible.netcommon.httpapi) and C(ansible_network_os) to C(dellemc.openmanage.ome).
+    The modules then use the C(ansible_host), C(ansible_httpapi_port), C(ansible_user), and C(ansible_password)
+    connection variables to reach the appliance.
+version_added: "8.6.0"
+requirements:
+  - "ansible.netcommon"
+author:
+  - "Jagadeesh N V (@jagadeeshnv)"
+notes:
+  - The I(hostname), I(username), and I(password) module options are optional with this plugin.
+    The connection variables are used to send the requests.
+"""
+
+from ansible_collections.dellemc.openmanage.plugins.plugin_utils.httpapi_session import SessionHttpApiBase
+
+
+class HttpApi(SessionHttpApiBase):
+    """Creates the OpenManage Enterprise session once for the persistent connection."""
+
+    session_uri = "/api/SessionService/Sessions"
+    session_id_uri = "/api/SessionService/Sessions('{Id}')"
+
+    def _session_payload(self, username, password):
+        return {'UserName': username, 'Password': password, 'SessionType': 'API'}
@@ -2,7 +2,7 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 7.4.0
+# Version 8.5.0
 # Copyright (C) 2022-2023 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
@@ -23,26 +23,29 @@ options:
     description:
     - OpenManage Enterprise or OpenManage Enterprise Modular IP address or hostname.
     - If the value is not specified in the task, the value of environment variable C(OME_HOSTNAME) will be used instead.
+    - Required when I(appliances) is not specified.
     env:
      - name: OME_HOSTNAME
     type: str
-    required: true
+    required: false
   username:
     description:
     - OpenManage Enterprise or OpenManage Enterprise Modular username.
     - If the value is not specified in the task, the value of environment variable C(OME_USERNAME) will be used instead.
+    - Required when I(username) is not specified for every entry of I(appliances).
     env:
      - name: OME_USERNAME
     type: str
-    required: true
+    required: false
   password:
     description:
     - OpenManage Enterprise or OpenManage Enterprise Modular password.
     - If the value is not specified in the task, the value of environment variable C(OME_PASSWORD) will be used instead.
+    - Required when I(password) is not specified for every entry of I(appliances).
     env:
     - name: OME_PASSWORD
     type: str
-    required: true
+    required: false
   port:
     description:
     - OpenManage Enterprise or OpenManage Enterprise Modular HTTPS port.
@@ -76,44 +79,147 @@ options:
     description: To include group variables in the inventory source.
     type: dict
     required: false
+  workers:
+    description:
+    - Maximum number of concurrent requests used to fetch the groups and the devices of the groups.
+    type: int
+    default: 8
+    version_added: 8.6.0
+  bulk_device_query:
+    description:
+    - If C(true), all the devices are fetched once from C(DeviceService/Devices), the group hierarchy is derived
+      from the group list, and only the member device IDs are requested from the C(AllLeafDevices) of each group.
+    - If C(false), the devices of every group are fetched from the C(AllLeafDevices) of the group and the sub groups
+      are fetched for every group.
+    - C(true) is recommended when devices are members of many groups or the group hierarchy is deep.
+    type: bool
+    default: false
+    version_added: 8.6.0
+  device_fields:
+    description:
+    - List of device attributes of OpenManage Enterprise, such as C(DeviceServiceTag), C(Model), C(Type),
+      C(PowerState), or C(DeviceName), which are set as host variables with the same name.
+    - The values are taken from the device data that is already fetched to build the inventory,
+      so no additional request is sent.
+    - Use the host variables in I(compose), I(groups), and I(keyed_groups) to group the hosts, for example by model.
+    type: list
+    elements: str
+    default: []
+    version_added: 8.6.0
+  appliances:
+    description:
+    - List of OpenManage Enterprise or OpenManage Enterprise Modular appliances which are crawled concurrently.
+    - The options which are not specified for an appliance are taken from the options of the same name.
+    - The hosts of all the appliances are merged. The groups are merged by name unless I(group_prefix) is specified.
+    - Every host has the C(ome_appliance) host variable with the I(hostname) of the appliance that reported it.
+    type: list
+    elements: dict
+    version_added: 8.6.0
+    suboptions:
+      hostname:
+        description: OpenManage Enterprise or OpenManage Enterprise Modular IP address or hostname.
+        type: str
+        required: true
+      username:
+        description: OpenManage Enterprise or OpenManage Enterprise Modular username.
+        type: str
+      password:
+        description: OpenManage Enterprise or OpenManage Enterprise Modular password.
+        type: str
+      port:
+        description: OpenManage Enterprise or OpenManage Enterprise Modular HTTPS port.
+        type: int
+      validate_certs:
+        description: If C(false), the SSL certificates will not be validated.
+        type: bool
+      ca_path:
+        description: The Privacy Enhanced Mail (PEM) file that contains a CA certificate to be used for the validation.
+        type: path
+      timeout:
+        description: The socket level timeout in seconds.
+        type: int
+      ome_group_name:
+        description: Group name.
+        type: str
+      group_prefix:
+        description: Prefix added to the names of the groups of the appliance, for example C(dc1_).
+        type: str
+extends_documentation_fragment:
+  - inventory_cache
+  - constructed
 requirements:
   - "python >= 3.9.6"
 author:
   - "Felix Stephen (@felixs88)"
 notes:
   - Run this plugin on a system that has direct access to Dell OpenManage Enterprise.
+  - When I(cache) is enabled, the groups and hosts fetched from OpenManage Enterprise are stored with the
+    I(cache_plugin) and reused until I(cache_timeout) expires.
+    Use C(ansible-inventory --flush-cache) to fetch them again.
 """
 
-from ansible.plugins.inventory import BaseInventoryPlugin
+from concurrent.futures import ThreadPoolExecutor
+from ansible.errors import AnsibleParserError
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination
 
 GROUP_API = "GroupService/Groups"
+DEVICE_API = "DeviceService/Devices"
+DEVICE_IDENTITY_FIELDS = ["Id", "DeviceName", "DeviceServiceTag", "Identifier"]
+# appliance options which are passed to RestOME
+CONNECTION_OPTIONS = ["hostname", "username", "password", "port", "validate_certs", "ca_path", "timeout"]
 
 
-class InventoryModule(BaseInventoryPlugin):
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
     NAME = "dellemc.openmanage.ome_inventory"
 
     def __init__(self):
         super(InventoryModule, self).__init__()
         self.config = None
+        self._sub_groups = {}
+        self._group_devices = {}
+        self._device_vars = {}
+        self._group_prefix = ""
+        self._appliance = None
+        self._hosts = {}
+
+    def _get_appliances(self):
+        """Returns the settings of every appliance, the options of the inventory source are used as defaults."""
+        defaults = {"port": self.get_option("port") if "port" in self.config else 443,
+                    "validate_certs": self.get_option("validate_certs") if "validate_certs" in self.config else False,
+                    "timeout": self.get_option("timeout")}
+        for key in ["hostname", "username", "password", "ca_path", "ome_group_name"]:
+            if key in self.config or self.get_option(key) is not None:
+                defaults[key] = self.get_option(key)
+        appliances = []
+        for appliance in self.get_option("appliances") or [defaults]:
+            settings = dict(defaults)
+            settings.update((key, val) for key, val in dict(appliance).items() if val is not None)
+            for key in ["hostname", "username", "password"]:
+                if not settings.get(key):
+                    raise AnsibleParserError("The {0} of the OpenManage Enterprise appliance is required.".format(key))
+            appliances.append(settings)
+        return appliances
+
+    def _get_module_params(self, appliance):
+        module_params = dict((key, appliance[key]) for key in CONNECTION_OPTIONS if key in appliance)
+        if module_params.get("ca_path") is None:
+            module_params.pop("ca_path", None)
+        return module_params
 
-    def _get_connection_resp(self):
-        port = self.get_option("port") if "port" in self.config else 443
-        validate_certs = self.get_option("validate_certs") if "validate_certs" in self.config else False
-        module_params = {"hostname": self.get_option("hostname"), "username": self.get_option("username"),
-                         "password": self.get_option("password"), "port": port, "validate_certs": validate_certs}
-        if "ca_path" in self.config:
-            module_params.update({"ca_path": self.get_option("ca_path")})
-        with RestOME(module_params, req_session=False) as ome:
-            all_group_data = get_all_data_with_pagination(ome, GROUP_API)
-        return all_group_data
+    def _get_connection_resp(self, ome):
+        return get_all_data_with_pagination(ome, GROUP_API)
 
     def _set_host_vars(self, host):
         self.inventory.set_variable(host, "idrac_ip", host)
         self.inventory.set_variable(host, "baseuri", host)
         self.inventory.set_variable(host, "hostname", host)
+        if self._appliance is not None:
+            self.inventory.set_variable(host, "ome_appliance", self._appliance)
+        for key, val in self._device_vars.get(host, {}).items():
+            self.inventory.set_variable(host, key, val)
         if "host_vars" in self.config:
             host_vars = self.get_option("host_vars")
             for key, val in dict(host_vars).items():
@@ -136,73 +242,188 @@ class InventoryModule(BaseInventoryPlugin):
             dev_host = mgmt["DeviceManagement"][0]["NetworkAddress"]
         return dev_host
 
-    def _get_all_devices(self, device_uri):
-        device_host = []
+    def _get_all_devices(self, ome, device_uri):
         device_host_uri = device_uri.strip("/api/")
-        port = self.get_option("port") if "port" in self.config else 443
-        validate_certs = self.get_option("validate_certs") if "validate_certs" in self.config else False
-        module_params = {
-            "hostname": self.get_option("hostname"),
-            "username": self.get_option("username"),
-            "password": self.get_option("password"),
-            "port": port,
-            "validate_certs": validate_certs}
-        if "ca_path" in self.config:
-            module_params.update({"ca_path": self.get_option("ca_path")})
-        with RestOME(module_params, req_session=False) as ome:
-            device_resp = get_all_data_with_pagination(ome, device_host_uri)
-            device_data = device_resp.get("report_list", [])
-            if device_data is not None:
-                for mgmt in device_data:
-                    if (len(mgmt["DeviceManagement"]) != 0):
-                        device_host.append(self._get_device_host(mgmt))
+        device_resp = get_all_data_with_pagination(ome, device_host_uri)
+        device_data = device_resp.get("report_list", [])
+        return [self._get_device(mgmt) for mgmt in device_data or [] if len(mgmt["DeviceManagement"]) != 0]
+
+    def _add_devices(self, inventory_data, devices):
+        """Returns the hosts of the devices and keeps the device fields of every host for the host variables."""
+        device_host = []
+        for device in devices:
+            host = self._get_device_host(device)
+            device_host.append(host)
+            inventory_data["device_vars"][host] = device["fields"]
         return device_host
 
+    def _get_sub_groups(self, ome, subgroup_uri):
+        sub_group = get_all_data_with_pagination(ome, subgroup_uri.strip("/api/"))
+        return sub_group.get("report_list") or []
+
+    def _fetch_group_tree(self, ome, inventory_data, group_data):
+        """
+        Fetches the sub groups and the leaf devices of every visible group of the tree, one level at a time.
+        The requests of a level run concurrently on a bounded pool and share the session of ome.
+        """
+        sub_groups, group_devices = inventory_data["sub_groups"], inventory_data["group_devices"]
+        workers = max(self.get_option("workers") or 1, 1)
+        level = self._visible_groups(group_data)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while level:
+                level = [gdata for gdata in level if str(gdata["Id"]) not in group_devices]
+                device_futures = [executor.submit(self._get_all_devices, ome,
+                                                  gdata["AllLeafDevices@odata.navigationLink"]) for gdata in level]
+                group_futures = [executor.submit(self._get_sub_groups, ome,
+                                                 gdata["SubGroups@odata.navigationLink"]) for gdata in level]
+                next_level = []
+                for gdata, device_future, group_future in zip(level, device_futures, group_futures):
+                    sub_group = group_future.result()
+                    group_devices[str(gdata["Id"])] = self._add_devices(inventory_data, device_future.result())
+                    sub_groups[str(gdata["Id"])] = [self._group_summary(sgdata) for sgdata in sub_group]
+                    next_level.extend(self._visible_groups(sub_group))
+                level = next_level
+
+    def _get_device(self, device):
+        device_data = dict((key, device.get(key)) for key in DEVICE_IDENTITY_FIELDS)
+        device_data["DeviceManagement"] = [{"NetworkAddress": mgmt.get("NetworkAddress")}
+                                           for mgmt in device.get("DeviceManagement") or []]
+        device_data["fields"] = dict((key, device.get(key)) for key in self.get_option("device_fields") or [])
+        return device_data
+
+    def _get_member_ids(self, ome, device_uri):
+        members = get_all_data_with_pagination(ome, device_uri.strip("/api/"), select=["Id"])
+        return [device["Id"] for device in members.get("report_list") or []]
+
+    def _fetch_group_members(self, ome, inventory_data, all_group_data, group_data):
+        """
+        Builds the group tree from the ParentId of the groups, fetches all the devices with one query and
+        only the member device IDs of every visible group, and joins them in memory.
+        """
+        sub_groups, group_devices = inventory_data["sub_groups"], inventory_data["group_devices"]
+        child_groups = {}
+        for gdata in all_group_data:
+            child_groups.setdefault(gdata.get("ParentId"), []).append(gdata)
+        tree, level = [], self._visible_groups(group_data)
+        while level:
+            level = [gdata for gdata in level if str(gdata["Id"]) not in sub_groups]
+            for gdata in level:
+                sub_groups[str(gdata["Id"])] = [self._group_summary(sgdata)
+                                                for sgdata in child_groups.get(gdata["Id"], [])]
+            tree.extend(level)
+            level = [sgdata for gdata in level for sgdata in self._visible_groups(child_groups.get(gdata["Id"], []))]
+        workers = max(self.get_option("workers") or 1, 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            member_futures = [executor.submit(self._get_member_ids, ome, gdata["AllLeafDevices@odata.navigationLink"])
+                              for gdata in tree]
+            select = list(DEVICE_IDENTITY_FIELDS)
+            select.extend(field for field in list(self.get_option("device_fields") or []) + ["DeviceManagement"]
+                          if field not in select)
+            device_data = ome.get_all_report_details(DEVICE_API, workers=workers, select=select)
+            devices = dict((device["Id"], self._get_device(device)) for device in device_data.get("report_list") or [])
+            for gdata, future in zip(tree, member_futures):
+                members = [devices[device_id] for device_id in future.result() if device_id in devices]
+                group_devices[str(gdata["Id"])] = self._add_devices(
+                    inventory_data, [device for device in members if device["DeviceManagement"]])
+
+    def _group_summary(self, gdata):
+        return {"Id": gdata["Id"], "Name": gdata["Name"], "Visible": gdata.get("Visible")}
+
+    def _get_appliance_data(self, appliance):
+        """Returns the groups and the hosts of the groups of one appliance in a form that can be cached."""
+        inventory_data = {"sub_groups": {}, "group_devices": {}, "device_vars": {}}
+        with RestOME(self._get_module_params(appliance), req_session=True) as ome:
+            all_group_data = self._get_connection_resp(ome)
+            group_data = self._get_root_groups(all_group_data, appliance.get("ome_group_name"))
+            if self.get_option("bulk_device_query"):
+                self._fetch_group_members(ome, inventory_data, all_group_data.get("report_list", []), group_data)
+            else:
+                self._fetch_group_tree(ome, inventory_data, group_data)
+        inventory_data["groups"] = [self._group_summary(gdata) for gdata in group_data]
+        return inventory_data
+
+    def _get_inventory_data(self):
+        """Crawls all the appliances concurrently, the total time is the time of the slowest appliance."""
+        appliances = self._get_appliances()
+        if not self.get_option("appliances"):
+            return self._get_appliance_data(appliances[0])
+        with ThreadPoolExecutor(max_workers=len(appliances)) as executor:
+            appliance_data = list(executor.map(self._get_appliance_data, appliances))
+        for appliance, inventory_data in zip(appliances, appliance_data):
+            inventory_data["appliance"] = appliance["hostname"]
+            inventory_data["group_prefix"] = appliance.get("group_prefix") or ""
+        return {"appliances": appliance_data}
+
+    def _visible_groups(self, group_data):
+        return list(filter(lambda d: d.get("Visible") not in [False], group_data))
+
+    def _group_name(self, gdata):
+        return "{0}{1}".format(self._group_prefix, gdata["Name"])
+
     def _set_child_group(self, group_data):
-        port = self.get_option("port") if "port" in self.config else 443
-        validate_certs = self.get_option("validate_certs") if "validate_certs" in self.config else False
-        module_params = {"hostname": self.get_option("hostname"), "username": self.get_option("username"),
-                         "password": self.get_option("password"), "port": port, "validate_certs": validate_certs}
-        if "ca_path" in self.config:
-            module_params.update({"ca_path": self.get_option("ca_path")})
-        with RestOME(module_params, req_session=False) as ome:
-            for gdata in group_data:
-                group_name = gdata["Name"]
-                subgroup_uri = gdata["SubGroups@odata.navigationLink"].strip("/api/")
-                sub_group = get_all_data_with_pagination(ome, subgroup_uri)
-                gdata = sub_group.get("report_list", [])
-                if gdata:
-                    self._add_group_data(gdata)
-                    self._add_child_group_data(group_name, gdata)
+        for gdata in group_data:
+            sub_group = self._sub_groups.get(str(gdata["Id"]))
+            if sub_group:
+                self._add_child_group_data(self._group_name(gdata), self._add_group_data(sub_group))
 
     def _add_child_group_data(self, group_name, gdata):
         for child_name in gdata:
-            self.inventory.add_child(group_name, child_name["Name"])
+            self.inventory.add_child(group_name, self._group_name(child_name))
 
     def _add_group_data(self, group_data):
-        visible_gdata = list(filter(lambda d: d.get("Visible") in [False], group_data))
-        if visible_gdata:
-            for gp in visible_gdata:
-                group_data.remove(gp)
+        group_data = self._visible_groups(group_data)
         for gdata in group_data:
-            self._set_group_vars(gdata["Name"])
-            device_ip = self._get_all_devices(gdata["AllLeafDevices@odata.navigationLink"])
-            for hst in device_ip:
-                self.inventory.add_host(host=hst, group=gdata["Name"])
+            self._set_group_vars(self._group_name(gdata))
+            for hst in self._group_devices.get(str(gdata["Id"]), []):
+                self.inventory.add_host(host=hst, group=self._group_name(gdata))
                 self._set_host_vars(hst)
+                self._hosts[hst] = True
         self._set_child_group(group_data)
+        return group_data
 
-    def _populate(self, all_group_data):
+    def _get_root_groups(self, all_group_data, group_name=None):
         group_data = all_group_data.get("report_list", [])
-        group_name = str(self.get_option("ome_group_name")) if "ome_group_name" in self.config else None
         if group_name is not None:
+            group_name = str(group_name)
             group_data = list(filter(lambda d: d.get("Name").lower() in [group_name.lower()], group_data))
         elif group_name is None:
             group_data = list(filter(lambda d: d.get("Name") in ["All Devices"], group_data))
-        self._add_group_data(group_data)
+        return group_data
+
+    def _populate(self, inventory_data):
+        for appliance_data in inventory_data.get("appliances", [inventory_data]):
+            self._sub_groups = appliance_data.get("sub_groups", {})
+            self._group_devices = appliance_data.get("group_devices", {})
+            self._device_vars = appliance_data.get("device_vars", {})
+            self._group_prefix = appliance_data.get("group_prefix", "")
+            self._appliance = appliance_data.get("appliance")
+            self._add_group_data(appliance_data.get("groups", []))
+        self._set_constructed_vars()
+
+    def _set_constructed_vars(self):
+        strict = self.get_option("strict")
+        for host in self._hosts:
+            host_vars = self.inventory.get_host(host).get_vars()
+            self._set_composite_vars(self.get_option("compose"), host_vars, host, strict=strict)
+            host_vars = self.inventory.get_host(host).get_vars()
+            self._add_host_to_composed_groups(self.get_option("groups"), host_vars, host, strict=strict)
+            self._add_host_to_keyed_groups(self.get_option("keyed_groups"), host_vars, host, strict=strict)
 
     def parse(self, inventory, loader, path, cache=True):
         super(InventoryModule, self).parse(inventory, loader, path, cache)
         self.config = self._read_config_data(path)
-        all_group_data = self._get_connection_resp()
-        self._populate(all_group_data)
+        cache_key = self.get_cache_key(path)
+        user_cache_setting = self.get_option("cache")
+        attempt_to_read_cache = user_cache_setting and cache
+        cache_needs_update = user_cache_setting and not cache
+        inventory_data = None
+        if attempt_to_read_cache:
+            try:
+                inventory_data = self._cache[cache_key]
+            except KeyError:
+                cache_needs_update = True
+        if inventory_data is None:
+            inventory_data = self._get_inventory_data()
+        if cache_needs_update:
+            self._cache[cache_key] = inventory_data
+        self._populate(inventory_data)
@@ -30,6 +30,7 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 import os
 import socket
+from ansible_collections.dellemc.openmanage.plugins.module_utils.host_resolver import is_ipv6_host, normalize_ipv6
 try:
     from omsdk.sdkinfra import sdkinfra
     from omsdk.sdkcreds import UserCredentials
@@ -41,9 +42,9 @@ except ImportError:
 
 
 idrac_auth_params = {
-    "idrac_ip": {"required": True, "type": 'str'},
-    "idrac_user": {"required": True, "type": 'str'},
-    "idrac_password": {"required": True, "type": 'str', "aliases": ['idrac_pwd'], "no_log": True},
+    "idrac_ip": {"required": False, "type": 'str'},
+    "idrac_user": {"required": False, "type": 'str'},
+    "idrac_password": {"required": False, "type": 'str', "aliases": ['idrac_pwd'], "no_log": True},
     "idrac_port": {"required": False, "default": 443, "type": 'int'},
     "validate_certs": {"type": "bool", "default": True},
     "ca_path": {"type": "path"},
@@ -82,11 +83,8 @@ class iDRACConnection:
 
     def __enter__(self):
         try:
-            data = socket.getaddrinfo(self.idrac_ip, self.idrac_port)
-            if "AF_INET6" == data[0][0]._name_:
-                ip_byte = socket.inet_pton(socket.AF_INET6, self.idrac_ip)
-                ip_addr = socket.inet_ntop(socket.AF_INET6, ip_byte)
-                self.idrac_ip = "{0}".format(ip_addr)
+            if is_ipv6_host(self.idrac_ip, self.idrac_port):
+                self.idrac_ip = normalize_ipv6(self.idrac_ip)
         except socket.gaierror:
             pass
         self.sdk.importPath()
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+DEVICE_CACHE_ENV = "OMAM_DEVICE_CACHE"
+DEVICE_CACHE_DIR_ENV = "OMAM_DEVICE_CACHE_DIR"
+DEVICE_CACHE_TTL_ENV = "OMAM_DEVICE_CACHE_TTL"
+DEFAULT_DEVICE_CACHE_DIR = "~/.ansible/omam_device_cache"
+DEFAULT_DEVICE_CACHE_TTL = 300
+DEVICE_URI = "DeviceService/Devices"
+INDEX_FIELDS = ["Id", "DeviceServiceTag", "DeviceName", "Identifier", "Type", "Model", "DeviceManagement"]
+
+
+def device_cache_enabled():
+    """Returns True when the OMAM_DEVICE_CACHE environment variable requests the on-disk device index."""
+    return os.environ.get(DEVICE_CACHE_ENV, "").lower() in ("1", "true", "yes", "on")
+
+
+def _device_cache_ttl():
+    try:
+        return max(int(os.environ.get(DEVICE_CACHE_TTL_ENV) or DEFAULT_DEVICE_CACHE_TTL), 0)
+    except ValueError:
+        return DEFAULT_DEVICE_CACHE_TTL
+
+
+def _network_addresses(device):
+    for mgmt in device.get("DeviceManagement") or []:
+        address = mgmt.get("NetworkAddress")
+        if address:
+            yield address.strip("[]")
+
+
+class DeviceIndex(object):
+    """
+    In memory index of the OpenManage Enterprise devices which looks up a device by its ID,
+    service tag or management IP address in constant time.
+    """
+
+    def __init__(self, devices, created=None, from_cache=False):
+        self.devices = devices
+        self.created = created or int(time.time())
+        self.from_cache = from_cache
+        self.by_id = {}
+        self.by_service_tag = {}
+        self.by_ip = {}
+        for device in devices:
+            if device.get("Id") is not None:
+                self.by_id[str(device["Id"])] = device
+            if device.get("DeviceServiceTag"):
+                self.by_service_tag.setdefault(str(device["DeviceServiceTag"]), device)
+            for address in _network_addresses(device):
+                self.by_ip.setdefault(address, device)
+
+    def __len__(self):
+        return len(self.devices)
+
+    def get(self, identifier, keys=("Id", "DeviceServiceTag")):
+        """Returns the device of a device ID or service tag, or None."""
+        maps = {"Id": self.by_id, "DeviceServiceTag": self.by_service_tag, "NetworkAddress": self.by_ip}
+        for key in keys:
+            device = maps[key].get(str(identifier))
+            if device is not None:
+                return device
+        return None
+
+    def lookup(self, identifiers, keys=("Id", "DeviceServiceTag")):
+        """
+        :return: tuple, dict of the identifier as str to the device details and the list of
+            identifiers which are not found
+        """
+        found, missing = {}, []
+        for identifier in identifiers:
+            device = self.get(identifier, keys)
+            if device is None:
+                missing.append(identifier)
+            else:
+                found[str(identifier)] = device
+        return found, missing
+
+
+class DeviceIndexCache(object):
+    """
+    File based store of the device index of one appliance, only readable by the owner.
+    Building the index is serialized with a lock file, so concurrent Ansible forks crawl
+    the device collection once.
+    """
+
+    def __init__(self, host, port, username, cache_dir=None, ttl=None):
+        self.cache_dir = os.path.expanduser(cache_dir or os.environ.get(DEVICE_CACHE_DIR_ENV) or
+                                            DEFAULT_DEVICE_CACHE_DIR)
+        self.ttl = _device_cache_ttl() if ttl is None else ttl
+        digest = hashlib.sha256("{0}|{1}|{2}".format(host, port, username).encode("utf-8"))
+        self.path = os.path.join(self.cache_dir, "{0}.json".format(digest.hexdigest()))
+        self.lock_path = os.path.join(self.cache_dir, "{0}.lock".format(digest.hexdigest()))
+
+    def _ensure_dir(self):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, 0o700)
+
+    @contextmanager
+    def lock(self):
+        self._ensure_dir()
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if HAS_FCNTL:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            if HAS_FCNTL:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def load(self):
+        """Returns the cached :class:`DeviceIndex` or None when there is none or it is older than the TTL."""
+        try:
+            with open(self.path) as cache_file:
+                cached = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+        created = cached.get("created", 0)
+        if not isinstance(cached.get("devices"), list) or time.time() - created > self.ttl:
+            return None
+        return DeviceIndex(cached["devices"], created=created, from_cache=True)
+
+    def save(self, index):
+        self._ensure_dir()
+        tmp_path = "{0}.{1}.tmp".format(self.path, os.getpid())
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as cache_file:
+            json.dump({"created": index.created, "devices": index.devices}, cache_file)
+        os.rename(tmp_path, self.path)
+
+    def invalidate(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def _get_cache(rest_obj):
+    if not device_cache_enabled():
+        return None
+    return DeviceIndexCache(rest_obj.hostname, rest_obj.port, rest_obj.username)
+
+
+def _crawl_devices(rest_obj):
+    report = rest_obj.get_all_report_details(DEVICE_URI, select=INDEX_FIELDS)
+    return report.get("report_list") or []
+
+
+def get_device_index(rest_obj, refresh=False):
+    """
+    Returns the :class:`DeviceIndex` of the appliance of rest_obj. The index is built once per
+    RestOME object and, when OMAM_DEVICE_CACHE is enabled, shared with the following tasks through
+    the on-disk cache until it is older than OMAM_DEVICE_CACHE_TTL seconds.
+    :param rest_obj: RestOME object
+    :param refresh: crawl the device collection again even if an index is cached
+    """
+    index = getattr(rest_obj, "_device_index", None)
+    if isinstance(index, DeviceIndex) and not refresh:
+        return index
+    cache = _get_cache(rest_obj)
+    if cache is None:
+        index = DeviceIndex(_crawl_devices(rest_obj))
+    else:
+        with cache.lock():
+            index = None if refresh else cache.load()
+            if index is None:
+                index = DeviceIndex(_crawl_devices(rest_obj))
+                cache.save(index)
+    rest_obj._device_index = index
+    return index
+
+
+def find_indexed_devices(rest_obj, identifiers, keys=("Id", "DeviceServiceTag"), select=None):
+    """
+    Resolves device IDs, service tags or management IP addresses (key NetworkAddress) with the device index.
+    When a cached index misses an identifier, the index is built again once, so devices which
+    were added after the index was cached are found. Without the on-disk cache and before the index
+    is built, RestOME.find_devices resolves the identifiers and stops reading the device pages
+    as soon as all of them are found.
+    :param select: (optional) device attributes needed by the caller when the index is not used
+    :return: dict, identifier as str to the device details, missing identifiers are not included
+    """
+    indexed = device_cache_enabled() or isinstance(getattr(rest_obj, "_device_index", None), DeviceIndex)
+    if not indexed and "NetworkAddress" not in keys:
+        return rest_obj.find_devices(identifiers, keys=keys, select=select)
+    index = get_device_index(rest_obj)
+    found, missing = index.lookup(identifiers, keys)
+    if missing and index.from_cache:
+        more, missing = get_device_index(rest_obj, refresh=True).lookup(missing, keys)
+        found.update(more)
+    return found
+
+
+def invalidate_device_index(rest_obj):
+    """Drops the device index of rest_obj and its on-disk copy, called after devices are added or removed."""
+    rest_obj._device_index = None
+    cache = _get_cache(rest_obj)
+    if cache is not None:
+        cache.invalidate()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import os
+import socket
+import threading
+import time
+
+DNS_CACHE_TTL_ENV = "OMAM_DNS_CACHE_TTL"
+DNS_SKIP_LITERAL_ENV = "OMAM_DNS_SKIP_LITERAL"
+DEFAULT_DNS_CACHE_TTL = 300
+
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_ttl():
+    try:
+        return max(int(os.environ.get(DNS_CACHE_TTL_ENV) or DEFAULT_DNS_CACHE_TTL), 0)
+    except ValueError:
+        return DEFAULT_DNS_CACHE_TTL
+
+
+def _skip_literal():
+    return os.environ.get(DNS_SKIP_LITERAL_ENV, "true").lower() not in ("0", "false", "no", "off")
+
+
+def is_ip_literal(host):
+    """Returns True when host is an IPv4 or IPv6 address instead of a name."""
+    for family in (socket.AF_INET, socket.AF_INET6):
+        try:
+            socket.inet_pton(family, str(host))
+            return True
+        except (socket.error, ValueError):
+            pass
+    return False
+
+
+def clear_resolver_cache():
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def resolve(host, port):
+    """
+    Returns the :func:`socket.getaddrinfo` result of host and port.
+    Results of names are kept for OMAM_DNS_CACHE_TTL seconds, so that all the clients of the process
+    resolve a host once. A literal IP address is converted without the resolver unless
+    OMAM_DNS_SKIP_LITERAL is false. Resolution errors are raised and not cached.
+    """
+    if _skip_literal() and is_ip_literal(host):
+        return socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM, 0, socket.AI_NUMERICHOST)
+    ttl = _cache_ttl()
+    key = (host, port)
+    now = time.time()
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+    if cached is not None and now < cached[0]:
+        return cached[1]
+    data = socket.getaddrinfo(host, port)
+    if ttl:
+        with _CACHE_LOCK:
+            _CACHE[key] = (now + ttl, data)
+    return data
+
+
+def is_ipv6(data):
+    """Returns True when the preferred address of a :func:`resolve` result is an IPv6 address."""
+    return bool(data) and getattr(data[0][0], "_name_", None) == "AF_INET6"
+
+
+def is_ipv6_host(host, port):
+    return is_ipv6(resolve(host, port))
+
+
+def normalize_ipv6(address):
+    """Returns the canonical text form of an IPv6 address."""
+    return socket.inet_ntop(socket.AF_INET6, socket.inet_pton(socket.AF_INET6, address))
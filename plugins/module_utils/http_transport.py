@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import base64
+import io
+import os
+import socket
+import ssl
+import threading
+import time
+from ansible.module_utils.urls import open_url
+from ansible.module_utils.common.text.converters import to_bytes, to_native, to_text
+from ansible.module_utils.connection import Connection, ConnectionError as PersistentConnectionError
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlparse, urljoin
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import note_phase
+
+KEEPALIVE_ENV = "OMAM_HTTP_KEEPALIVE"
+MAX_IDLE_CONNECTIONS = 8
+MAX_REDIRECTS = 10
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+# credentials which must not be sent to another host after a redirect
+CREDENTIAL_HEADERS = ("Authorization", "X-Auth-Token")
+USER_AGENT = "ansible-httpget"
+AUTH_PARAMS_MISSING_MSG = "missing required arguments: {0}. These arguments can be left out only when the " \
+                          "module runs over an HttpApi connection."
+CONNECTION_HOST_MISMATCH_MSG = "The host {0} of the task does not match the host {1} of the HttpApi connection."
+STALE_CONNECTION_ERRORS = (http_client.BadStatusLine, http_client.CannotSendRequest,
+                           http_client.ResponseNotReady, ConnectionResetError,
+                           ConnectionAbortedError, BrokenPipeError)
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+# host option of the persistent connection listening on a socket path
+_CONNECTION_HOSTS = {}
+
+
+def keepalive_enabled():
+    """Returns True when the persistent connection transport is requested through OMAM_HTTP_KEEPALIVE."""
+    return os.environ.get(KEEPALIVE_ENV, "").lower() in ("1", "true", "yes", "on")
+
+
+class PooledResponse(object):
+    """File like response object which mimics the response returned by open_url"""
+
+    def __init__(self, url, status, reason, headers, body):
+        self.url = url
+        self.status = status
+        self.code = status
+        self.reason = reason
+        self.headers = headers
+        self.msg = headers
+        self._fp = io.BytesIO(body)
+
+    def read(self, amt=None):
+        return self._fp.read() if amt is None else self._fp.read(amt)
+
+    def getcode(self):
+        return self.status
+
+    def geturl(self):
+        return self.url
+
+    def info(self):
+        return self.headers
+
+    def getheaders(self):
+        return list(self.headers.items())
+
+    def close(self):
+        self._fp.close()
+
+
+class HTTPConnectionPool(object):
+    """Keeps idle HTTP/1.1 keep-alive connections for a single scheme, host, port and TLS setting."""
+
+    def __init__(self, scheme, host, port, validate_certs=True, ca_path=None, max_idle=MAX_IDLE_CONNECTIONS):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.validate_certs = validate_certs
+        self.ca_path = ca_path
+        self.max_idle = max_idle
+        self._idle = []
+        self._lock = threading.Lock()
+        self._ssl_context = None
+
+    def _get_ssl_context(self):
+        if self._ssl_context is None:
+            if self.validate_certs:
+                context = ssl.create_default_context()
+                if self.ca_path:
+                    if os.path.isdir(self.ca_path):
+                        context.load_verify_locations(capath=self.ca_path)
+                    else:
+                        context.load_verify_locations(cafile=self.ca_path)
+            else:
+                context = ssl.create_default_context()
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            self._ssl_context = context
+        return self._ssl_context
+
+    def _new_connection(self, timeout):
+        if self.scheme == "https":
+            return http_client.HTTPSConnection(self.host, self.port, timeout=timeout,
+                                               context=self._get_ssl_context())
+        return http_client.HTTPConnection(self.host, self.port, timeout=timeout)
+
+    def _get_connection(self, timeout):
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            return self._new_connection(timeout), False
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        conn.timeout = timeout
+        return conn, True
+
+    def _release(self, conn):
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def _send(self, conn, method, path, body, headers):
+        """Sends the request and returns the response, timing the TCP and TLS handshake and the server wait."""
+        if conn.sock is None:
+            start = time.time()
+            conn.connect()
+            note_phase("connect", time.time() - start)
+        conn.request(method, path, body=body, headers=headers or {})
+        start = time.time()
+        resp = conn.getresponse()
+        note_phase("server", time.time() - start)
+        return resp
+
+    def urlopen(self, method, path, body=None, headers=None, timeout=30):
+        """
+        Sends a single request on a pooled connection and reads the full body so that
+        the connection can be handed back to the pool.
+        :returns: tuple of status, reason, headers and body
+        """
+        conn, reused = self._get_connection(timeout)
+        try:
+            try:
+                resp = self._send(conn, method, path, body, headers)
+            except STALE_CONNECTION_ERRORS:
+                conn.close()
+                # the server may have processed a request which failed on a reused connection,
+                # so only idempotent requests are sent again
+                if not reused or method.upper() not in IDEMPOTENT_METHODS:
+                    raise
+                # the server closed an idle connection, retry once with a fresh one
+                conn = self._new_connection(timeout)
+                resp = self._send(conn, method, path, body, headers)
+            data = resp.read()
+        except Exception:
+            conn.close()
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(conn)
+        return resp.status, resp.reason, resp.msg, data
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+def get_connection_pool(scheme, host, port, validate_certs=True, ca_path=None):
+    """Returns the process wide pool for the given connection settings, creating it on first use."""
+    key = (scheme, host, port, bool(validate_certs), ca_path)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = HTTPConnectionPool(scheme, host, port, validate_certs=validate_certs, ca_path=ca_path)
+            _POOLS[key] = pool
+    return pool
+
+
+def close_all_pools():
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+def _uses_proxy(url_parts, use_proxy):
+    if not use_proxy:
+        return False
+    return bool(getproxies().get(url_parts.scheme)) and not proxy_bypass(url_parts.hostname)
+
+
+def _origin(url_parts):
+    return url_parts.scheme, url_parts.hostname, url_parts.port or (443 if url_parts.scheme == "https" else 80)
+
+
+def _auth_header(url_username, url_password):
+    credentials = "{0}:{1}".format(url_username, url_password or "")
+    return "Basic {0}".format(to_native(base64.b64encode(to_bytes(credentials, errors='surrogate_or_strict'))))
+
+
+def keepalive_open_url(url, data=None, headers=None, method=None, use_proxy=True, timeout=30,
+                       validate_certs=True, url_username=None, url_password=None, force_basic_auth=False,
+                       follow_redirects='urllib2', ca_path=None, **kwargs):
+    """
+    Drop-in replacement for :func:`ansible.module_utils.urls.open_url` which sends the request
+    over a persistent connection. Requests which need a proxy or an unsupported keyword argument
+    are handed over to open_url.
+    """
+    url_parts = urlparse(url)
+    if kwargs or url_parts.scheme not in ("http", "https") or _uses_proxy(url_parts, use_proxy):
+        return open_url(url, data=data, headers=headers, method=method, use_proxy=use_proxy, timeout=timeout,
+                        validate_certs=validate_certs, url_username=url_username, url_password=url_password,
+                        force_basic_auth=force_basic_auth, follow_redirects=follow_redirects,
+                        ca_path=ca_path, **kwargs)
+    method = (method or ("POST" if data is not None else "GET")).upper()
+    req_headers = {"User-Agent": USER_AGENT, "Connection": "keep-alive"}
+    req_headers.update(headers or {})
+    if force_basic_auth and url_username:
+        req_headers["Authorization"] = _auth_header(url_username, url_password)
+    body = to_bytes(data, nonstring='passthru') if data is not None else None
+    origin = _origin(url_parts)
+    for redirect in range(MAX_REDIRECTS + 1):
+        scheme, host, port = _origin(url_parts)
+        pool = get_connection_pool(scheme, host, port, validate_certs=validate_certs, ca_path=ca_path)
+        path = url_parts.path or "/"
+        if url_parts.query:
+            path = "{0}?{1}".format(path, url_parts.query)
+        try:
+            status, reason, resp_headers, resp_body = pool.urlopen(method, path, body=body,
+                                                                   headers=req_headers, timeout=timeout)
+        except (socket.error, ssl.SSLError, http_client.HTTPException) as err:
+            raise URLError(err)
+        location = resp_headers.get("Location")
+        if status in REDIRECT_CODES and location and follow_redirects in ("all", "yes", True, "safe", "urllib2"):
+            if follow_redirects == "safe" and method not in ("GET", "HEAD"):
+                break
+            url = urljoin(url, location)
+            url_parts = urlparse(url)
+            if _origin(url_parts) != origin:
+                for key in [key for key in req_headers if key.title() in CREDENTIAL_HEADERS]:
+                    req_headers.pop(key)
+            if status == 303 or (status in (301, 302) and method not in ("GET", "HEAD")):
+                method, body = "GET", None
+            continue
+        break
+    if status >= 400 or status in REDIRECT_CODES:
+        raise HTTPError(url, status, reason, resp_headers, io.BytesIO(resp_body))
+    return PooledResponse(url, status, reason, resp_headers, resp_body)
+
+
+def connection_open_url(socket_path, url, data=None, headers=None, method=None, **kwargs):
+    """
+    open_url like entry point which sends the request through the persistent httpapi connection
+    listening on socket_path. The connection plugin owns the session, so credentials and TLS
+    keyword arguments are ignored. Only the path is sent through the connection, so a url for another
+    host than the one of the connection raises ValueError instead of being sent to the connection host.
+    """
+    connection = Connection(socket_path)
+    url_parts = urlparse(url)
+    _check_connection_host(connection, socket_path, url_parts.hostname)
+    path = url_parts.path or "/"
+    if url_parts.query:
+        path = "{0}?{1}".format(path, url_parts.query)
+    if data is not None:
+        data = to_text(base64.b64encode(to_bytes(data, nonstring='passthru')))
+    method = (method or ("POST" if data is not None else "GET")).upper()
+    try:
+        resp = connection.send_request(data, path, method=method, headers=dict(headers or {}))
+    except PersistentConnectionError as err:
+        raise URLError(to_native(err))
+    resp_headers = http_client.HTTPMessage()
+    for key, val in resp.get("headers", {}).items():
+        resp_headers[key] = val
+    resp_body = base64.b64decode(to_bytes(resp.get("body", "")))
+    status = resp["status"]
+    if status >= 400:
+        raise HTTPError(url, status, resp.get("reason"), resp_headers, io.BytesIO(resp_body))
+    return PooledResponse(url, status, resp.get("reason"), resp_headers, resp_body)
+
+
+def _check_connection_host(connection, socket_path, host):
+    if socket_path not in _CONNECTION_HOSTS:
+        try:
+            _CONNECTION_HOSTS[socket_path] = connection.get_option("host")
+        except PersistentConnectionError as err:
+            raise URLError(to_native(err))
+    connection_host = _CONNECTION_HOSTS[socket_path]
+    if host and connection_host and host.lower() != str(connection_host).strip("[]").lower():
+        raise ValueError(CONNECTION_HOST_MISMATCH_MSG.format(host, connection_host))
+
+
+def update_from_connection(socket_path, module_params, options):
+    """
+    Sets the module parameters which are left out of the task from the options of the persistent httpapi
+    connection listening on socket_path. options maps a module parameter to a connection option.
+    """
+    missing = [(param, option) for param, option in options.items() if module_params.get(param) is None]
+    if missing:
+        connection = Connection(socket_path)
+        for param, option in missing:
+            module_params[param] = connection.get_option(option)
+
+
+def check_auth_params(module_params, params):
+    """
+    Raises ValueError for the authentication parameters left out of the task of a module which does not run
+    over a persistent httpapi connection.
+    """
+    missing = [param for param in params if module_params.get(param) is None]
+    if missing:
+        raise ValueError(AUTH_PARAMS_MISSING_MSG.format(", ".join(missing)))
@@ -31,17 +31,26 @@ __metaclass__ = type
 
 import json
 import re
-import time
 import os
 import socket
-from ansible.module_utils.urls import open_url, ConnectionError, SSLValidationError
+from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.six.moves.urllib.parse import urlencode
+from ansible_collections.dellemc.openmanage.plugins.module_utils.http_transport import keepalive_enabled, \
+    update_from_connection, check_auth_params
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_transport import RestTransportMixin
+from ansible_collections.dellemc.openmanage.plugins.module_utils.session_cache import get_session_cache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.retry_policy import get_retry_policy
+from ansible_collections.dellemc.openmanage.plugins.module_utils.host_resolver import is_ipv6_host, \
+    normalize_ipv6
+from ansible_collections.dellemc.openmanage.plugins.module_utils.response_cache import get_response_cache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.json_codec import JsonResponseMixin
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_poller import JobPoller
 
 idrac_auth_params = {
-    "idrac_ip": {"required": True, "type": 'str'},
-    "idrac_user": {"required": True, "type": 'str'},
-    "idrac_password": {"required": True, "type": 'str', "aliases": ['idrac_pwd'], "no_log": True},
+    "idrac_ip": {"required": False, "type": 'str'},
+    "idrac_user": {"required": False, "type": 'str'},
+    "idrac_password": {"required": False, "type": 'str', "aliases": ['idrac_pwd'], "no_log": True},
     "idrac_port": {"required": False, "default": 443, "type": 'int'},
     "validate_certs": {"type": "bool", "default": True},
     "ca_path": {"type": "path"},
@@ -59,7 +68,7 @@ IMPORT_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.
 IMPORT_PREVIEW = "/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfigurationPreview"
 
 
-class OpenURLResponse(object):
+class OpenURLResponse(JsonResponseMixin):
     """Handles HTTPResponse"""
 
     def __init__(self, resp):
@@ -68,13 +77,6 @@ class OpenURLResponse(object):
         if self.resp:
             self.body = self.resp.read()
 
-    @property
-    def json_data(self):
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
-
     @property
     def status_code(self):
         return self.resp.getcode()
@@ -93,10 +95,17 @@ class OpenURLResponse(object):
         return self.resp.reason
 
 
-class iDRACRedfishAPI(object):
+class iDRACRedfishAPI(RestTransportMixin):
     """REST api for iDRAC modules."""
 
-    def __init__(self, module_params, req_session=False):
+    response_class = OpenURLResponse
+    session_resources = SESSION_RESOURCE_COLLECTION
+
+    def __init__(self, module_params, req_session=False, socket_path=None):
+        if socket_path:
+            update_from_connection(socket_path, module_params, {"idrac_ip": "host", "idrac_user": "remote_user"})
+        else:
+            check_auth_params(module_params, ("idrac_ip", "idrac_user", "idrac_password"))
         self.ipaddress = module_params['idrac_ip']
         self.username = module_params['idrac_user']
         self.password = module_params['idrac_password']
@@ -106,16 +115,22 @@ class iDRACRedfishAPI(object):
         self.timeout = module_params.get("timeout", 30)
         self.use_proxy = module_params.get("use_proxy", True)
         self.req_session = req_session
+        self.socket_path = socket_path
         self.session_id = None
         self.protocol = 'https'
         self._headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
-
+        self.keepalive = keepalive_enabled()
+        self.retry_policy = get_retry_policy()
+        self.session_cache = get_session_cache(self.ipaddress, self.port, self.username, self.password)
+        self.response_cache = get_response_cache(self.ipaddress, self.port, self.username)
+        if not self.socket_path:
+            # with the httpapi connection plugin the persistent connection resolves the host
+            self._resolve_hostname()
+
+    def _resolve_hostname(self):
         try:
-            data = socket.getaddrinfo(self.ipaddress, self.port)
-            if "AF_INET6" == data[0][0]._name_:
-                ip_byte = socket.inet_pton(socket.AF_INET6, self.ipaddress)
-                ip_addr = socket.inet_ntop(socket.AF_INET6, ip_byte)
-                self.ipaddress = "[{0}]".format(ip_addr)
+            if is_ipv6_host(self.ipaddress, self.port):
+                self.ipaddress = "[{0}]".format(normalize_ipv6(self.ipaddress))
         except socket.gaierror:
             msg = "Unable to communicate with iDRAC {0}. This may be due to one of the following: " \
                   "Incorrect username or password, unreachable iDRAC IP or a failure in TLS/SSL " \
@@ -137,7 +152,7 @@ class iDRACRedfishAPI(object):
 
     def _url_common_args_spec(self, method, api_timeout, headers=None):
         """Creates an argument common spec"""
-        req_header = self._headers
+        req_header = dict(self._headers)
         if headers:
             req_header.update(headers)
         if api_timeout is None:
@@ -157,9 +172,6 @@ class iDRACRedfishAPI(object):
 
     def _args_without_session(self, path, method, api_timeout, headers=None):
         """Creates an argument spec in case of basic authentication"""
-        req_header = self._headers
-        if headers:
-            req_header.update(headers)
         url_kwargs = self._url_common_args_spec(method, api_timeout, headers=headers)
         if not (path == SESSION_RESOURCE_COLLECTION["SESSION"] and method == 'POST'):
             url_kwargs["url_username"] = self.username
@@ -182,33 +194,25 @@ class iDRACRedfishAPI(object):
             if data and dump:
                 data = json.dumps(data)
             url = self._build_url(uri, query_param=query_param)
-            resp = open_url(url, data=data, **url_kwargs)
-            resp_data = OpenURLResponse(resp)
+            resp_data = self._send_request(method, url, data, url_kwargs)
         except (HTTPError, URLError, SSLValidationError, ConnectionError) as err:
             raise err
         return resp_data
 
-    def __enter__(self):
-        """Creates sessions by passing it to header"""
-        if self.req_session:
-            payload = {'UserName': self.username,
-                       'Password': self.password}
-            path = SESSION_RESOURCE_COLLECTION["SESSION"]
-            resp = self.invoke_request(path, 'POST', data=payload)
-            if resp and resp.success:
-                self.session_id = resp.json_data.get("Id")
-                self._headers["X-Auth-Token"] = resp.headers.get('X-Auth-Token')
-            else:
-                msg = "Could not create the session"
-                raise ConnectionError(msg)
-        return self
+    def invoke_cached_request(self, uri, query_param=None):
+        """
+        Sends a GET request for a resource which rarely changes, such as a registry, through the
+        response cache. Without the cache the request is sent as is.
+        """
+        if self.response_cache is None:
+            return self.invoke_request(uri, "GET", query_param=query_param)
+        return self.response_cache.get(
+            self._build_url(uri, query_param=query_param),
+            lambda headers: self.invoke_request(uri, "GET", query_param=query_param, headers=headers),
+            OpenURLResponse)
 
-    def __exit__(self, exc_type, exc_value, traceback):
-        """Deletes a session id, which is in use for request"""
-        if self.session_id:
-            path = SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=self.session_id)
-            self.invoke_request(path, 'DELETE')
-        return False
+    def _session_request(self, method, path, data=None):
+        return self.invoke_request(path, method, data=data)
 
     @property
     def get_server_generation(self):
@@ -231,11 +235,12 @@ class iDRACRedfishAPI(object):
         :return: object
         """
         response = None
+        poller = JobPoller(profile="task")
         while job_wait:
             try:
                 response = self.invoke_request(task_uri, "GET")
                 if response.json_data.get("TaskState") == "Running":
-                    time.sleep(10)
+                    poller.sleep(response.json_data)
                 else:
                     break
             except ValueError:
@@ -250,16 +255,17 @@ class iDRACRedfishAPI(object):
         :param job_wait: True or False decide whether to wait till the job completion.
         :return: object
         """
-        time.sleep(5)
+        poller = JobPoller(profile="firmware" if apply_update else "idrac_job")
+        poller.start()
         response = self.invoke_request(job_uri, "GET")
         while job_wait:
-            response = self.invoke_request(job_uri, "GET")
             if response.json_data.get("PercentComplete") == 100 and \
                     response.json_data.get("JobState") == "Completed":
                 break
             if response.json_data.get("JobState") == "Starting" and not reboot and apply_update:
                 break
-            time.sleep(30)
+            poller.sleep(response.json_data)
+            response = self.invoke_request(job_uri, "GET")
         return response
 
     def export_scp(self, export_format=None, export_use=None, target=None,
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import random
+import time
+
+# initial_wait: delay before the first probe, min_interval and max_interval: bounds of the backoff,
+# backoff: growth factor of the interval after every probe, jitter: relative random spread of an interval
+JOB_POLL_PROFILES = {
+    "default": {"initial_wait": 1, "min_interval": 2, "max_interval": 30, "backoff": 1.5, "jitter": 0.1},
+    "ome_job": {"initial_wait": 1, "min_interval": 2, "max_interval": 60, "backoff": 1.5, "jitter": 0.1},
+    "discovery": {"initial_wait": 5, "min_interval": 5, "max_interval": 30, "backoff": 1.5, "jitter": 0.1},
+    "idrac_job": {"initial_wait": 1, "min_interval": 2, "max_interval": 30, "backoff": 1.5, "jitter": 0.1},
+    "firmware": {"initial_wait": 5, "min_interval": 10, "max_interval": 60, "backoff": 1.5, "jitter": 0.1},
+    "task": {"initial_wait": 1, "min_interval": 1, "max_interval": 10, "backoff": 1.5, "jitter": 0.1},
+}
+PROGRESS_KEY = "PercentComplete"
+
+
+class JobPoller(object):
+    """
+    Computes and sleeps the interval between two probes of a job.
+
+    The interval starts at the min_interval of the profile and grows by the backoff factor up to the
+    max_interval, so that short jobs are noticed quickly and long jobs are not polled too often.
+    When the job reports its progress, the estimated time to completion caps the interval.
+    The time budget is counted from the slept intervals, so the poller never waits longer than max_wait.
+    """
+
+    def __init__(self, max_wait=None, profile="default", **overrides):
+        """
+        :param max_wait: time budget in seconds, None to poll until the caller stops.
+        :param profile: key of JOB_POLL_PROFILES.
+        :param overrides: initial_wait, min_interval, max_interval, backoff or jitter values which
+            replace the profile values, None values are ignored.
+        """
+        settings = dict(JOB_POLL_PROFILES.get(profile, JOB_POLL_PROFILES["default"]))
+        settings.update((key, val) for key, val in overrides.items() if val is not None)
+        self.max_wait = max_wait
+        self.initial_wait = settings["initial_wait"]
+        self.max_interval = settings["max_interval"]
+        self.min_interval = min(settings["min_interval"], self.max_interval)
+        self.backoff = settings["backoff"]
+        self.jitter = settings["jitter"]
+        self.waited = 0
+        self.attempts = 0
+        self._first_progress = None
+
+    @property
+    def remaining(self):
+        if self.max_wait is None:
+            return None
+        return max(self.max_wait - self.waited, 0)
+
+    @property
+    def expired(self):
+        return self.max_wait is not None and self.waited >= self.max_wait
+
+    def _estimated_completion(self, job_dict):
+        """Returns the seconds until the job completes, estimated from the progress seen so far, or None."""
+        if not isinstance(job_dict, dict):
+            return None
+        try:
+            progress = float(job_dict.get(PROGRESS_KEY))
+        except (TypeError, ValueError):
+            return None
+        if progress >= 100:
+            return 0
+        if self._first_progress is None or progress < self._first_progress[1]:
+            self._first_progress = (self.waited, progress)
+            return None
+        elapsed = self.waited - self._first_progress[0]
+        advanced = progress - self._first_progress[1]
+        if elapsed <= 0 or advanced <= 0:
+            return None
+        return (100 - progress) * elapsed / advanced
+
+    def next_interval(self, job_dict=None):
+        """Returns the interval to sleep before the next probe, job_dict is the last job response."""
+        interval = min(self.min_interval * (self.backoff ** self.attempts), self.max_interval)
+        eta = self._estimated_completion(job_dict)
+        if eta is not None:
+            interval = min(interval, max(eta, self.min_interval))
+        if self.jitter:
+            interval = interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+        interval = min(interval, self.max_interval)
+        if self.max_wait is not None:
+            interval = min(interval, self.remaining)
+        return max(interval, 0)
+
+    def start(self):
+        """Sleeps the initial wait of the profile before the first probe and returns the slept time."""
+        interval = self.initial_wait
+        if self.max_wait is not None:
+            interval = min(interval, self.remaining)
+        return self._sleep(interval)
+
+    def sleep(self, job_dict=None):
+        """Sleeps until the next probe and returns the slept time."""
+        interval = self.next_interval(job_dict)
+        self.attempts += 1
+        return self._sleep(interval)
+
+    def _sleep(self, interval):
+        if interval > 0:
+            time.sleep(interval)
+        self.waited += interval
+        return interval
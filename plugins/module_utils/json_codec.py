@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import os
+from ansible.module_utils.common.text.converters import to_bytes
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ujson
+    HAS_UJSON = True
+except ImportError:
+    HAS_UJSON = False
+
+JSON_DECODER_ENV = "OMAM_JSON_DECODER"
+_NOT_DECODED = object()
+
+
+def _get_decoder():
+    """
+    Returns the fastest available decoder, the OMAM_JSON_DECODER environment variable
+    can pin it to one of orjson, ujson or json. orjson decodes integers wider than 64 bits
+    as floats, which the OpenManage Enterprise and Redfish payloads do not contain.
+    """
+    name = os.environ.get(JSON_DECODER_ENV, "").lower()
+    if HAS_ORJSON and name in ("", "orjson"):
+        return orjson.loads
+    if HAS_UJSON and name in ("", "ujson"):
+        return ujson.loads
+    return json.loads
+
+
+def json_loads(data):
+    """
+    Decodes a JSON document with orjson or ujson when importable and json otherwise.
+    Documents which the fast decoders reject are decoded again with json.
+    :raises ValueError: when the document is not valid JSON.
+    """
+    decoder = _get_decoder()
+    if decoder is not json.loads:
+        try:
+            return decoder(data)
+        except (ValueError, TypeError, OverflowError):
+            pass
+    return json.loads(data)
+
+
+class JsonResponseMixin(object):
+    """
+    Decodes the body of an OpenURLResponse once and serves json_data from memory afterwards.
+    The raw body is released after the decoding and serialized again only if it is read later.
+    """
+
+    _body = None
+    _json_data = _NOT_DECODED
+
+    @property
+    def body(self):
+        if self._body is None and self._json_data is not _NOT_DECODED:
+            self._body = to_bytes(json.dumps(self._json_data))
+        return self._body
+
+    @body.setter
+    def body(self, value):
+        self._body = value
+        self._json_data = _NOT_DECODED
+
+    @property
+    def json_data(self):
+        if self._json_data is _NOT_DECODED:
+            try:
+                self._json_data = json_loads(self._body)
+            except ValueError:
+                raise ValueError("Unable to parse json")
+            self._body = None
+        return self._json_data
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import os
+import time
+from contextlib import contextmanager
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import perf_enabled, perf_summary
+
+PROFILE_ENV = "OMAM_PROFILE"
+PROFILE_DIR_ENV = "OMAM_PROFILE_DIR"
+PROFILE_TOP_ENV = "OMAM_PROFILE_TOP"
+DEFAULT_PROFILE_DIR = "~/.ansible/omam_profile"
+DEFAULT_PROFILE_TOP = 10
+PROFILE_MODES = ("cpu", "memory")
+
+
+def get_profile_modes():
+    """
+    Returns the profilers requested through OMAM_PROFILE, which is ``cpu`` for cProfile, ``memory``
+    for tracemalloc, a comma separated list of both, or ``true`` for both.
+    """
+    value = os.environ.get(PROFILE_ENV, "").lower()
+    if value in ("1", "true", "yes", "on", "all"):
+        return PROFILE_MODES
+    return tuple(mode for mode in PROFILE_MODES if mode in [each.strip() for each in value.split(",")])
+
+
+def _short_path(path, parts=3):
+    return "/".join(path.replace(os.sep, "/").split("/")[-parts:])
+
+
+class ModuleProfiler(object):
+    """
+    Runs cProfile and tracemalloc around a module. The report writes the cProfile statistics and the
+    allocation statistics to the profile directory and returns the top functions by cumulative time
+    and the top lines by allocated memory. The profilers are imported only when profiling is enabled,
+    so that a module which runs without OMAM_PROFILE does not load them.
+    """
+
+    def __init__(self, name, modes, profile_dir=None, top=None):
+        self.name = name
+        self.modes = modes
+        self.profile_dir = os.path.expanduser(profile_dir or os.environ.get(PROFILE_DIR_ENV) or
+                                              DEFAULT_PROFILE_DIR)
+        try:
+            self.top = int(os.environ.get(PROFILE_TOP_ENV) or DEFAULT_PROFILE_TOP) if top is None else top
+        except ValueError:
+            self.top = DEFAULT_PROFILE_TOP
+        self.profile = None
+        self.snapshot = None
+        self.peak_memory = None
+        self._report = None
+
+    def start(self):
+        if "memory" in self.modes:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+        if "cpu" in self.modes:
+            import cProfile
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+
+    def stop(self):
+        if self.profile is not None:
+            self.profile.disable()
+        if "memory" not in self.modes:
+            return
+        import tracemalloc
+        if tracemalloc.is_tracing():
+            self.snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ))
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    def _cpu_report(self, base_path):
+        path = base_path + ".prof"
+        self.profile.dump_stats(path)
+        import pstats
+        stats = pstats.Stats(self.profile).stats
+        top = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:self.top]
+        functions = [{"function": "{0}:{1}({2})".format(_short_path(key[0]), key[1], key[2]), "calls": val[1],
+                      "tottime": round(val[2], 4), "cumtime": round(val[3], 4)} for key, val in top]
+        return path, functions
+
+    def _memory_report(self, base_path):
+        path = base_path + ".memory.txt"
+        statistics = self.snapshot.statistics("lineno")
+        with open(path, "w") as stats_file:
+            stats_file.write("peak {0} bytes\n".format(self.peak_memory))
+            for stat in statistics:
+                stats_file.write("{0}\n".format(stat))
+        lines = [{"location": "{0}:{1}".format(_short_path(stat.traceback[0].filename), stat.traceback[0].lineno),
+                  "size": stat.size, "count": stat.count} for stat in statistics[:self.top]]
+        return path, lines
+
+    def report(self):
+        """Stops the profilers on the first call, writes the statistics and returns the summary."""
+        if self._report is not None:
+            return self._report
+        self.stop()
+        if not os.path.isdir(self.profile_dir):
+            os.makedirs(self.profile_dir, 0o700)
+        base_path = os.path.join(self.profile_dir, "{0}_{1}_{2}".format(
+            self.name, time.strftime("%Y%m%d_%H%M%S"), os.getpid()))
+        self._report = {"files": []}
+        if self.profile is not None:
+            path, self._report["cpu"] = self._cpu_report(base_path)
+            self._report["files"].append(path)
+        if self.snapshot is not None:
+            path, self._report["memory"] = self._memory_report(base_path)
+            self._report["files"].append(path)
+            self._report["peak_memory"] = self.peak_memory
+        return self._report
+
+
+@contextmanager
+def result_hook(key, func):
+    """
+    Adds the value returned by func under key to the result of every exit_json and fail_json
+    called while the context is active.
+
+    The hook replaces the methods on the AnsibleModule class, so it does not apply to a subclass
+    which overrides exit_json or fail_json, nor to a bound method taken from a module before the
+    context was entered. The modules of this collection create the AnsibleModule inside main and
+    call the methods on that instance, which run_module covers.
+    """
+    exit_json, fail_json = AnsibleModule.exit_json, AnsibleModule.fail_json
+
+    def hooked_exit_json(module, **kwargs):
+        kwargs.setdefault(key, func())
+        exit_json(module, **kwargs)
+
+    def hooked_fail_json(module, msg, **kwargs):
+        kwargs.setdefault(key, func())
+        fail_json(module, msg, **kwargs)
+
+    AnsibleModule.exit_json, AnsibleModule.fail_json = hooked_exit_json, hooked_fail_json
+    try:
+        yield
+    finally:
+        AnsibleModule.exit_json, AnsibleModule.fail_json = exit_json, fail_json
+
+
+def _run_profiled(main, modes):
+    name = os.path.splitext(os.path.basename(main.__code__.co_filename))[0]
+    profiler = ModuleProfiler(name, modes)
+    with result_hook("profile", profiler.report):
+        profiler.start()
+        try:
+            return main()
+        finally:
+            # the report is written before exit_json, this covers a main which returns
+            profiler.report()
+
+
+def run_module(main):
+    """
+    Runs the main function of a module. When OMAM_PERF is set, the module result contains
+    a ``perf`` summary of the REST requests sent by the module. When OMAM_PROFILE is set, the module
+    runs under cProfile, tracemalloc or both, and the result contains a ``profile`` summary.
+    """
+    modes = get_profile_modes()
+    if perf_enabled():
+        with result_hook("perf", perf_summary):
+            return _run_profiled(main, modes) if modes else main()
+    if modes:
+        return _run_profiled(main, modes)
+    return main()
@@ -32,16 +32,25 @@ __metaclass__ = type
 
 import json
 import os
-import time
-import socket
-from ansible.module_utils.urls import open_url, ConnectionError, SSLValidationError
+from concurrent.futures import ThreadPoolExecutor
+from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.six.moves.urllib.parse import urlencode
+from ansible_collections.dellemc.openmanage.plugins.module_utils.http_transport import keepalive_enabled, \
+    update_from_connection, check_auth_params
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_transport import RestTransportMixin
+from ansible_collections.dellemc.openmanage.plugins.module_utils.session_cache import get_session_cache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.retry_policy import get_retry_policy
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rate_limiter import get_rate_limiter
+from ansible_collections.dellemc.openmanage.plugins.module_utils.host_resolver import resolve, is_ipv6
+from ansible_collections.dellemc.openmanage.plugins.module_utils.response_cache import get_response_cache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.json_codec import JsonResponseMixin
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_poller import JobPoller
 
 ome_auth_params = {
-    "hostname": {"required": True, "type": "str"},
-    "username": {"required": True, "type": "str"},
-    "password": {"required": True, "type": "str", "no_log": True},
+    "hostname": {"required": False, "type": "str"},
+    "username": {"required": False, "type": "str"},
+    "password": {"required": False, "type": "str", "no_log": True},
     "port": {"type": "int", "default": 443},
     "validate_certs": {"type": "bool", "default": True},
     "ca_path": {"type": "path"},
@@ -55,10 +64,29 @@ SESSION_RESOURCE_COLLECTION = {
 
 JOB_URI = "JobService/Jobs({job_id})"
 JOB_SERVICE_URI = "JobService/Jobs"
+DEVICE_URI = "DeviceService/Devices"
 HOST_UNRESOLVED_MSG = "Unable to resolve hostname or IP {0}."
+PAGE_WORKERS_ENV = "OMAM_PAGE_WORKERS"
 
 
-class OpenURLResponse(object):
+def get_select_query(select):
+    """Returns the query parameters which request only the select attributes, empty when all are needed."""
+    return {"$select": ",".join(select)} if select else {}
+
+
+def project_items(items, select):
+    """
+    Keeps only the select attributes of every item. Appliances which ignore $select return the full
+    records, so the projection is also done on the client. A nested attribute in the OData path
+    format, for example DeviceManagement/NetworkAddress, keeps the whole top level attribute.
+    """
+    if not select:
+        return items
+    keys = set(attr.split("/")[0] for attr in select)
+    return [dict((key, val) for key, val in item.items() if key in keys) for item in items]
+
+
+class OpenURLResponse(JsonResponseMixin):
     """Handles HTTPResponse"""
 
     def __init__(self, resp):
@@ -67,13 +95,6 @@ class OpenURLResponse(object):
         if self.resp:
             self.body = self.resp.read()
 
-    @property
-    def json_data(self):
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
-
     @property
     def status_code(self):
         return self.resp.getcode()
@@ -86,12 +107,23 @@ class OpenURLResponse(object):
     def token_header(self):
         return self.resp.headers.get('X-Auth-Token')
 
+    @property
+    def headers(self):
+        return self.resp.headers
+
 
-class RestOME(object):
+class RestOME(RestTransportMixin):
     """Handles OME API requests"""
 
-    def __init__(self, module_params=None, req_session=False):
+    response_class = OpenURLResponse
+    session_resources = SESSION_RESOURCE_COLLECTION
+
+    def __init__(self, module_params=None, req_session=False, socket_path=None):
         self.module_params = module_params
+        if socket_path:
+            update_from_connection(socket_path, self.module_params, {"hostname": "host", "username": "remote_user"})
+        else:
+            check_auth_params(self.module_params, ("hostname", "username", "password"))
         self.hostname = str(self.module_params["hostname"]).strip('][')
         self.username = self.module_params["username"]
         self.password = self.module_params["password"]
@@ -100,14 +132,26 @@ class RestOME(object):
         self.ca_path = self.module_params.get("ca_path")
         self.timeout = self.module_params.get("timeout", 30)
         self.req_session = req_session
+        self.socket_path = socket_path
         self.session_id = None
         self.protocol = 'https'
         self._headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+        self.keepalive = keepalive_enabled()
+        self.retry_policy = get_retry_policy()
+        self.rate_limiter = get_rate_limiter(self.hostname, self.port)
+        self.session_cache = get_session_cache(self.hostname, self.port, self.username, self.password)
+        self.response_cache = get_response_cache(self.hostname, self.port, self.username)
+        self.page_workers = self._get_page_workers()
+        if not self.socket_path:
+            # with the httpapi connection plugin the persistent connection resolves the host
+            self._resolve_hostname()
+
+    def _resolve_hostname(self):
         try:
-            data = socket.getaddrinfo(self.hostname, self.port)
+            data = resolve(self.hostname, self.port)
             lastuple = data[-1]
             self.hostname = lastuple[-1][0]
-            if "AF_INET6" == data[0][0]._name_:
+            if is_ipv6(data):
                 self.hostname = "[{0}]".format(self.hostname)
         except Exception:
             msg = HOST_UNRESOLVED_MSG.format(self.hostname)
@@ -131,7 +175,7 @@ class RestOME(object):
 
     def _url_common_args_spec(self, method, api_timeout, headers=None):
         """Creates an argument common spec"""
-        req_header = self._headers
+        req_header = dict(self._headers)
         if headers:
             req_header.update(headers)
         if api_timeout is None:
@@ -151,9 +195,6 @@ class RestOME(object):
 
     def _args_without_session(self, method, api_timeout, headers=None):
         """Creates an argument spec in case of basic authentication"""
-        req_header = self._headers
-        if headers:
-            req_header.update(headers)
         url_kwargs = self._url_common_args_spec(method, api_timeout, headers=headers)
         url_kwargs["url_username"] = self.username
         url_kwargs["url_password"] = self.password
@@ -190,63 +231,88 @@ class RestOME(object):
             if data and dump:
                 data = json.dumps(data)
             url = self._build_url(path, query_param=query_param)
-            resp = open_url(url, data=data, **url_kwargs)
-            resp_data = OpenURLResponse(resp)
+            resp_data = self._send_request(method, url, data, url_kwargs)
         except (HTTPError, URLError, SSLValidationError, ConnectionError) as err:
             raise err
         return resp_data
 
-    def __enter__(self):
-        """Creates sessions by passing it to header"""
-        if self.req_session:
-            payload = {'UserName': self.username,
-                       'Password': self.password,
-                       'SessionType': 'API', }
-            path = SESSION_RESOURCE_COLLECTION["SESSION"]
-            resp = self.invoke_request('POST', path, data=payload)
-            if resp and resp.success:
-                self.session_id = resp.json_data.get("Id")
-                self._headers["X-Auth-Token"] = resp.token_header
-            else:
-                msg = "Could not create the session"
-                raise ConnectionError(msg)
-        return self
-
-    def __exit__(self, exc_type, exc_value, traceback):
-        """Deletes a session id, which is in use for request"""
-        if self.session_id:
-            path = SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=self.session_id)
-            self.invoke_request('DELETE', path)
-        return False
-
-    def get_all_report_details(self, uri):
+    def invoke_cached_request(self, path, query_param=None):
+        """
+        Sends a GET request for a resource which rarely changes through the response cache,
+        which revalidates the stored response with its ETag. Without the cache the request is sent as is.
+        :arg path: path to request without query parameter
+        :arg query_param: (optional) Dictionary of query parameter to send with request
+        :returns: OpenURLResponse
+        """
+        if self.response_cache is None:
+            return self.invoke_request('GET', path, query_param=query_param)
+        return self.response_cache.get(
+            self._build_url(path, query_param=query_param),
+            lambda headers: self.invoke_request('GET', path, query_param=query_param, headers=headers),
+            OpenURLResponse)
+
+    def _session_payload(self):
+        return {'UserName': self.username, 'Password': self.password, 'SessionType': 'API'}
+
+    def _session_token(self, resp):
+        return resp.token_header
+
+    def get_all_report_details(self, uri, workers=None, select=None):
         """
         This implementation mainly dependent on '@odata.count' value.
         Currently first request without query string, always returns total number of available
         reports in '@odata.count'.
+        :param uri: uri which supports $top and $skip
+        :param workers: (optional) number of pages fetched in parallel once '@odata.count' is known,
+            defaults to the OMAM_PAGE_WORKERS environment variable or sequential fetch.
+        :param select: (optional) list of attributes to request with $select, the other attributes
+            are removed from the reports.
         """
         try:
-            resp = self.invoke_request('GET', uri)
+            select_query = get_select_query(select)
+            resp = self.invoke_request('GET', uri, query_param=select_query or None)
             data = resp.json_data
             report_list = data["value"]
             total_count = data['@odata.count']
             remaining_count = total_count - len(report_list)
             first_page_count = len(report_list)
+            workers = self.page_workers if workers is None else workers
+            if workers > 1 and first_page_count and remaining_count > 0:
+                resp = self._get_remaining_pages(uri, report_list, total_count, first_page_count, workers,
+                                                 select_query) or resp
+                remaining_count = 0
             while remaining_count > 0:
-                resp = self.invoke_request('GET', uri,
-                                           query_param={"$top": first_page_count, "$skip": len(report_list)})
+                query_param = {"$top": first_page_count, "$skip": len(report_list)}
+                query_param.update(select_query)
+                resp = self.invoke_request('GET', uri, query_param=query_param)
                 data = resp.json_data
                 value = data["value"]
                 report_list.extend(value)
                 remaining_count = remaining_count - len(value)
-            return {"resp_obj": resp, "report_list": report_list}
+            return {"resp_obj": resp, "report_list": project_items(report_list, select)}
         except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
             raise err
 
+    def _get_remaining_pages(self, uri, report_list, total_count, page_size, workers, select_query=None):
+        """Fetches all the pages after the first one on a bounded thread pool and extends
+        report_list in page order. Returns the response of the last page."""
+        offsets = list(range(len(report_list), total_count, page_size))
+
+        def fetch_page(skip):
+            query_param = {"$top": page_size, "$skip": skip}
+            query_param.update(select_query or {})
+            return self.invoke_request('GET', uri, query_param=query_param)
+
+        resp = None
+        with ThreadPoolExecutor(max_workers=min(workers, len(offsets))) as executor:
+            for resp in executor.map(fetch_page, offsets):
+                report_list.extend(resp.json_data["value"])
+        return resp
+
     def get_job_type_id(self, jobtype_name):
         """This provides an ID of the job type."""
         job_type_id = None
-        resp = self.invoke_request('GET', "JobService/JobTypes")
+        resp = self.invoke_cached_request("JobService/JobTypes")
         data = resp.json_data["value"]
         for each in data:
             if each["Name"] == jobtype_name:
@@ -264,7 +330,7 @@ class RestOME(object):
         """
         device_id = None
         query = "DeviceServiceTag eq '{0}'".format(service_tag)
-        response = self.invoke_request("GET", "DeviceService/Devices", query_param={"$filter": query})
+        response = self.invoke_request("GET", DEVICE_URI, query_param={"$filter": query})
         value = response.json_data.get("value", [])
         device_info = {}
         if value:
@@ -272,6 +338,32 @@ class RestOME(object):
             device_id = device_info["Id"]
         return {"Id": device_id, "value": device_info}
 
+    def iter_pages(self, uri, query_param=None):
+        """
+        Generator which follows '@odata.nextLink' and yields the json data of one page at a time,
+        so callers can process or stop before the remaining pages are requested.
+        :param uri: uri which supports pagination
+        :param query_param: (optional) Dictionary of query parameter for the first request
+        :return: dict, json data of each page
+        """
+        resp = self.invoke_request('GET', uri, query_param=query_param)
+        while resp is not None:
+            data = resp.json_data
+            yield data
+            next_link = data.get('@odata.nextLink', '')
+            resp = self.invoke_request('GET', next_link.split('/api')[-1]) if next_link else None
+
+    def iter_items(self, uri, query_param=None):
+        """
+        Generator which yields the items of a pagination supported GET uri page by page.
+        :param uri: uri which supports pagination
+        :param query_param: (optional) Dictionary of query parameter for the first request
+        :return: dict, each item of the 'value' list
+        """
+        for data in self.iter_pages(uri, query_param=query_param):
+            for item in data.get("value", []):
+                yield item
+
     def get_all_items_with_pagination(self, uri, query_param=None):
         """
          This implementation mainly to get all available items from ome for pagination
@@ -280,21 +372,41 @@ class RestOME(object):
         :return: dict.
         """
         try:
-            resp = self.invoke_request('GET', uri, query_param=query_param)
-            data = resp.json_data
-            total_items = data.get("value", [])
-            total_count = data.get('@odata.count', 0)
-            next_link = data.get('@odata.nextLink', '')
-            while next_link:
-                resp = self.invoke_request('GET', next_link.split('/api')[-1])
-                data = resp.json_data
-                value = data["value"]
-                next_link = data.get('@odata.nextLink', '')
-                total_items.extend(value)
+            total_items, total_count = [], None
+            for data in self.iter_pages(uri, query_param=query_param):
+                if total_count is None:
+                    total_count = data.get('@odata.count', 0)
+                total_items.extend(data.get("value", []))
             return {"total_count": total_count, "value": total_items}
         except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
             raise err
 
+    def find_devices(self, identifiers, keys=("Id", "DeviceServiceTag"), select=None):
+        """
+        Resolves device ids or service tags to the device details and stops reading
+        the device pages as soon as every identifier is found.
+        :param identifiers: list of device ids and/or service tags
+        :param keys: device attributes against which the identifiers are matched
+        :param select: (optional) list of device attributes to request with $select, keys are always included
+        :return: dict, identifier as str to the device details, missing identifiers are not included
+        """
+        pending = set(str(each) for each in identifiers)
+        devices = {}
+        if not pending:
+            return devices
+        if select:
+            select = list(select) + [key for key in keys if key not in select]
+        for device in self.iter_items(DEVICE_URI, query_param=get_select_query(select) or None):
+            device = project_items([device], select)[0]
+            for key in keys:
+                value = str(device.get(key))
+                if value in pending:
+                    devices[value] = device
+                    pending.discard(value)
+            if not pending:
+                break
+        return devices
+
     def get_device_type(self):
         """
         Returns device type map where as key is type and value is type name
@@ -302,12 +414,18 @@ class RestOME(object):
         :return: dict, first item dict gives device type map
         """
         device_map = {}
-        response = self.invoke_request("GET", "DeviceService/DeviceType")
+        response = self.invoke_cached_request("DeviceService/DeviceType")
         if response.json_data.get("value"):
             device_map = dict([(item["DeviceType"], item["Name"]) for item in response.json_data["value"]])
         return device_map
 
     def get_job_info(self, job_id):
+        exit_poll, job_failed, message, job_dict = self._get_job_details(job_id)
+        return exit_poll, job_failed, message
+
+    def _get_job_details(self, job_id):
+        """Returns exit_poll, job_failed and message of get_job_info along with the job details."""
+        job_dict = None
         try:
             job_status_map = {
                 2020: "Scheduled", 2030: "Queued", 2040: "Starting", 2050: "Running", 2060: "Completed",
@@ -323,37 +441,34 @@ class RestOME(object):
                 job_failed = False
                 message = "Job {0} successfully.".format(job_status_map[job_status])
                 exit_poll = True
-                return exit_poll, job_failed, message
+                return exit_poll, job_failed, message, job_dict
             elif job_status in failed_job_status:
                 exit_poll = True
                 job_failed = True
                 message = "Job is in {0} state, and is not completed.".format(job_status_map[job_status])
-                return exit_poll, job_failed, message
-            return False, False, None
+                return exit_poll, job_failed, message, job_dict
+            return False, False, None, job_dict
         except HTTPError:
             job_failed = True
             message = "Unable to track the job status of {0}.".format(job_id)
             exit_poll = True
-            return exit_poll, job_failed, message
+            return exit_poll, job_failed, message, job_dict
 
-    def job_tracking(self, job_id, job_wait_sec=600, sleep_time=60):
+    def job_tracking(self, job_id, job_wait_sec=600, sleep_time=None):
         """
         job_id: job id
         job_wait_sec: Maximum time to wait to fetch the final job details in seconds
-        sleep_time: Maximum time to sleep in seconds in each job details fetch
+        sleep_time: Maximum time to sleep in seconds in each job details fetch, defaults to the profile value
         """
-        max_sleep_time = job_wait_sec
-        sleep_interval = sleep_time
-        while max_sleep_time:
-            if max_sleep_time > sleep_interval:
-                max_sleep_time = max_sleep_time - sleep_interval
-            else:
-                sleep_interval = max_sleep_time
-                max_sleep_time = 0
-            time.sleep(sleep_interval)
-            exit_poll, job_failed, job_message = self.get_job_info(job_id)
+        poller = JobPoller(job_wait_sec, profile="ome_job", max_interval=sleep_time)
+        poller.start()
+        while True:
+            exit_poll, job_failed, job_message, job_dict = self._get_job_details(job_id)
             if exit_poll is True:
                 return job_failed, job_message
+            if poller.expired:
+                break
+            poller.sleep(job_dict)
         return True, "The job is not complete after {0} seconds.".format(job_wait_sec)
 
     def strip_substr_dict(self, odata_dict, chkstr='@odata.'):
@@ -405,6 +520,14 @@ class RestOME(object):
             available_jobs = job_lst
         return job_allowed, available_jobs
 
+    def _get_page_workers(self):
+        """Number of pages fetched in parallel by default, from OMAM_PAGE_WORKERS."""
+        workers = os.environ.get(PAGE_WORKERS_ENV) or 1
+        try:
+            return max(int(workers), 1)
+        except (TypeError, ValueError):
+            return 1
+
     def _get_omam_ca_env(self):
         """Check if the value is set in REQUESTS_CA_BUNDLE or CURL_CA_BUNDLE or OMAM_CA_BUNDLE or returns None"""
         return os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or os.environ.get("OMAM_CA_BUNDLE")
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+
+PERF_ENV = "OMAM_PERF"
+SLOWEST_ENDPOINTS = 5
+# identifiers in resource paths, so that the requests of one endpoint are counted together
+PATH_ID_PATTERNS = (
+    (re.compile(r"\('[^']*'\)"), "({id})"),
+    (re.compile(r"\(\d+\)"), "({id})"),
+    (re.compile(r"/JID_\d+"), "/{id}"),
+    (re.compile(r"/\d+(?=/|$)"), "/{id}"),
+)
+
+_RECORDS = []
+_RECORDS_LOCK = threading.Lock()
+_PHASES = threading.local()
+
+
+def perf_enabled():
+    """Returns True when request timing is requested through the OMAM_PERF environment variable."""
+    return os.environ.get(PERF_ENV, "").lower() in ("1", "true", "yes", "on")
+
+
+def path_template(url):
+    """Returns the path of url without the query and with the resource identifiers replaced."""
+    path = urlparse(url).path or url
+    for pattern, repl in PATH_ID_PATTERNS:
+        path = pattern.sub(repl, path)
+    return path
+
+
+def note_phase(name, seconds):
+    """Adds the duration of a phase, such as connect or server, to the request of the current thread."""
+    phases = getattr(_PHASES, "current", None)
+    if phases is not None:
+        phases[name] = phases.get(name, 0) + seconds
+
+
+class _RequestTimer(object):
+
+    def __init__(self, method, url):
+        self.method = method
+        self.path = path_template(url)
+        self.status = None
+        self.size = None
+        self.start = time.time()
+        self.headers_at = None
+
+    def received(self):
+        """Marks the time when the response headers were received."""
+        self.headers_at = time.time()
+
+    def finished(self, resp):
+        """Takes the status and the body size of the :class:`OpenURLResponse`."""
+        self.status = resp.status_code
+        body = resp.body
+        self.size = len(body) if body is not None else 0
+
+
+class _NullTimer(object):
+
+    def received(self):
+        pass
+
+    def finished(self, resp):
+        pass
+
+
+@contextmanager
+def request_timer(method, url):
+    """
+    Context manager around a REST request which records the method, path template, status, body size,
+    total time, time to the response headers and the phases noted by the transport.
+    Nothing is recorded unless OMAM_PERF is set.
+    """
+    if not perf_enabled():
+        yield _NullTimer()
+        return
+    timer = _RequestTimer(method, url)
+    _PHASES.current = {}
+    try:
+        yield timer
+    except HTTPError as err:
+        timer.status = err.code
+        raise
+    finally:
+        end = time.time()
+        record = {"method": timer.method, "path": timer.path, "status": timer.status, "bytes": timer.size,
+                  "time": end - timer.start,
+                  "ttfb": (timer.headers_at or end) - timer.start}
+        record.update(_PHASES.current)
+        _PHASES.current = None
+        with _RECORDS_LOCK:
+            _RECORDS.append(record)
+
+
+def get_records():
+    with _RECORDS_LOCK:
+        return list(_RECORDS)
+
+
+def clear_records():
+    with _RECORDS_LOCK:
+        del _RECORDS[:]
+
+
+def _percentile(values, percent):
+    index = max(int(round(percent / 100.0 * len(values))) - 1, 0)
+    return values[min(index, len(values) - 1)]
+
+
+def perf_summary(records=None):
+    """
+    Returns a compact summary of the recorded requests: call count, total, p50 and p95 latency in
+    seconds, bytes received, time spent connecting and waiting for the server, failed calls and
+    the endpoints with the largest total time.
+    """
+    records = get_records() if records is None else records
+    times = sorted(each["time"] for each in records)
+    summary = {"calls": len(records), "total": 0, "p50": 0, "p95": 0,
+               "bytes": sum(each["bytes"] or 0 for each in records),
+               "connect": round(sum(each.get("connect", 0) for each in records), 3),
+               "server": round(sum(each.get("server", 0) for each in records), 3),
+               "errors": len([each for each in records if not each["status"] or each["status"] >= 400]),
+               "slowest": []}
+    if not times:
+        return summary
+    summary.update(total=round(sum(times), 3), p50=round(_percentile(times, 50), 3),
+                   p95=round(_percentile(times, 95), 3))
+    endpoints = {}
+    for each in records:
+        endpoint = endpoints.setdefault((each["method"], each["path"]), {"count": 0, "total": 0, "max": 0})
+        endpoint["count"] += 1
+        endpoint["total"] += each["time"]
+        endpoint["max"] = max(endpoint["max"], each["time"])
+    slowest = sorted(endpoints.items(), key=lambda item: item[1]["total"], reverse=True)[:SLOWEST_ENDPOINTS]
+    summary["slowest"] = [{"method": key[0], "path": key[1], "count": val["count"],
+                           "total": round(val["total"], 3), "max": round(val["max"], 3)} for key, val in slowest]
+    return summary
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import hashlib
+import math
+import os
+import time
+from contextlib import contextmanager
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+RATE_LIMIT_ENV = "OMAM_RATE_LIMIT"
+RATE_LIMIT_BURST_ENV = "OMAM_RATE_LIMIT_BURST"
+RATE_LIMIT_DIR_ENV = "OMAM_RATE_LIMIT_DIR"
+DEFAULT_RATE_LIMIT_DIR = "~/.ansible/omam_rate_limit"
+
+
+def parse_rate_limits(value):
+    """
+    Parses a rate limit setting such as ``10`` or ``ome1.example.com=5,192.168.0.2=20,10`` into
+    a dict of host to requests per second, the rate without a host is stored under None.
+    """
+    limits = {}
+    for item in (value or "").split(","):
+        host, sep, rate = item.strip().rpartition("=")
+        try:
+            rate = float(rate)
+        except ValueError:
+            continue
+        if rate > 0:
+            limits[host.strip() if sep else None] = rate
+    return limits
+
+
+def get_rate_limit(host):
+    """Returns the requests per second allowed for host by OMAM_RATE_LIMIT, None when there is no limit."""
+    limits = parse_rate_limits(os.environ.get(RATE_LIMIT_ENV))
+    return limits.get(host, limits.get(None))
+
+
+def get_rate_limiter(host, port):
+    """Returns the :class:`RateLimiter` of the appliance or None if its requests are not limited."""
+    rate = get_rate_limit(host)
+    if not rate:
+        return None
+    try:
+        burst = int(os.environ.get(RATE_LIMIT_BURST_ENV) or 0)
+    except ValueError:
+        burst = 0
+    return RateLimiter(host, port, rate, burst=burst or None)
+
+
+class RateLimiter(object):
+    """
+    Token bucket which limits the requests sent to one appliance.
+    The bucket is kept in a lock file on the host where the modules run, so all the Ansible forks
+    that target the same appliance draw from the same bucket. The bucket holds up to burst tokens
+    and refills at rate tokens per second, every request takes one token.
+    """
+
+    def __init__(self, host, port, rate, burst=None, state_dir=None):
+        self.rate = float(rate)
+        self.burst = max(burst or int(math.ceil(self.rate)), 1)
+        self.state_dir = os.path.expanduser(state_dir or os.environ.get(RATE_LIMIT_DIR_ENV) or
+                                            DEFAULT_RATE_LIMIT_DIR)
+        digest = hashlib.sha256("{0}|{1}".format(host, port).encode("utf-8")).hexdigest()
+        self.path = os.path.join(self.state_dir, "{0}.bucket".format(digest))
+
+    @contextmanager
+    def _locked_state(self):
+        if not os.path.isdir(self.state_dir):
+            os.makedirs(self.state_dir, 0o700)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if HAS_FCNTL:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            yield fd
+        finally:
+            if HAS_FCNTL:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _read(self, fd, now):
+        os.lseek(fd, 0, os.SEEK_SET)
+        try:
+            tokens, updated = [float(each) for each in os.read(fd, 64).decode().split()]
+        except ValueError:
+            return float(self.burst), now
+        return min(tokens, float(self.burst)), min(updated, now)
+
+    def _write(self, fd, tokens, updated):
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.ftruncate(fd, 0)
+        os.write(fd, "{0!r} {1!r}".format(tokens, updated).encode())
+
+    def _take(self):
+        """Takes a token and returns 0, or returns the seconds until the next token is available."""
+        with self._locked_state() as fd:
+            now = time.time()
+            tokens, updated = self._read(fd, now)
+            tokens = min(tokens + (now - updated) * self.rate, float(self.burst))
+            wait = 0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / self.rate
+            self._write(fd, tokens, now)
+        return wait
+
+    def acquire(self):
+        """Blocks until a request may be sent and returns the seconds waited."""
+        waited = 0
+        wait = self._take()
+        while wait > 0:
+            time.sleep(wait)
+            waited += wait
+            wait = self._take()
+        return waited
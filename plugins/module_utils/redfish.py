@@ -32,14 +32,21 @@ __metaclass__ = type
 import json
 import os
 import socket
-from ansible.module_utils.urls import open_url, ConnectionError, SSLValidationError
+from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.six.moves.urllib.parse import urlencode
+from ansible_collections.dellemc.openmanage.plugins.module_utils.http_transport import keepalive_enabled, \
+    update_from_connection, check_auth_params
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_transport import RestTransportMixin
+from ansible_collections.dellemc.openmanage.plugins.module_utils.session_cache import get_session_cache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.retry_policy import get_retry_policy
+from ansible_collections.dellemc.openmanage.plugins.module_utils.host_resolver import resolve, is_ipv6
+from ansible_collections.dellemc.openmanage.plugins.module_utils.json_codec import JsonResponseMixin
 
 redfish_auth_params = {
-    "baseuri": {"required": True, "type": "str"},
-    "username": {"required": True, "type": "str"},
-    "password": {"required": True, "type": "str", "no_log": True},
+    "baseuri": {"required": False, "type": "str"},
+    "username": {"required": False, "type": "str"},
+    "password": {"required": False, "type": "str", "no_log": True},
     "validate_certs": {"type": "bool", "default": True},
     "ca_path": {"type": "path"},
     "timeout": {"type": "int", "default": 30},
@@ -53,7 +60,7 @@ SESSION_RESOURCE_COLLECTION = {
 HOST_UNRESOLVED_MSG = "Unable to resolve hostname or IP {0}."
 
 
-class OpenURLResponse(object):
+class OpenURLResponse(JsonResponseMixin):
     """Handles HTTPResponse"""
 
     def __init__(self, resp):
@@ -62,13 +69,6 @@ class OpenURLResponse(object):
         if self.resp:
             self.body = self.resp.read()
 
-    @property
-    def json_data(self):
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
-
     @property
     def status_code(self):
         return self.resp.getcode()
@@ -87,11 +87,18 @@ class OpenURLResponse(object):
         return self.resp.reason
 
 
-class Redfish(object):
+class Redfish(RestTransportMixin):
     """Handles iDRAC Redfish API requests"""
 
-    def __init__(self, module_params=None, req_session=False):
+    response_class = OpenURLResponse
+    session_resources = SESSION_RESOURCE_COLLECTION
+
+    def __init__(self, module_params=None, req_session=False, socket_path=None):
         self.module_params = module_params
+        if socket_path:
+            update_from_connection(socket_path, self.module_params, {"baseuri": "host", "username": "remote_user"})
+        else:
+            check_auth_params(self.module_params, ("baseuri", "username", "password"))
         self.hostname = self.module_params["baseuri"]
         self.username = self.module_params["username"]
         self.password = self.module_params["password"]
@@ -100,11 +107,19 @@ class Redfish(object):
         self.timeout = self.module_params.get("timeout", 30)
         self.use_proxy = self.module_params.get("use_proxy", True)
         self.req_session = req_session
+        self.socket_path = socket_path
         self.session_id = None
         self.protocol = 'https'
         self.root_uri = '/redfish/v1/'
         self._headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
-
+        self.keepalive = keepalive_enabled()
+        self.retry_policy = get_retry_policy()
+        self.session_cache = get_session_cache(self.hostname, None, self.username, self.password)
+        if not self.socket_path:
+            # with the httpapi connection plugin the persistent connection resolves the host
+            self._resolve_hostname()
+
+    def _resolve_hostname(self):
         try:
             ip_addr, port = self.hostname, self.protocol
             if ']:' in ip_addr:
@@ -113,8 +128,8 @@ class Redfish(object):
             if ip_addr.count(':') == 1:
                 ip_addr, port = ip_addr.split(':')
 
-            data = socket.getaddrinfo(ip_addr, port)
-            if "AF_INET6" == data[0][0]._name_:
+            data = resolve(ip_addr, port)
+            if is_ipv6(data):
                 ip_addr, port = data[0][4][0], data[0][4][1]
                 self.hostname = "[{0}]:{1}".format(ip_addr, port)
         except (socket.gaierror, IndexError):
@@ -137,7 +152,7 @@ class Redfish(object):
 
     def _url_common_args_spec(self, method, api_timeout, headers=None):
         """Creates an argument common spec"""
-        req_header = self._headers
+        req_header = dict(self._headers)
         if headers:
             req_header.update(headers)
         if api_timeout is None:
@@ -157,9 +172,6 @@ class Redfish(object):
 
     def _args_without_session(self, path, method, api_timeout, headers=None):
         """Creates an argument spec in case of basic authentication"""
-        req_header = self._headers
-        if headers:
-            req_header.update(headers)
         url_kwargs = self._url_common_args_spec(method, api_timeout, headers=headers)
         if not (path == SESSION_RESOURCE_COLLECTION["SESSION"] and method == 'POST'):
             url_kwargs["url_username"] = self.username
@@ -197,34 +209,11 @@ class Redfish(object):
             if data and dump:
                 data = json.dumps(data)
             url = self._build_url(path, query_param=query_param)
-            resp = open_url(url, data=data, **url_kwargs)
-            resp_data = OpenURLResponse(resp)
+            resp_data = self._send_request(method, url, data, url_kwargs)
         except (HTTPError, URLError, SSLValidationError, ConnectionError) as err:
             raise err
         return resp_data
 
-    def __enter__(self):
-        """Creates sessions by passing it to header"""
-        if self.req_session:
-            payload = {'UserName': self.username,
-                       'Password': self.password}
-            path = SESSION_RESOURCE_COLLECTION["SESSION"]
-            resp = self.invoke_request('POST', path, data=payload)
-            if resp and resp.success:
-                self.session_id = resp.json_data.get("Id")
-                self._headers["X-Auth-Token"] = resp.headers.get('X-Auth-Token')
-            else:
-                msg = "Could not create the session"
-                raise ConnectionError(msg)
-        return self
-
-    def __exit__(self, exc_type, exc_value, traceback):
-        """Deletes a session id, which is in use for request"""
-        if self.session_id:
-            path = SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=self.session_id)
-            self.invoke_request('DELETE', path)
-        return False
-
     def strip_substr_dict(self, odata_dict, chkstr='@odata.'):
         cp = odata_dict.copy()
         klist = cp.keys()
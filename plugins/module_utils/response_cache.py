@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import base64
+import hashlib
+import json
+import os
+import time
+from ansible.module_utils.common.text.converters import to_bytes, to_text
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.http_transport import PooledResponse
+
+RESPONSE_CACHE_ENV = "OMAM_RESPONSE_CACHE"
+RESPONSE_CACHE_DIR_ENV = "OMAM_RESPONSE_CACHE_DIR"
+RESPONSE_CACHE_TTL_ENV = "OMAM_RESPONSE_CACHE_TTL"
+RESPONSE_CACHE_SIZE_ENV = "OMAM_RESPONSE_CACHE_SIZE"
+DEFAULT_RESPONSE_CACHE_DIR = "~/.ansible/omam_response_cache"
+DEFAULT_RESPONSE_CACHE_TTL = 3600
+DEFAULT_RESPONSE_CACHE_SIZE = 256
+NOT_MODIFIED = 304
+
+
+def response_cache_enabled():
+    """Returns True when the response cache is requested through the OMAM_RESPONSE_CACHE environment variable."""
+    return os.environ.get(RESPONSE_CACHE_ENV, "").lower() in ("1", "true", "yes", "on")
+
+
+def get_response_cache(host, port, username):
+    """Returns a :class:`ResponseCache` for the host and user or None if the cache is disabled."""
+    if not response_cache_enabled():
+        return None
+    return ResponseCache(host, port, username)
+
+
+def _env_int(name, default):
+    try:
+        return max(int(os.environ.get(name) or default), 0)
+    except ValueError:
+        return default
+
+
+class ResponseCache(object):
+    """
+    File based cache of GET responses of resources which rarely change, such as registries and type lists.
+    A response with an ETag is revalidated with If-None-Match on every use, a response without an ETag
+    is served without a request until it is older than the TTL. The least recently used entries are
+    evicted when there are more than the maximum number of entries.
+    """
+
+    def __init__(self, host, port, username, cache_dir=None, ttl=None, max_entries=None):
+        self.cache_dir = os.path.expanduser(cache_dir or os.environ.get(RESPONSE_CACHE_DIR_ENV) or
+                                            DEFAULT_RESPONSE_CACHE_DIR)
+        self.ttl = _env_int(RESPONSE_CACHE_TTL_ENV, DEFAULT_RESPONSE_CACHE_TTL) if ttl is None else ttl
+        self.max_entries = _env_int(RESPONSE_CACHE_SIZE_ENV, DEFAULT_RESPONSE_CACHE_SIZE) \
+            if max_entries is None else max_entries
+        # responses depend on the privileges of the user, so the user is part of the key
+        self.prefix = "{0}|{1}|{2}|".format(host, port, username)
+
+    def _path(self, url):
+        digest = hashlib.sha256((self.prefix + url).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, "{0}.json".format(digest))
+
+    def load(self, url):
+        """Returns the cached entry of url as dict with etag, stored and body keys or None."""
+        try:
+            with open(self._path(url)) as cache_file:
+                entry = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+        if "body" not in entry:
+            return None
+        return entry
+
+    def save(self, url, etag, body):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, 0o700)
+        entry = {"etag": etag, "stored": time.time(), "body": to_text(base64.b64encode(to_bytes(body or b"")))}
+        path = self._path(url)
+        tmp_path = "{0}.{1}.tmp".format(path, os.getpid())
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as cache_file:
+            json.dump(entry, cache_file)
+        os.rename(tmp_path, path)
+        self._evict()
+
+    def touch(self, url):
+        try:
+            os.utime(self._path(url), None)
+        except OSError:
+            pass
+
+    def invalidate(self, url):
+        try:
+            os.remove(self._path(url))
+        except OSError:
+            pass
+
+    def _evict(self):
+        try:
+            names = [name for name in os.listdir(self.cache_dir) if name.endswith(".json")]
+        except OSError:
+            return
+        if len(names) <= self.max_entries:
+            return
+        paths = [os.path.join(self.cache_dir, name) for name in names]
+        paths.sort(key=lambda path: os.path.getmtime(path) if os.path.exists(path) else 0)
+        for path in paths[:len(paths) - self.max_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _is_fresh(self, entry):
+        return not entry.get("etag") and time.time() - entry.get("stored", 0) <= self.ttl
+
+    def get(self, url, fetch, response_class):
+        """
+        Returns the response of url from the cache or from fetch.
+        :param url: complete url of the resource, used as cache key
+        :param fetch: callable which sends the GET request with the extra headers passed to it
+        :param response_class: OpenURLResponse class of the client, which wraps a cached body
+        """
+        entry = self.load(url)
+        if entry is not None and self._is_fresh(entry):
+            return self._cached_response(url, entry, response_class)
+        headers = {"If-None-Match": entry["etag"]} if entry is not None and entry.get("etag") else None
+        try:
+            resp = fetch(headers)
+        except HTTPError as err:
+            if err.code == NOT_MODIFIED and headers:
+                self.touch(url)
+                return self._cached_response(url, entry, response_class)
+            raise
+        if resp.status_code == NOT_MODIFIED and headers:
+            self.touch(url)
+            return self._cached_response(url, entry, response_class)
+        if resp.status_code == 200:
+            self.save(url, resp.headers.get("ETag"), resp.body)
+        return resp
+
+    def _cached_response(self, url, entry, response_class):
+        body = base64.b64decode(to_bytes(entry["body"]))
+        headers = {"ETag": entry["etag"]} if entry.get("etag") else {}
+        return response_class(PooledResponse(url, 200, "OK", headers, body))
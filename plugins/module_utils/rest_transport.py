@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from ansible.module_utils.urls import open_url, ConnectionError
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.http_transport import keepalive_open_url, \
+    connection_open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import request_timer
+from ansible_collections.dellemc.openmanage.plugins.module_utils.session_cache import INVALID_SESSION_STATUS
+
+
+class RestTransportMixin(object):
+    """
+    Sends the requests and manages the X-Auth-Token session of RestOME, Redfish and iDRACRedfishAPI.
+    The client sets response_class and session_resources, the transport attributes socket_path, keepalive,
+    retry_policy, rate_limiter and session_cache, and provides invoke_request, which builds the url and
+    the open_url arguments and passes them to _send_request.
+    """
+
+    response_class = None
+    session_resources = None
+    rate_limiter = None
+
+    def _send_request(self, method, url, data, url_kwargs):
+        """Sends the request with the retry policy of the client and returns a response_class object."""
+        with request_timer(method, url) as timer:
+            if self.retry_policy is None:
+                resp = self._open_url(url, data, url_kwargs)
+            else:
+                resp = self.retry_policy.call(method, self._open_url, url, data, url_kwargs)
+            timer.received()
+            resp_data = self.response_class(resp)
+            timer.finished(resp_data)
+        return resp_data
+
+    def _open_url(self, url, data, url_kwargs):
+        """Sends the request through the persistent connection, the keep-alive pool or open_url"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        if self.socket_path:
+            return connection_open_url(self.socket_path, url, data=data, **url_kwargs)
+        if self.keepalive:
+            return keepalive_open_url(url, data=data, **url_kwargs)
+        return open_url(url, data=data, **url_kwargs)
+
+    def _session_request(self, method, path, data=None):
+        return self.invoke_request(method, path, data=data)
+
+    def _session_payload(self):
+        return {'UserName': self.username, 'Password': self.password}
+
+    def _session_token(self, resp):
+        return resp.headers.get('X-Auth-Token')
+
+    def __enter__(self):
+        """Creates sessions by passing it to header"""
+        if self.req_session and not self.socket_path:
+            if self.session_cache is None:
+                self._create_session()
+            else:
+                with self.session_cache.lock():
+                    if not self._resume_session():
+                        self._create_session()
+                        self.session_cache.save(self.session_id, self._headers["X-Auth-Token"])
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Deletes a session id, which is in use for request"""
+        if self.session_id and self.session_cache is None:
+            path = self.session_resources["SESSION_ID"].format(Id=self.session_id)
+            self._session_request('DELETE', path)
+        return False
+
+    def _create_session(self):
+        """Creates a session and adds the X-Auth-Token to the request headers."""
+        resp = self._session_request('POST', self.session_resources["SESSION"], data=self._session_payload())
+        if resp and resp.success:
+            self.session_id = resp.json_data.get("Id")
+            self._headers["X-Auth-Token"] = self._session_token(resp)
+        else:
+            msg = "Could not create the session"
+            raise ConnectionError(msg)
+
+    def _resume_session(self):
+        """
+        Reuses the session stored in the session cache after checking it with a request on the session resource.
+        Returns False when there is no cached session or the session is no longer accepted by the server.
+        """
+        cached = self.session_cache.load()
+        if cached is None:
+            return False
+        self._headers["X-Auth-Token"] = cached["token"]
+        path = self.session_resources["SESSION_ID"].format(Id=cached["session_id"])
+        try:
+            self._session_request('GET', path)
+        except HTTPError as err:
+            self._headers.pop("X-Auth-Token", None)
+            if err.code not in INVALID_SESSION_STATUS:
+                raise
+            self.session_cache.invalidate()
+            return False
+        self.session_id = cached["session_id"]
+        return True
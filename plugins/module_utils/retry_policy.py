@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import os
+import random
+import socket
+import ssl
+import threading
+import time
+from email.utils import parsedate_tz, mktime_tz
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.http_transport import IDEMPOTENT_METHODS
+
+RETRIES_ENV = "OMAM_RETRIES"
+RETRY_BACKOFF_ENV = "OMAM_RETRY_BACKOFF"
+RETRY_MAX_DELAY_ENV = "OMAM_RETRY_MAX_DELAY"
+RETRY_BUDGET_ENV = "OMAM_RETRY_BUDGET"
+DEFAULT_RETRY_BACKOFF = 1
+DEFAULT_RETRY_MAX_DELAY = 30
+DEFAULT_RETRY_BUDGET = 20
+# the server refused the request without processing it, so any method can be sent again
+REJECTED_CODES = (429, 503)
+TRANSIENT_CODES = (429, 502, 503, 504)
+
+_BUDGET_LOCK = threading.Lock()
+_BUDGET = {"used": 0}
+
+
+def _env_number(name, default, cast=int):
+    try:
+        return max(cast(os.environ.get(name) or default), 0)
+    except ValueError:
+        return default
+
+
+def get_retry_policy():
+    """Returns a :class:`RetryPolicy` when retries are requested through OMAM_RETRIES, else None."""
+    retries = _env_number(RETRIES_ENV, 0)
+    if not retries:
+        return None
+    return RetryPolicy(retries)
+
+
+def reset_retry_budget():
+    with _BUDGET_LOCK:
+        _BUDGET["used"] = 0
+
+
+def _take_budget(budget):
+    with _BUDGET_LOCK:
+        if _BUDGET["used"] >= budget:
+            return False
+        _BUDGET["used"] += 1
+        return True
+
+
+def parse_retry_after(value):
+    """Returns the seconds to wait from a Retry-After header given as seconds or as HTTP date, or None."""
+    if not value:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        return int(value)
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(mktime_tz(parsed) - time.time(), 0)
+
+
+class RetryPolicy(object):
+    """
+    Sends a request again after a transient failure.
+
+    Idempotent methods are retried after a connection failure or a 429, 502, 503 or 504 response,
+    other methods only after a 429 or 503 response, which the server rejected without processing.
+    The delay grows exponentially from the backoff with jitter, a Retry-After header of the response
+    replaces it, and a Retry-After longer than the max_delay ends the retries. All the policies of the
+    process share the retry budget, so a failing appliance cannot stall a run with retries.
+    """
+
+    def __init__(self, retries, backoff=None, max_delay=None, budget=None):
+        self.retries = retries
+        self.backoff = _env_number(RETRY_BACKOFF_ENV, DEFAULT_RETRY_BACKOFF, float) if backoff is None else backoff
+        self.max_delay = _env_number(RETRY_MAX_DELAY_ENV, DEFAULT_RETRY_MAX_DELAY, float) \
+            if max_delay is None else max_delay
+        self.budget = _env_number(RETRY_BUDGET_ENV, DEFAULT_RETRY_BUDGET) if budget is None else budget
+
+    def is_retryable(self, method, err):
+        idempotent = str(method).upper() in IDEMPOTENT_METHODS
+        if isinstance(err, HTTPError):
+            return err.code in (TRANSIENT_CODES if idempotent else REJECTED_CODES)
+        if isinstance(err, URLError):
+            reason = err.reason
+            # certificate and name resolution failures do not go away by sending the request again
+            if isinstance(reason, (ssl.SSLError, socket.gaierror)):
+                return False
+            return idempotent and isinstance(reason, (socket.timeout, socket.error))
+        return False
+
+    def get_delay(self, attempt, err=None):
+        """Returns the seconds to wait before the retry after attempt failures, None to stop retrying."""
+        headers = getattr(err, "headers", None)
+        retry_after = parse_retry_after(headers.get("Retry-After")) if headers else None
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+        delay = min(self.backoff * (2 ** attempt), self.max_delay)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def call(self, method, func, *args):
+        """Returns func(*args), calling it again while it fails with a retryable error."""
+        attempt = 0
+        while True:
+            try:
+                return func(*args)
+            except URLError as err:
+                if attempt >= self.retries or not self.is_retryable(method, err):
+                    raise
+                delay = self.get_delay(attempt, err)
+                if delay is None or not _take_budget(self.budget):
+                    raise
+            time.sleep(delay)
+            attempt += 1
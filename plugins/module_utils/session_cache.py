@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import binascii
+import hashlib
+import hmac
+import json
+import os
+import time
+from contextlib import contextmanager
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+SESSION_CACHE_ENV = "OMAM_SESSION_CACHE"
+SESSION_CACHE_DIR_ENV = "OMAM_SESSION_CACHE_DIR"
+DEFAULT_SESSION_CACHE_DIR = "~/.ansible/omam_session_cache"
+# status codes of the session check which mean that the cached token is no longer accepted
+INVALID_SESSION_STATUS = (401, 403)
+
+
+def session_cache_enabled():
+    """Returns True when session reuse is requested through the OMAM_SESSION_CACHE environment variable."""
+    return os.environ.get(SESSION_CACHE_ENV, "").lower() in ("1", "true", "yes", "on")
+
+
+def get_session_cache(host, port, username, password):
+    """Returns a :class:`SessionCache` for the given credentials or None if the cache is disabled."""
+    if not session_cache_enabled():
+        return None
+    return SessionCache(host, port, username, password)
+
+
+class SessionCache(object):
+    """
+    File based store of a single X-Auth-Token session per host, port and user.
+    The files are only readable by the owner and every read and write is serialized with a lock file,
+    so concurrent Ansible forks create at most one session.
+    """
+
+    def __init__(self, host, port, username, password, cache_dir=None):
+        self.cache_dir = os.path.expanduser(cache_dir or os.environ.get(SESSION_CACHE_DIR_ENV) or
+                                            DEFAULT_SESSION_CACHE_DIR)
+        self.password = password
+        digest = hashlib.sha256("{0}|{1}|{2}".format(host, port, username).encode("utf-8"))
+        self.key = digest.hexdigest()
+        self.path = os.path.join(self.cache_dir, "{0}.json".format(self.key))
+        self.lock_path = os.path.join(self.cache_dir, "{0}.lock".format(self.key))
+
+    def _ensure_dir(self):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, 0o700)
+
+    @contextmanager
+    def lock(self):
+        """Exclusive lock which is held while a session is validated or created."""
+        self._ensure_dir()
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if HAS_FCNTL:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            if HAS_FCNTL:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _credential_check(self, salt):
+        """Salted HMAC of the password, so a changed password never reuses a session."""
+        return hmac.new(binascii.unhexlify(salt), str(self.password).encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def load(self):
+        """Returns the cached session as dict with session_id and token keys or None."""
+        try:
+            with open(self.path) as cache_file:
+                session = json.load(cache_file)
+            check = self._credential_check(session["salt"])
+        except (IOError, OSError, ValueError, KeyError, TypeError, binascii.Error):
+            return None
+        if not hmac.compare_digest(check, str(session.get("check"))):
+            return None
+        if not session.get("token") or not session.get("session_id"):
+            return None
+        return session
+
+    def save(self, session_id, token):
+        self._ensure_dir()
+        salt = binascii.hexlify(os.urandom(16)).decode("ascii")
+        session = {"session_id": session_id, "token": token, "created": int(time.time()),
+                   "salt": salt, "check": self._credential_check(salt)}
+        tmp_path = "{0}.{1}.tmp".format(self.path, os.getpid())
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as cache_file:
+            json.dump(session, cache_file)
+        os.rename(tmp_path, self.path)
+
+    def invalidate(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
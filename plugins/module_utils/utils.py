@@ -46,6 +46,10 @@ SYSTEM_RESET_URI = "/redfish/v1/Systems/{res_id}/Actions/ComputerSystem.Reset"
 MANAGER_JOB_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs?$expand=*($levels=1)"
 MANAGER_JOB_ID_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/{0}"
 GET_IDRAC_FIRMWARE_VER_URI = "/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion"
+OME_JOBS_URI = "JobService/Jobs"
+JOB_FILTER_CHUNK_SIZE = 40  # job ids per $filter request, keeps the url short
+OME_DEVICES_URI = "DeviceService/Devices"
+DEVICE_FILTER_MAX_LENGTH = 1500  # length of the encoded $filter of one request, keeps the url short
 
 import time
 from datetime import datetime
@@ -53,6 +57,9 @@ import re
 from ansible.module_utils.six.moves.urllib.error import HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.six.moves.urllib.parse import quote
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_poller import JobPoller
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import get_select_query, project_items
 
 
 def strip_substr_dict(odata_dict, chkstr='@odata.', case_sensitive=False):
@@ -79,7 +86,7 @@ def strip_substr_dict(odata_dict, chkstr='@odata.', case_sensitive=False):
 def job_tracking(rest_obj, job_uri, max_job_wait_sec=600, job_state_var=('LastRunStatus', 'Id'),
                  job_complete_states=(2060, 2020, 2090), job_fail_states=(2070, 2101, 2102, 2103),
                  job_running_states=(2050, 2040, 2030, 2100),
-                 sleep_interval_secs=10, max_unresponsive_wait=30, initial_wait=1):
+                 sleep_interval_secs=None, max_unresponsive_wait=30, initial_wait=1, profile="ome_job"):
     '''
     :param rest_obj: the rest_obj either of the below
     ansible_collections.dellemc.openmanage.plugins.module_utils.ome.RestOME
@@ -89,9 +96,10 @@ def job_tracking(rest_obj, job_uri, max_job_wait_sec=600, job_state_var=('LastRu
     :param job_complete_states:
     :param job_fail_states:
     :param job_running_states:
-    :param sleep_interval_secs:
+    :param sleep_interval_secs: maximum interval between two polls, defaults to the profile value
     :param max_unresponsive_wait:
     :param initial_wait:
+    :param profile: job poller profile, see JOB_POLL_PROFILES
     :return:
     '''
     # ome_job_status_map = {
@@ -100,18 +108,16 @@ def job_tracking(rest_obj, job_uri, max_job_wait_sec=600, job_state_var=('LastRu
     #     2103: "Canceled"
     # }
     # ensure job states are mutually exclusive
-    max_retries = max_job_wait_sec // sleep_interval_secs
-    unresp = max_unresponsive_wait // sleep_interval_secs
-    loop_ctr = 0
     job_failed = True
     job_dict = {}
-    wait_time = 0
     if set(job_complete_states) & set(job_fail_states):
-        return job_failed, "Overlapping job states found.", job_dict, wait_time
+        return job_failed, "Overlapping job states found.", job_dict, 0
     msg = "Job tracking started."
-    time.sleep(initial_wait)
-    while loop_ctr < max_retries:
-        loop_ctr += 1
+    poller = JobPoller(max_job_wait_sec, profile=profile, initial_wait=initial_wait,
+                       max_interval=sleep_interval_secs)
+    poller.start()
+    unresp_wait = 0
+    while not poller.expired:
         try:
             job_resp = rest_obj.invoke_request('GET', job_uri)
             job_dict = job_resp.json_data
@@ -121,28 +127,20 @@ def job_tracking(rest_obj, job_uri, max_job_wait_sec=600, job_state_var=('LastRu
             if job_status in job_complete_states:
                 job_failed = False
                 msg = "Job tracking completed."
-                loop_ctr = max_retries
+                break
             elif job_status in job_fail_states:
                 job_failed = True
                 msg = "Job is in Failed state."
-                loop_ctr = max_retries
-            if job_running_states:
-                if job_status in job_running_states:
-                    time.sleep(sleep_interval_secs)
-                    wait_time = wait_time + sleep_interval_secs
-            else:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
+                break
+            poller.sleep(job_dict)
         except Exception as err:
-            if unresp:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
+            if unresp_wait < max_unresponsive_wait:
+                unresp_wait += poller.sleep()
             else:
                 job_failed = True
                 msg = "Exception in job tracking " + str(err)
                 break
-            unresp = unresp - 1
-    return job_failed, msg, job_dict, wait_time
+    return job_failed, msg, job_dict, poller.waited
 
 
 def idrac_redfish_job_tracking(
@@ -151,51 +149,107 @@ def idrac_redfish_job_tracking(
         job_fail_states=("Failed", "RebootFailed", "Unknown"),
         job_running_states=("Running", "RebootPending", "Scheduling", "Scheduled", "Downloading", "Waiting", "Paused",
                             "New", "PendingActivation", "ReadyForExecution"),
-        sleep_interval_secs=10, max_unresponsive_wait=30, initial_wait=1):
+        sleep_interval_secs=None, max_unresponsive_wait=30, initial_wait=1, profile="idrac_job"):
     # idrac_redfish_job_sates = [ "New", "Scheduled", "Running", "Completed", "Downloading", "Downloaded",
     # "Scheduling", "ReadyForExecution", "Waiting", "Paused", "Failed", "CompletedWithErrors", "RebootPending",
     # "RebootFailed", "RebootCompleted", "PendingActivation", "Unknown"]
-    max_retries = max_job_wait_sec // sleep_interval_secs
-    unresp = max_unresponsive_wait // sleep_interval_secs
-    loop_ctr = 0
     job_failed = True
     job_dict = {}
-    wait_time = 0
     if set(job_complete_states) & set(job_fail_states):
-        return job_failed, "Overlapping job states found.", job_dict, wait_time
+        return job_failed, "Overlapping job states found.", job_dict, 0
     msg = "Job tracking started."
-    time.sleep(initial_wait)
-    while loop_ctr < max_retries:
-        loop_ctr += 1
+    poller = JobPoller(max_job_wait_sec, profile=profile, initial_wait=initial_wait,
+                       max_interval=sleep_interval_secs)
+    poller.start()
+    unresp_wait = 0
+    while not poller.expired:
         try:
             job_resp = rest_obj.invoke_request(job_uri, 'GET')
             job_dict = job_resp.json_data
             job_status = job_dict
             job_status = job_status.get(job_state_var, "Unknown")
-            if job_status in job_running_states:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-            elif job_status in job_complete_states:
+            if job_status in job_complete_states:
                 job_failed = False
                 msg = "Job tracking completed."
-                loop_ctr = max_retries
+                break
             elif job_status in job_fail_states:
                 job_failed = True
                 msg = "Job is in {0} state.".format(job_status)
-                loop_ctr = max_retries
-            else:  # unrecognised states, just wait
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
+                break
+            # running and unrecognised states, wait for the next poll
+            poller.sleep(job_dict)
         except Exception as err:
-            if unresp:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
+            if unresp_wait < max_unresponsive_wait:
+                unresp_wait += poller.sleep()
             else:
                 job_failed = True
                 msg = "Exception in job tracking " + str(err)
                 break
-            unresp = unresp - 1
-    return job_failed, msg, job_dict, wait_time
+    return job_failed, msg, job_dict, poller.waited
+
+
+def multi_job_tracking(rest_obj, job_ids, max_job_wait_sec=600, job_state_var=('LastRunStatus', 'Id'),
+                       job_complete_states=(2060, 2020, 2090), job_fail_states=(2070, 2101, 2102, 2103),
+                       sleep_interval_secs=None, max_unresponsive_wait=30, initial_wait=1, profile="ome_job"):
+    '''
+    Tracks several OME jobs with a single ``JobService/Jobs?$filter=Id eq .. or ..`` request per poll.
+    :param rest_obj: ansible_collections.dellemc.openmanage.plugins.module_utils.ome.RestOME
+    :param job_ids: ids of the jobs to track
+    :param max_job_wait_sec: max time to wait for all the jobs
+    :param job_state_var: The nested dict traversal path
+    :param job_complete_states:
+    :param job_fail_states: jobs in any other state are treated as running
+    :param sleep_interval_secs: maximum interval between two polls, defaults to the profile value
+    :param max_unresponsive_wait:
+    :param initial_wait:
+    :param profile: job poller profile, see JOB_POLL_PROFILES
+    :return: generator of job_id, job_failed, msg and job_dict which yields every job as soon as it is
+    finished, the jobs still running when max_job_wait_sec is exhausted are yielded last as failed
+    '''
+    pending = dict((job_id, {}) for job_id in job_ids)
+    if set(job_complete_states) & set(job_fail_states):
+        for job_id in pending:
+            yield job_id, True, "Overlapping job states found.", {}
+        return
+    poller = JobPoller(max_job_wait_sec, profile=profile, initial_wait=initial_wait,
+                       max_interval=sleep_interval_secs)
+    poller.start()
+    msg = "Job tracking started."
+    unresp_wait = 0
+    while pending and not poller.expired:
+        try:
+            jobs = []
+            ids = list(pending)
+            for idx in range(0, len(ids), JOB_FILTER_CHUNK_SIZE):
+                chunk = ids[idx:idx + JOB_FILTER_CHUNK_SIZE]
+                query_param = {"$filter": " or ".join("Id eq {0}".format(job_id) for job_id in chunk),
+                               "$top": len(chunk)}
+                job_resp = rest_obj.invoke_request('GET', OME_JOBS_URI, query_param=query_param)
+                jobs.extend(job_resp.json_data.get("value", []))
+        except Exception as err:
+            if unresp_wait < max_unresponsive_wait:
+                unresp_wait += poller.sleep()
+                continue
+            msg = "Exception in job tracking " + str(err)
+            break
+        for job_dict in jobs:
+            job_id = job_dict.get("Id")
+            if job_id not in pending:
+                continue
+            pending[job_id] = job_dict
+            job_status = job_dict
+            for x in job_state_var:
+                job_status = job_status.get(x, {})
+            if job_status in job_complete_states:
+                pending.pop(job_id)
+                yield job_id, False, "Job tracking completed.", job_dict
+            elif job_status in job_fail_states:
+                pending.pop(job_id)
+                yield job_id, True, "Job is in Failed state.", job_dict
+        if pending:
+            poller.sleep()
+    for job_id, job_dict in pending.items():
+        yield job_id, True, msg, job_dict
 
 
 def get_rest_items(rest_obj, uri="DeviceService/Devices", key="Id", value="Identifier", selector="value"):
@@ -357,16 +411,21 @@ def get_system_res_id(idrac):
     return res_id, error_msg
 
 
-def get_all_data_with_pagination(ome_obj, uri, query_param=None):
-    """To get all the devices with pagination based on the filter provided."""
+def get_all_data_with_pagination(ome_obj, uri, query_param=None, select=None):
+    """
+    To get all the devices with pagination based on the filter provided.
+    :param select: (optional) list of attributes to request with $select, the other attributes are removed.
+    """
     query, resp, report_list = "", None, []
+    if select:
+        query_param = dict(query_param or {})
+        query_param.update(get_select_query(select))
     try:
         resp = ome_obj.invoke_request('GET', uri, query_param=query_param)
         next_uri = resp.json_data.get("@odata.nextLink", None)
         report_list = resp.json_data.get("value")
         if query_param is not None:
-            for k, v in query_param.items():
-                query += "{0}={1}".format(k, v.replace(" ", "%20"))
+            query = "&".join("{0}={1}".format(k, v.replace(" ", "%20")) for k, v in query_param.items())
         while next_uri is not None:
             next_uri_query = "{0}&{1}".format(next_uri.strip("/api"), query) if query else next_uri.strip("/api")
             resp = ome_obj.invoke_request('GET', next_uri_query)
@@ -374,7 +433,51 @@ def get_all_data_with_pagination(ome_obj, uri, query_param=None):
             next_uri = resp.json_data.get("@odata.nextLink", None)
     except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
         raise err
-    return {"resp_obj": resp, "report_list": report_list}
+    return {"resp_obj": resp, "report_list": project_items(report_list, select)}
+
+
+def chunk_filter_clauses(clauses, max_length=DEVICE_FILTER_MAX_LENGTH):
+    """
+    Joins the filter clauses with 'or' into as few $filter values as possible while the
+    url encoded length of every value stays within max_length.
+    :return: list of tuples, the $filter value and the number of clauses in it
+    """
+    chunks, chunk, length = [], [], 0
+    for clause in clauses:
+        clause_length = len(quote(clause)) + len(quote(" or "))
+        if chunk and length + clause_length > max_length:
+            chunks.append((" or ".join(chunk), len(chunk)))
+            chunk, length = [], 0
+        chunk.append(clause)
+        length += clause_length
+    if chunk:
+        chunks.append((" or ".join(chunk), len(chunk)))
+    return chunks
+
+
+def get_devices_by_service_tags(rest_obj, service_tags, select=None):
+    """
+    Looks up the devices of the service tags with batched $filter requests, so only the
+    requested devices are read instead of the whole device collection.
+    :param rest_obj: RestOME object
+    :param service_tags: list of service tags
+    :param select: (optional) list of device attributes to request, DeviceServiceTag is always included
+    :return: dict, service tag to the device details, service tags which are not found are not included
+    """
+    pending = list(dict.fromkeys(str(tag) for tag in service_tags))
+    if select and "DeviceServiceTag" not in select:
+        select = list(select) + ["DeviceServiceTag"]
+    clauses = ["DeviceServiceTag eq '{0}'".format(tag.replace("'", "''")) for tag in pending]
+    devices = {}
+    for query, count in chunk_filter_clauses(clauses):
+        query_param = {"$filter": query, "$top": count}
+        query_param.update(get_select_query(select))
+        resp = rest_obj.invoke_request('GET', OME_DEVICES_URI, query_param=query_param)
+        for device in project_items(resp.json_data.get("value", []), select):
+            tag = device.get("DeviceServiceTag")
+            if tag in pending and tag not in devices:
+                devices[tag] = device
+    return devices
 
 
 def remove_key(data, regex_pattern='@odata.'):
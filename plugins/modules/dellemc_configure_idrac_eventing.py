@@ -188,6 +188,7 @@ import tempfile
 import json
 from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac import iDRACConnection, idrac_auth_params
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 try:
@@ -339,4 +340,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -225,6 +225,7 @@ import tempfile
 import json
 from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac import iDRACConnection
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 
@@ -391,4 +392,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
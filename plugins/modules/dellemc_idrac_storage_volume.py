@@ -254,6 +254,7 @@ import tempfile
 import copy
 from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac import iDRACConnection, idrac_auth_params
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 try:
     from omdrivers.types.iDRAC.RAID import RAIDactionTypes, RAIDdefaultReadPolicyTypes, RAIDinitOperationTypes, \
         DiskCachePolicyTypes, RAIDresetConfigTypes
@@ -503,4 +504,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -265,6 +265,7 @@ from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, idrac_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_manager_res_id
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 
 
 SUCCESS_MSG = "Successfully updated the attributes."
@@ -373,11 +374,11 @@ def get_response_attr(idrac, idrac_id, attr, uri_dict):
 def get_attributes_registry(idrac):
     reggy = {}
     try:
-        resp = idrac.invoke_request("/redfish/v1/Registries/ManagerAttributeRegistry", "GET")
+        resp = idrac.invoke_cached_request("/redfish/v1/Registries/ManagerAttributeRegistry")
         loc_list = resp.json_data.get("Location", [])
         if loc_list:
             reg_json_uri = loc_list[-1].get("Uri")
-            reg_resp = idrac.invoke_request(reg_json_uri, "GET")
+            reg_resp = idrac.invoke_cached_request(reg_json_uri)
             attr_list = reg_resp.json_data.get("RegistryEntries").get("Attributes")
             reggy = dict((x["AttributeName"], x) for x in attr_list)
     except Exception:
@@ -503,7 +504,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with iDRACRedfishAPI(module.params, req_session=True) as idrac:
+        with iDRACRedfishAPI(module.params, req_session=True, socket_path=module._socket_path) as idrac:
             res_id = module.params.get('resource_id')
             if not res_id:
                 res_id = get_manager_res_id(idrac)
@@ -520,4 +521,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
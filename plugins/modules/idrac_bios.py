@@ -357,6 +357,7 @@ from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac import iDRACConnection, idrac_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import idrac_redfish_job_tracking, \
     strip_substr_dict
 
@@ -608,7 +609,7 @@ def clear_pending_bios(module, redfish_obj):
 def get_attributes_registry(idrac):
     reggy = {}
     try:
-        resp = idrac.invoke_request(BIOS_REGISTRY, "GET")
+        resp = idrac.invoke_cached_request(BIOS_REGISTRY)
         attr_list = resp.json_data.get("RegistryEntries").get("Attributes")
         reggy = dict((x["AttributeName"], x) for x in attr_list)
     except Exception:
@@ -808,7 +809,7 @@ def main():
                     failed = True
             module.exit_json(msg=msg, changed=changed, failed=failed)
         else:
-            with iDRACRedfishAPI(module.params, req_session=True) as redfish_obj:
+            with iDRACRedfishAPI(module.params, req_session=True, socket_path=module._socket_path) as redfish_obj:
                 if module.params.get("clear_pending"):
                     clear_pending_bios(module, redfish_obj)
                 if module.params.get("reset_bios"):
@@ -827,4 +828,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -269,6 +269,7 @@ from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import (s
                                                                                get_system_res_id,
                                                                                wait_for_idrac_job_completion)
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 
 SYSTEM_URI = "/redfish/v1/Systems"
 BOOT_OPTIONS_URI = "/redfish/v1/Systems/{0}/BootOptions?$expand=*($levels=1)"
@@ -529,7 +530,7 @@ def main():
         supports_check_mode=True,
     )
     try:
-        with iDRACRedfishAPI(module.params, req_session=True) as idrac:
+        with iDRACRedfishAPI(module.params, req_session=True, socket_path=module._socket_path) as idrac:
             res_id = module.params.get("resource_id")
             if not res_id:
                 res_id, error_msg = get_system_res_id(idrac)
@@ -560,4 +561,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
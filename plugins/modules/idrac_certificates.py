@@ -216,6 +216,7 @@ import base64
 import os
 from datetime import datetime
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, idrac_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -499,7 +500,7 @@ def main():
         supports_check_mode=True)
 
     try:
-        with iDRACRedfishAPI(module.params) as idrac:
+        with iDRACRedfishAPI(module.params, socket_path=module._socket_path) as idrac:
             certype = certype_map.get(module.params.get('certificate_type'))
             op = module.params.get('command')
             res_id = module.params.get('resource_id')
@@ -518,4 +519,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -239,6 +239,7 @@ from xml.etree import ElementTree as ET
 from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac import iDRACConnection, idrac_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.parse import urlparse
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
@@ -280,7 +281,7 @@ def wait_for_job_completion(module, job_uri, job_wait=False, reboot=False, apply
     while track_counter < 5:
         try:
             # For job_wait False return a valid response, try 5 times
-            with iDRACRedfishAPI(module.params) as redfish:
+            with iDRACRedfishAPI(module.params, socket_path=module._socket_path) as redfish:
                 response = redfish.invoke_request(job_uri, "GET")
             track_counter += 5
             msg = None
@@ -294,7 +295,7 @@ def wait_for_job_completion(module, job_uri, job_wait=False, reboot=False, apply
     track_counter = 0
     while job_wait and track_counter <= WAIT_COUNT:
         try:
-            with iDRACRedfishAPI(module.params) as redfish:
+            with iDRACRedfishAPI(module.params, socket_path=module._socket_path) as redfish:
                 response = redfish.invoke_request(job_uri, "GET")
                 job_state = response.json_data.get("JobState")
             msg = None
@@ -760,7 +761,7 @@ def main():
 
     redfish_check = False
     try:
-        with iDRACRedfishAPI(module.params) as obj:
+        with iDRACRedfishAPI(module.params, socket_path=module._socket_path) as obj:
             resp = obj.invoke_request(IDRAC_PATH, method="GET")
             software_service_data = resp.json_data
             redfish_check = True
@@ -777,7 +778,7 @@ def main():
             module.params['job_wait'] = True
         # Connect to iDRAC and update firmware
         if redfish_check:
-            with iDRACRedfishAPI(module.params) as redfish_obj:
+            with iDRACRedfishAPI(module.params, socket_path=module._socket_path) as redfish_obj:
                 status = update_firmware_redfish(redfish_obj, module, software_service_data)
         else:
             with iDRACConnection(module.params) as idrac:
@@ -798,4 +799,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
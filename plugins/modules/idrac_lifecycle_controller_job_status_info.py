@@ -101,6 +101,7 @@ from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac i
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 
 
 def main():
@@ -129,4 +130,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
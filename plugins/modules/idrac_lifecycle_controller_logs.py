@@ -134,11 +134,12 @@ error_info:
 """
 
 
-import socket
 import json
 import copy
 from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac import iDRACConnection, idrac_auth_params
+from ansible_collections.dellemc.openmanage.plugins.module_utils.host_resolver import is_ipv6_host
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 try:
@@ -184,8 +185,7 @@ def run_export_lc_logs(idrac, module):
                                                       creds=UserCredentials(module.params['share_user'],
                                                                             module.params['share_password']),
                                                       isFolder=True)
-    data = socket.getaddrinfo(module.params["idrac_ip"], module.params["idrac_port"])
-    if "AF_INET6" == data[0][0]._name_:
+    if is_ipv6_host(module.params["idrac_ip"], module.params["idrac_port"]):
         ip = copy.deepcopy(module.params["idrac_ip"])
         lclog_file_name_format = "{ip}_%Y%m%d_%H%M%S_LC_Log.log".format(ip=ip.replace(":", ".").replace("..", "."))
     lc_log_file = myshare.new_file(lclog_file_name_format)
@@ -227,4 +227,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
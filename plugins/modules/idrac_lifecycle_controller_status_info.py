@@ -89,6 +89,7 @@ from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac i
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 import json
 
 
@@ -115,4 +116,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -321,6 +321,7 @@ import time
 from urllib.error import HTTPError, URLError
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.compat.version import LooseVersion
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import (
@@ -720,7 +721,7 @@ def main():
                                required_if=[["apply_time", "AtMaintenanceWindowStart", ("maintenance_window",)],
                                             ["apply_time", "InMaintenanceWindowOnReset", ("maintenance_window",)]],
                                supports_check_mode=True)
-        with iDRACRedfishAPI(module.params, req_session=True) as idrac:
+        with iDRACRedfishAPI(module.params, req_session=True, socket_path=module._socket_path) as idrac:
             if module_attribute := module.params.get('network_attributes'):
                 network_attr_obj = NetworkAttributes(idrac, module)
             else:
@@ -745,4 +746,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -96,6 +96,7 @@ boot_status:
 import os
 from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac import iDRACConnection, idrac_auth_params
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 try:
     from omsdk.sdkfile import FileOnShare
     from omsdk.sdkcreds import UserCredentials
@@ -163,4 +164,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -522,6 +522,7 @@ import json
 from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish, redfish_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import wait_for_job_completion, strip_substr_dict
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
@@ -1026,7 +1027,7 @@ def main():
         validate_inputs(module)
     try:
         command = module.params["command"]
-        with Redfish(module.params, req_session=True) as redfish_obj:
+        with Redfish(module.params, req_session=True, socket_path=module._socket_path) as redfish_obj:
             if command == "ResetConfig":
                 resp, job_uri, job_id = ctrl_reset_config(module, redfish_obj)
             elif command == "SetControllerKey" or command == "ReKey" or \
@@ -1099,4 +1100,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
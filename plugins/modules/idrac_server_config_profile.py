@@ -528,6 +528,7 @@ import json
 from datetime import datetime
 from os.path import exists
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, idrac_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import idrac_redfish_job_tracking, \
     strip_substr_dict
@@ -940,7 +941,7 @@ def main():
         http_share = False
         if module.params.get("share_name") is not None:
             http_share = module.params["share_name"].lower().startswith(('http://', 'https://'))
-        with iDRACRedfishAPI(module.params) as idrac:
+        with iDRACRedfishAPI(module.params, socket_path=module._socket_path) as idrac:
             validate_scp_components(module, idrac)
             command = module.params['command']
             if command == 'import':
@@ -1005,4 +1006,4 @@ def get_argument_spec():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -211,6 +211,7 @@ from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, idrac_auth_params
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 
 
 ACCOUNT_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Accounts/"
@@ -418,7 +419,7 @@ def main():
         supports_check_mode=True)
     try:
         validate_input(module)
-        with iDRACRedfishAPI(module.params, req_session=True) as idrac:
+        with iDRACRedfishAPI(module.params, req_session=True, socket_path=module._socket_path) as idrac:
             user_attr, slot_uri, slot_id, empty_slot_id, empty_slot_uri = get_user_account(module, idrac)
             if module.params["state"] == "present":
                 response, message = create_or_modify_account(module, idrac, slot_uri, slot_id, empty_slot_id,
@@ -446,4 +447,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
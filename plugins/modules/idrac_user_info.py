@@ -118,6 +118,7 @@ from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, idrac_auth_params
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict
 
 
@@ -202,7 +203,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with iDRACRedfishAPI(module.params, req_session=True) as idrac:
+        with iDRACRedfishAPI(module.params, req_session=True, socket_path=module._socket_path) as idrac:
             resp = []
             msg = SUCCESSFUL_MSG
             accounts_uri = get_accounts_uri(idrac)
@@ -229,4 +230,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
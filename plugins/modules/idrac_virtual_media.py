@@ -219,6 +219,7 @@ from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, idrac_auth_params
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 
 MANAGER_BASE = "/redfish/v1/Managers/iDRAC.Embedded.1/VirtualMedia"
 SYSTEM_BASE = "/redfish/v1/Systems/System.Embedded.1/VirtualMedia"
@@ -444,7 +445,7 @@ def main():
     specs.update(idrac_auth_params)
     module = AnsibleModule(argument_spec=specs, supports_check_mode=True)
     try:
-        with iDRACRedfishAPI(module.params, req_session=True) as idrac:
+        with iDRACRedfishAPI(module.params, req_session=True, socket_path=module._socket_path) as idrac:
             vr_media = module.params["virtual_media"]
             vr_members, vr_id, rd_version = get_virtual_media_info(idrac)
             if (len(vr_media) > len(vr_members) and vr_id == "system") or \
@@ -465,4 +466,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
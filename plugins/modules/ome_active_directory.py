@@ -242,6 +242,7 @@ import json
 import os
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -428,7 +429,7 @@ def main():
         mutually_exclusive=[('name', 'id')],
         supports_check_mode=True)
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             ad, ad_cnt = get_ad(module, rest_obj)
             if module.params.get('state') == 'present':
                 if ad:
@@ -454,4 +455,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -479,6 +479,7 @@ import csv
 import os
 import json
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination, strip_substr_dict
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
@@ -619,7 +620,7 @@ def get_target_payload(module, rest_obj):
 
 
 def get_category_data_tree(rest_obj):
-    resp = rest_obj.invoke_request("GET", CATEGORY_URI)
+    resp = rest_obj.invoke_cached_request(CATEGORY_URI)
     cat_raw = resp.json_data.get("value", [])
     cat_dict = dict(
         (category.get("Name"),
@@ -634,7 +635,7 @@ def get_category_data_tree(rest_obj):
 
 
 def get_all_actions(rest_obj):
-    resp = rest_obj.invoke_request("GET", ACTIONS_URI)
+    resp = rest_obj.invoke_cached_request(ACTIONS_URI)
     actions = resp.json_data.get("value", [])
     cmp_actions = dict((x.get("Name"), {"Id": x.get("Id"),
                                         "Disabled": x.get("Disabled"),
@@ -1094,7 +1095,7 @@ def main():
                             ('message_ids', 'message_file', 'category',)],
         supports_check_mode=True)
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             state = module.params.get('state')
             name_list = list(set(module.params.get('name')))
             policies = get_alert_policies(rest_obj, name_list)
@@ -1111,4 +1112,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -254,6 +254,7 @@ msg:
 
 import json
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import remove_key
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
@@ -272,7 +273,7 @@ def main():
         argument_spec=specs,
         supports_check_mode=True)
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             actions_info = get_all_data_with_pagination(rest_obj, ACTIONS_URI)
             if not actions_info.get("report_list", []):
                 module.exit_json(msg=EMPTY_ALERT_POLICY_ACTION_MSG, actions=[])
@@ -287,4 +288,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
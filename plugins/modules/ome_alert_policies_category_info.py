@@ -279,6 +279,7 @@ error_info:
 
 import json
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -301,7 +302,7 @@ def main():
         argument_spec=specs,
         supports_check_mode=True)
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             categories = get_formatted_categories(rest_obj)
             module.exit_json(msg=SUCCESS_MSG, categories=categories)
     except HTTPError as err:
@@ -313,4 +314,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_module(main)
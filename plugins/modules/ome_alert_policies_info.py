@@ -130,6 +130,7 @@ error_info:
 
 import json
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import remove_key
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
@@ -171,7 +172,7 @@ class OMEAlertPolicyInfo:
 
     def perform_module_operation(self) -> None:
         try:
-            with RestOME(self.module.params, req_session=True) as rest_obj:
+            with RestOME(self.module.params, req_session=True, socket_path=self.module._socket_path) as rest_obj:
                 result = self.get_alert_policy_info(rest_obj)
                 self.module.exit_json(msg=result['msg'], policies=result['value'])
         except HTTPError as err:
@@ -198,4 +199,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -106,6 +106,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import remove_key, get_all_data_with_pagination
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
@@ -123,7 +124,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             message_id_info = get_all_data_with_pagination(rest_obj, ALERT_MESSAGE_URI)
             if not message_id_info.get("report_list", []):
                 module.exit_json(msg=EMPTY_MSG, message_ids=[])
@@ -138,4 +139,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
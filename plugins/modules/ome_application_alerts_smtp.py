@@ -140,6 +140,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -242,7 +243,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             curr_resp = fetch_smtp_settings(rest_obj)
             payload = update_payload(module, curr_resp)
             diff = _diff_payload(curr_resp, payload)
@@ -262,4 +263,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -153,6 +153,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -239,7 +240,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             input_config = validate_input(module)
             current_list = get_current_syslog(rest_obj)
             payload = compare_get_payload(module, current_list, input_config)
@@ -257,4 +258,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -160,6 +160,7 @@ error_info:
 import json
 import os
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -220,7 +221,7 @@ def main():
     )
     header = {"Content-Type": "application/octet-stream", "Accept": "application/octet-stream"}
     try:
-        with RestOME(module.params, req_session=False) as rest_obj:
+        with RestOME(module.params, req_session=False, socket_path=module._socket_path) as rest_obj:
             method, uri, payload = get_resource_parameters(module)
             command = module.params.get("command")
             dump = False if command == "upload" else True
@@ -242,4 +243,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -365,6 +365,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -640,7 +641,7 @@ def main():
 
     try:
         _validate_params(module)
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             job = job_details(rest_obj)
             job_payload, schedule = create_job(module)
             curr_resp = fetch_cp_settings(rest_obj)
@@ -666,4 +667,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -427,6 +427,7 @@ import json
 import socket
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
@@ -726,7 +727,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             validate_input(module)
             ipv4_payload, ipv6_payload, dns_payload, vlan_payload = get_payload(module)
             updated_payload, rest_method, uri = get_updated_payload(
@@ -748,4 +749,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_module(main)
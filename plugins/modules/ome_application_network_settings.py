@@ -251,6 +251,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -362,7 +363,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             curr_resp = fetch_session_inactivity_settings(rest_obj)
             payload, diff = update_payload(module, curr_resp)
             process_check_mode(module, diff)
@@ -381,4 +382,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -140,6 +140,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
@@ -243,7 +244,7 @@ def main():
     )
     try:
         validate_input(module)
-        with RestOME(module.params, req_session=False) as rest_obj:
+        with RestOME(module.params, req_session=False, socket_path=module._socket_path) as rest_obj:
             validate_time_zone(module, rest_obj)
             payload = get_payload(module)
             updated_payload = get_updated_payload(rest_obj, module, payload)
@@ -261,4 +262,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_module(main)
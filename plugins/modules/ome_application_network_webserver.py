@@ -115,6 +115,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
@@ -171,7 +172,7 @@ def main():
 
     port_change = False
     try:
-        with RestOME(module.params, req_session=False) as rest_obj:
+        with RestOME(module.params, req_session=False, socket_path=module._socket_path) as rest_obj:
             updated_payload, port_change = get_updated_payload(rest_obj, module)
             msg = "Successfully updated network web server configuration."
             resp = rest_obj.invoke_request("PUT", WEBSERVER_CONFIG, data=updated_payload)
@@ -193,4 +194,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_module(main)
@@ -203,6 +203,7 @@ import json
 import time
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -343,7 +344,7 @@ def main():
         supports_check_mode=True)
 
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             if module.params.get("fips_mode_enable") is not None:
                 fips_mode_enable(module, rest_obj)
             else:
@@ -357,4 +358,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -255,9 +255,11 @@ import json
 import time
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import multi_job_tracking
 from ansible.module_utils.common.dict_transformations import recursive_diff
 
 DEVICE_URI = "DeviceService/Devices"
@@ -382,36 +384,16 @@ def start_slot_name_jobs(rest_obj, slot_data):
 
 def get_job_states(module, rest_obj, slot_data):
     job_dict = dict([(slot['JobId'], k) for k, slot in slot_data.items() if slot['JobId']])
-    query_params = {"$filter": "JobType/Id eq 3"}  # optimize this
-    count = JOB_TIMEOUT // SETTLING_TIME
-    job_incomplete = [2050, 2030, 2040, 2080]  # Running, Queued, Starting, New
-    while count > 0 and job_dict:
-        try:
-            job_resp = rest_obj.invoke_request("GET", JOB_URI, query_param=query_params)
-            jobs = job_resp.json_data.get('value')
-        except HTTPError:
-            count = count - 50  # 3 times retry for HTTP error
-            time.sleep(SETTLING_TIME)
-            continue
-        job_over = []
-        for job in jobs:
-            id = job.get('Id')
-            if id in job_dict:
-                lrs = job.get('LastRunStatus')
-                slot = slot_data[job_dict[id]]
-                if lrs.get('Id') in job_incomplete:  # Running, not failed, not completed state
-                    job_over.append(False)
-                elif lrs.get('Id') == 2060:
-                    job_over.append(True)
-                    slot['SlotName'] = slot.pop('new_name')
-                    job_dict.pop(id)
-                else:
-                    slot['JobStatus'] = lrs.get('Name')
-                    job_over.append(True)  # Failed states - job not running
-        if all(job_over) or not job_dict:
-            break
-        count = count - 1
-        time.sleep(SETTLING_TIME)
+    job_fail_states = [2020, 2070, 2090, 2100, 2101, 2102, 2103]  # not running and not completed
+    for job_id, job_failed, job_msg, job in multi_job_tracking(
+            rest_obj, list(job_dict), max_job_wait_sec=JOB_TIMEOUT, job_complete_states=(2060,),
+            job_fail_states=job_fail_states, initial_wait=0):
+        slot = slot_data[job_dict[job_id]]
+        if not job_failed:
+            slot['SlotName'] = slot.pop('new_name')
+            job_dict.pop(job_id)
+        elif job.get('LastRunStatus'):
+            slot['JobStatus'] = job['LastRunStatus'].get('Name')
     failed_jobs = dict([(k, slot_data.pop(k)) for k in job_dict.values()])
     return failed_jobs
 
@@ -468,9 +450,9 @@ def exit_slot_config(module, rest_obj, failed_jobs, invalid_jobs, slot_data):
         job_failed_list = []
         try:
             rfrsh_job_list = trigger_refresh_inventory(rest_obj, slot_data)
-            for job in rfrsh_job_list:
-                job_failed, job_message = rest_obj.job_tracking(
-                    job, job_wait_sec=JOB_TIMEOUT, sleep_time=JOB_INTERVAL)
+            for job, job_failed, job_message, job_dict in multi_job_tracking(
+                    rest_obj, rfrsh_job_list, max_job_wait_sec=JOB_TIMEOUT, sleep_interval_secs=JOB_INTERVAL,
+                    job_complete_states=(2060, 2020), job_fail_states=(2070, 2090, 2100, 2101, 2102, 2103)):
                 job_failed_list.append(job_failed)
             all_dv_rfrsh = trigger_all_inventory_task(rest_obj)
             job_failed, job_message = rest_obj.job_tracking(
@@ -587,7 +569,7 @@ def main():
     )
 
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             if module.params.get("slot_options"):
                 slot_data = slot_number_config(module, rest_obj)
             else:
@@ -608,4 +590,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
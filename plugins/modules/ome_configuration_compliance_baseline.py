@@ -292,6 +292,7 @@ import json
 import time
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -829,7 +830,7 @@ def main():
 
         supports_check_mode=True)
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             compliance_operation(module, rest_obj)
     except HTTPError as err:
         module.fail_json(msg=str(err), error_info=json.load(err))
@@ -840,4 +841,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
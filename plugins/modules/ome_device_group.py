@@ -276,9 +276,13 @@ error_info:
 """
 
 import json
+from bisect import bisect_right
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_index import get_device_index, \
+    find_indexed_devices
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 
@@ -357,27 +361,50 @@ def get_all_ips(ip_addresses, module):
     return ip_addresses_list
 
 
+def _get_ip_intervals(ip_addresses):
+    """
+    Converts the IP addresses, networks and ranges into sorted and merged integer intervals per IP version.
+    :returns: dict, IP version to a tuple of the list of interval starts and the list of interval ends
+    """
+    bounds = {}
+    for ip_formats in ip_addresses:
+        if isinstance(ip_formats, IPAddress):
+            first = last = int(ip_formats)
+        else:
+            first, last = ip_formats.first, ip_formats.last
+        bounds.setdefault(ip_formats.version, []).append((first, last))
+    intervals = {}
+    for version, ranges in bounds.items():
+        starts, ends = [], []
+        for first, last in sorted(ranges):
+            if ends and first <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], last)
+            else:
+                starts.append(first)
+                ends.append(last)
+        intervals[version] = (starts, ends)
+    return intervals
+
+
+def _ip_in_intervals(ome_ip, intervals):
+    starts, ends = intervals.get(ome_ip.version, ([], []))
+    pos = bisect_right(starts, int(ome_ip)) - 1
+    return pos >= 0 and int(ome_ip) <= ends[pos]
+
+
 def get_device_id_from_ip(ip_addresses, device_list, module):
     ip_map = dict(
         [(each_device["DeviceManagement"][0]["NetworkAddress"], each_device["Id"]) for each_device in device_list
          if each_device["DeviceManagement"]])
+    intervals = _get_ip_intervals(ip_addresses)
     device_id_list_map = {}
     for available_ip, device_id in ip_map.items():
-        for ip_formats in ip_addresses:
-            if isinstance(ip_formats, IPAddress):
-                try:
-                    ome_ip = IPAddress(available_ip)
-                except AddrFormatError:
-                    ome_ip = IPAddress(available_ip.replace(']', '').replace('[', ''))
-                if ome_ip == ip_formats:
-                    device_id_list_map.update({device_id: str(ip_formats)})
-            if not isinstance(ip_formats, IPAddress):
-                try:
-                    ome_ip = IPAddress(available_ip)
-                except AddrFormatError:
-                    ome_ip = IPAddress(available_ip.replace(']', '').replace('[', ''))
-                if ome_ip in ip_formats:
-                    device_id_list_map.update({device_id: str(ome_ip)})
+        try:
+            ome_ip = IPAddress(available_ip)
+        except AddrFormatError:
+            ome_ip = IPAddress(available_ip.replace(']', '').replace('[', ''))
+        if _ip_in_intervals(ome_ip, intervals):
+            device_id_list_map.update({device_id: str(ome_ip)})
     if len(device_id_list_map) == 0:
         module.fail_json(msg=IP_NOT_EXISTS)
     return device_id_list_map
@@ -387,7 +414,6 @@ def get_device_id(rest_obj, module):
     device_id_list = module.params.get("device_ids")
     device_tag_list = module.params.get("device_service_tags")
     ip_addresses = module.params.get("ip_addresses")
-    device_list = rest_obj.get_all_report_details(DEVICE_URI)
     invalid, each_device_list, each_tag_to_id = [], [], []
     if device_id_list or device_tag_list:
         if device_id_list:
@@ -396,11 +422,11 @@ def get_device_id(rest_obj, module):
         elif device_tag_list:
             key = "DeviceServiceTag"
             each_device_list = device_tag_list
-
+        device_map = find_indexed_devices(rest_obj, each_device_list, keys=(key,))
         for each in each_device_list:
-            each_device = list(filter(lambda d: d[key] in [each], device_list["report_list"]))
+            each_device = device_map.get(str(each))
             if key == "DeviceServiceTag" and each_device:
-                each_tag_to_id.append(each_device[0]["Id"])
+                each_tag_to_id.append(each_device["Id"])
             if not each_device:
                 invalid.append(str(each))
         if invalid:
@@ -411,7 +437,7 @@ def get_device_id(rest_obj, module):
             each_device_list = each_tag_to_id
     else:
         all_ips = get_all_ips(ip_addresses, module)
-        each_device_list = get_device_id_from_ip(all_ips, device_list["report_list"], module)
+        each_device_list = get_device_id_from_ip(all_ips, get_device_index(rest_obj).devices, module)
         key = "IPAddresses"
     return each_device_list, key
 
@@ -498,7 +524,7 @@ def main():
     try:
         if module.params.get("ip_addresses") and not HAS_NETADDR:
             module.fail_json(msg=NETADDR_ERROR)
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             group_id = get_group_id(rest_obj, module)
             device_id, key = get_device_id(rest_obj, module)
             if module.params["state"] == "present":
@@ -522,4 +548,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
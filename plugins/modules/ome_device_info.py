@@ -3,7 +3,7 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 8.1.0
+# Version 8.5.0
 # Copyright (C) 2019-2023 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
@@ -57,6 +57,23 @@ options:
                     - For C(basic_inventory), it filters the collection of devices.
                       I(filter) query format should be aligned with OData standards.
                 type: str
+            select:
+                description:
+                    - For C(basic_inventory), the list of device attributes to return,
+                      for example C(Id) and C(DeviceServiceTag).
+                    - Only these attributes are requested from OpenManage Enterprise,
+                      which reduces the size of the response.
+                    - All the device attributes are returned when I(select) is not specified.
+                type: list
+                elements: str
+                version_added: 8.6.0
+    workers:
+        description:
+            - The number of devices for which the C(detailed_inventory) or C(subsystem_health) is fetched concurrently.
+            - The device information is returned in the same order irrespective of the number of I(workers).
+        type: int
+        default: 1
+        version_added: 8.6.0
 
 requirements:
     - "python >= 3.8.6"
@@ -87,6 +104,19 @@ EXAMPLES = """
     system_query_options:
       filter: "Id eq 33333 or Id eq 11111"
 
+- name: Retrieve the ID, service tag, and management address of all devices
+  dellemc.openmanage.ome_device_info:
+    hostname: "192.168.0.1"
+    username: "username"
+    password: "password"
+    ca_path: "/path/to/ca_cert.pem"
+    fact_subset: "basic_inventory"
+    system_query_options:
+      select:
+        - Id
+        - DeviceServiceTag
+        - DeviceManagement
+
 - name: Retrieve inventory details of specified devices identified by IDs 11111 and 22222
   dellemc.openmanage.ome_device_info:
     hostname: "192.168.0.1"
@@ -126,6 +156,20 @@ EXAMPLES = """
         - MXL4567
       inventory_type: "serverDeviceCards"
 
+- name: Retrieve inventory details of several devices, eight devices at a time
+  dellemc.openmanage.ome_device_info:
+    hostname: "192.168.0.1"
+    username: "username"
+    password: "password"
+    ca_path: "/path/to/ca_cert.pem"
+    fact_subset: "detailed_inventory"
+    workers: 8
+    system_query_options:
+      device_id:
+        - 11111
+        - 22222
+        - 33333
+
 - name: Retrieve subsystem health of specified devices identified by service tags
   dellemc.openmanage.ome_device_info:
     hostname: "192.168.0.1"
@@ -195,9 +239,12 @@ device_info:
 '''
 
 from ssl import SSLError
+from concurrent.futures import ThreadPoolExecutor
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination, \
+    get_devices_by_service_tags
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
@@ -218,23 +265,18 @@ DEVICE_RESOURCE_COLLECTION = {
 
 def update_device_details_with_filtering(missing_service_tags, service_tag_dict, rest_obj):
     """
-    This is a workaround solutions.
-    Use filtering query, in case fetching all report list fails for some reason.
-    Updates service_tag_dict if filtering request is success.
-    :param missing_service_tags:  Service tags which are unable to fetch from pagination request.
+    Looks up the missing service tags with batched filtering queries.
+    Updates service_tag_dict and removes the service tags which are found from missing_service_tags.
+    :param missing_service_tags:  Service tags for which the device id is not known.
     :param service_tag_dict: this contains device id mapping with tags
     :param rest_obj: ome connection object
     :return: None.
     """
     try:
-        for tag in missing_service_tags:
-            query = "DeviceServiceTag eq '{0}'".format(tag)
-            query_param = {"$filter": query}
-            resp = rest_obj.invoke_request('GET', DEVICE_RESOURCE_COLLECTION[DEVICE_LIST]["resource"], query_param=query_param)
-            value = resp.json_data["value"]
-            if value and value[0]["DeviceServiceTag"] == tag:
-                service_tag_dict.update({value[0]["Id"]: value[0]["DeviceServiceTag"]})
-                missing_service_tags.remove(tag)
+        devices = get_devices_by_service_tags(rest_obj, missing_service_tags, select=["Id", "DeviceServiceTag"])
+        for tag, device in devices.items():
+            service_tag_dict.update({device["Id"]: device["DeviceServiceTag"]})
+            missing_service_tags.remove(tag)
     except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
         raise err
 
@@ -247,13 +289,8 @@ def _get_device_id_from_service_tags(service_tags, rest_obj):
     :arg rest_obj: RestOME class object in case of request with session.
     :returns: dict eg: {1345:"MXL1245"}
     """
-    device_list = rest_obj.get_all_report_details(DEVICE_RESOURCE_COLLECTION[DEVICE_LIST]["resource"])["report_list"]
     service_tag_dict = {}
-    for item in device_list:
-        if item["DeviceServiceTag"] in service_tags:
-            service_tag_dict.update({item["Id"]: item["DeviceServiceTag"]})
-    available_service_tags = service_tag_dict.values()
-    missing_service_tags = list(set(service_tags) - set(available_service_tags))
+    missing_service_tags = list(dict.fromkeys(service_tags))
     update_device_details_with_filtering(missing_service_tags, service_tag_dict, rest_obj)
     device_fact_error_report.update(dict((tag, DESC_HTTP_ERROR) for tag in missing_service_tags))
     return service_tag_dict
@@ -318,6 +355,14 @@ def _get_query_parameters(module_params):
     return query_parameter
 
 
+def _get_select_attributes(module_params):
+    """Returns the list of device attributes to request for basic_inventory, None for all the attributes."""
+    system_query_options_param = module_params.get("system_query_options")
+    if system_query_options_param:
+        return system_query_options_param.get("select") or None
+    return None
+
+
 def _get_resource_parameters(module_params, rest_obj):
     """
     Identifies the resource path by different states
@@ -363,18 +408,51 @@ def _validate_inputs(module_params):
         _check_mutually_inclusive_arguments(fact_subset, module_params, ["device_id", "device_service_tag"])
 
 
+def _fetch_device_facts(rest_obj, device_facts, workers=1):
+    """
+    Fetches the resource path of every identifier in device_facts and replaces the path with the response,
+    or with the error of the request. Up to workers requests run concurrently, the order of the
+    identifiers is kept.
+    :returns: list of the status codes of the successful requests
+    """
+    requests = [(path_dict_map, identifier, path) for path_dict_map in device_facts.values()
+                for identifier, path in path_dict_map.items()]
+
+    def fetch(path):
+        try:
+            resp = rest_obj.invoke_request('GET', path)
+            return resp.json_data, resp.status_code
+        except HTTPError as err:
+            return str(err), None
+
+    paths = [path for path_dict_map, identifier, path in requests]
+    if workers > 1 and len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+            results = list(executor.map(fetch, paths))
+    else:
+        results = [fetch(path) for path in paths]
+    resp_status = []
+    for (path_dict_map, identifier, path), (data, status_code) in zip(requests, results):
+        path_dict_map[identifier] = data
+        if status_code is not None:
+            resp_status.append(status_code)
+    return resp_status
+
+
 def main():
     system_query_options = {"type": 'dict', "required": False, "options": {
         "device_id": {"type": 'list', "elements": 'int'},
         "device_service_tag": {"type": 'list', "elements": 'str'},
         "inventory_type": {"type": 'str'},
         "filter": {"type": 'str', "required": False},
+        "select": {"type": 'list', "elements": 'str', "required": False},
     }}
 
     specs = {
         "fact_subset": {"required": False, "default": "basic_inventory",
                         "choices": ['basic_inventory', 'detailed_inventory', 'subsystem_health']},
         "system_query_options": system_query_options,
+        "workers": {"type": 'int', "default": 1},
     }
     specs.update(ome_auth_params)
     module = AnsibleModule(
@@ -385,13 +463,15 @@ def main():
 
     try:
         _validate_inputs(module.params)
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             device_facts = _get_resource_parameters(module.params, rest_obj)
             resp_status = []
             if device_facts.get("basic_inventory"):
                 query_param = _get_query_parameters(module.params)
+                select = _get_select_attributes(module.params)
                 if query_param is not None:
-                    device_report = get_all_data_with_pagination(rest_obj, device_facts["basic_inventory"], query_param)
+                    device_report = get_all_data_with_pagination(rest_obj, device_facts["basic_inventory"], query_param,
+                                                                 select=select)
                     if not device_report.get("report_list", []):
                         module.exit_json(msg="No devices present.", device_info=[])
                     device_facts = {"@odata.context": device_report["resp_obj"].json_data["@odata.context"],
@@ -399,7 +479,8 @@ def main():
                                     "value": device_report["report_list"]}
                     resp_status.append(device_report["resp_obj"].status_code)
                 else:
-                    device_report = rest_obj.get_all_report_details(DEVICE_RESOURCE_COLLECTION[DEVICE_LIST]["resource"])
+                    device_report = rest_obj.get_all_report_details(DEVICE_RESOURCE_COLLECTION[DEVICE_LIST]["resource"],
+                                                                    select=select)
                     device_facts = {"@odata.context": device_report["resp_obj"].json_data["@odata.context"],
                                     "@odata.count": len(device_report["report_list"]),
                                     "value": device_report["report_list"]}
@@ -407,15 +488,7 @@ def main():
                     if device_facts["@odata.count"] == 0:
                         module.exit_json(msg="No devices present.", device_info=[])
             else:
-                for identifier_type, path_dict_map in device_facts.items():
-                    for identifier, path in path_dict_map.items():
-                        try:
-                            resp = rest_obj.invoke_request('GET', path)
-                            data = resp.json_data
-                            resp_status.append(resp.status_code)
-                        except HTTPError as err:
-                            data = str(err)
-                        path_dict_map[identifier] = data
+                resp_status.extend(_fetch_device_facts(rest_obj, device_facts, max(module.params["workers"] or 1, 1)))
                 if any(device_fact_error_report):
                     if "device_service_tag" in device_facts:
                         device_facts["device_service_tag"].update(device_fact_error_report)
@@ -433,4 +506,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
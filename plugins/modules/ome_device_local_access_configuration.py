@@ -262,6 +262,7 @@ import socket
 import copy
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -461,7 +462,7 @@ def main():
                     module.params.get("lcd"), module.params.get("enable_kvm_access") is not None,
                     module.params.get("enable_chassis_direct_access") is not None]):
             module.fail_json(msg=CONFIG_FAIL_MSG)
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             check_domain_service(module, rest_obj)
             resp = get_device_details(rest_obj, module)
             resp_data = resp.json_data
@@ -480,4 +481,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
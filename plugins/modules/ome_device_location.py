@@ -154,6 +154,7 @@ import json
 import socket
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -285,7 +286,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             check_domain_service(module, rest_obj)
             resp = device_validation(module, rest_obj)
             module.exit_json(msg="Successfully updated the location settings.",
@@ -299,4 +300,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -371,6 +371,7 @@ import socket
 import copy
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -756,7 +757,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             validate_input(module)
             dvc = get_device_details(module, rest_obj)
             if dvc.get('Type') in [SERVER, CHASSIS, IO_MODULE]:
@@ -775,4 +776,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
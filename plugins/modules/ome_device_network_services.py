@@ -193,6 +193,7 @@ import json
 import socket
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -380,7 +381,7 @@ def main():
                 module.params.get("remote_racadm_settings")]):
         module.fail_json(msg=CONFIG_FAIL_MSG)
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             check_domain_service(module, rest_obj)
             resp = fetch_device_details(module, rest_obj)
             resp_data = resp.json_data
@@ -395,4 +396,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
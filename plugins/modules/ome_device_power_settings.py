@@ -169,6 +169,7 @@ import socket
 import copy
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -325,7 +326,7 @@ def main():
         if not any([module.params.get("power_configuration"), module.params.get("redundancy_configuration"),
                     module.params.get("hot_spare_configuration")]):
             module.fail_json(msg=CONFIG_FAIL_MSG)
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             check_domain_service(module, rest_obj)
             resp = fetch_device_details(module, rest_obj)
             module.exit_json(msg=SUCCESS_MSG, power_details=resp.json_data, changed=True)
@@ -338,4 +339,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
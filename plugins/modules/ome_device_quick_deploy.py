@@ -349,6 +349,7 @@ import json
 import socket
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -661,7 +662,7 @@ def main():
         for dep_opt in slot_options:
             ip_address_field(module, slot_field, dep_opt, slot=True)
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             check_domain_service(module, rest_obj)
             job_id, data = get_device_details(rest_obj, module)
             if job_id is not None and data is not None:
@@ -677,4 +678,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -230,11 +230,13 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict, job_tracking
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import CHANGES_MSG, NO_CHANGES_MSG
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_index import invalidate_device_index
 
 DEVICE_URI = "DeviceService/Devices"
 JOBS_URI = "JobService/Jobs"
@@ -296,6 +298,7 @@ def delete_devices(module, rest_obj, valid_ids):
         module.exit_json(msg=CHANGES_MSG, changed=True)
     payload = {"DeviceIds": list(valid_ids)}
     rest_obj.invoke_request('POST', DELETE_DEVICES_URI, data=payload)
+    invalidate_device_index(rest_obj)
     module.exit_json(msg=DELETE_SUCCESS, changed=True)
 
 
@@ -419,7 +422,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             if module.params.get("state") == 'present':
                 valids, invalids = get_dev_ids(module, rest_obj,
                                                device_type_map.get(module.params.get("device_action")))
@@ -441,4 +444,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -268,6 +268,7 @@ import json
 import re
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -446,7 +447,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             # checking the domain service
             if module.params["log_type"] == "application":
                 check_domain_service(module, rest_obj)
@@ -515,4 +516,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
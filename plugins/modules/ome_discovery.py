@@ -645,8 +645,10 @@ error_info:
 import json
 import time
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_poller import JobPoller
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.common.dict_transformations import snake_dict_to_camel_dict
@@ -772,15 +774,14 @@ def get_execution_details(rest_obj, job_id):
 
 
 def discovery_job_tracking(rest_obj, job_id, job_wait_sec):
-    sleep_interval = 30
-    max_retries = job_wait_sec // sleep_interval
     failed_job_status = [2070, 2100, 2101, 2102, 2103]
     success_job_status = [2060, 2020, 2090]
     job_url = (DISCOVERY_JOBS_URI + "({job_id})").format(job_id=job_id)
-    loop_ctr = 0
-    time.sleep(SETTLING_TIME)
-    while loop_ctr < max_retries:
-        loop_ctr += 1
+    poller = JobPoller(job_wait_sec, profile="discovery", initial_wait=SETTLING_TIME)
+    poller.start()
+    polls = 0
+    while not poller.expired:
+        polls += 1
         try:
             job_resp = rest_obj.invoke_request('GET', job_url)
             job_dict = job_resp.json_data
@@ -789,12 +790,12 @@ def discovery_job_tracking(rest_obj, job_id, job_wait_sec):
                 return JOB_TRACK_SUCCESS.format(JOB_STATUS_MAP[job_status])
             elif job_status in failed_job_status:
                 return JOB_TRACK_FAIL.format(JOB_STATUS_MAP[job_status])
-            time.sleep(sleep_interval)
+            poller.sleep(job_dict)
         except HTTPError:
             return JOB_TRACK_UNABLE.format(job_id)
         except Exception as err:
             return str(err)
-    return JOB_TRACK_INCOMPLETE.format(job_id, max_retries)
+    return JOB_TRACK_INCOMPLETE.format(job_id, polls)
 
 
 def get_job_data(discovery_json, rest_obj):
@@ -1068,7 +1069,7 @@ def main():
         supports_check_mode=False
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             discov_list = check_existing_discovery(module, rest_obj)
             if module.params.get('state') == 'absent':
                 if discov_list:
@@ -1090,4 +1091,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_module(main)
@@ -195,6 +195,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -352,7 +353,7 @@ def main():
         mutually_exclusive=[['directory_name', 'directory_id'], ],
         supports_check_mode=True)
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             if module.params["state"] == "present":
                 resp, msg = directory_user(module, rest_obj)
                 if isinstance(resp, list):
@@ -375,4 +376,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
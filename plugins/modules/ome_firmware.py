@@ -352,7 +352,10 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_index import get_device_index, \
+    find_indexed_devices
 from ansible.module_utils.urls import ConnectionError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 
@@ -472,17 +475,15 @@ def upload_dup_file(rest_obj, module):
 def get_device_ids(rest_obj, module, device_id_tags):
     """Getting the list of device ids filtered from the device inventory."""
     device_id = []
-    resp = rest_obj.get_all_report_details("DeviceService/Devices")
-    if resp.get("report_list"):
-        device_resp = dict([(str(device['Id']), device['DeviceServiceTag']) for device in resp["report_list"]])
-        device_tags = map(str, device_id_tags)
+    index = get_device_index(rest_obj)
+    if index.devices:
+        device_resp = dict([(str(device['Id']), device['DeviceServiceTag']) for device in index.devices])
+        device_tags = list(map(str, device_id_tags))
+        device_map = find_indexed_devices(rest_obj, device_tags)
         invalid_tags = []
         for tag in device_tags:
-            if tag in device_resp.keys():
-                device_id.append(tag)
-            elif tag in device_resp.values():
-                ids = list(device_resp.keys())[list(device_resp.values()).index(tag)]
-                device_id.append(ids)
+            if tag in device_map:
+                device_id.append(str(device_map[tag]['Id']))
             else:
                 invalid_tags.append(tag)
         if invalid_tags:
@@ -665,7 +666,7 @@ def main():
     validate_inputs(module)
     update_status, baseline_details = {}, None
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             if module.params.get("baseline_name"):
                 baseline_details = get_baseline_ids(rest_obj, module)
                 device_comp_map = get_device_component_map(rest_obj, module)
@@ -684,4 +685,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_module(main)
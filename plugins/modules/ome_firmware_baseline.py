@@ -316,7 +316,9 @@ GROUP_ID = 6000
 import json
 import time
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_index import find_indexed_devices
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.common.dict_transformations import recursive_diff
@@ -371,25 +373,21 @@ def get_catrepo_ids(module, cat_name, rest_obj):
 
 def get_dev_ids(module, rest_obj, param, devkey):
     paramlist = module.params[param]
-    resp_data = rest_obj.get_all_items_with_pagination("DeviceService/Devices")
-    values = resp_data["value"]
+    device_resp = find_indexed_devices(rest_obj, paramlist, keys=(devkey,), select=["Id", "Type", devkey])
     targets = []
-    if values:
-        devlist = values
-        device_resp = {device[devkey]: device for device in devlist}
-        for st in paramlist:
-            if st in device_resp:
-                djson = device_resp[st]
-                target = {}
-                device_type = {}
-                device_type['Id'] = djson['Type']
-                device_type['Name'] = "DEVICE"
-                target['Id'] = djson['Id']
-                target['Type'] = device_type
-                targets.append(target)
-            else:
-                module.fail_json(msg="Unable to complete the operation because the entered target"
-                                     " {0} '{1}' is invalid.".format(devkey, st))
+    for st in paramlist:
+        if str(st) in device_resp:
+            djson = device_resp[str(st)]
+            target = {}
+            device_type = {}
+            device_type['Id'] = djson['Type']
+            device_type['Name'] = "DEVICE"
+            target['Id'] = djson['Id']
+            target['Type'] = device_type
+            targets.append(target)
+        else:
+            module.fail_json(msg="Unable to complete the operation because the entered target"
+                                 " {0} '{1}' is invalid.".format(devkey, st))
     return targets
 
 
@@ -579,7 +577,7 @@ def main():
         supports_check_mode=True)
 
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             baseline_list = check_existing_baseline(module, rest_obj)
             if module.params.get('state') == 'absent':
                 if baseline_list:
@@ -601,4 +599,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
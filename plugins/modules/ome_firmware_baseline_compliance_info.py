@@ -226,7 +226,10 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_index import get_device_index, \
+    find_indexed_devices
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
@@ -250,14 +253,9 @@ def _get_device_id_from_service_tags(service_tags, rest_obj, module):
     :returns: dict eg: {1345:"MXL1245"}
     """
     try:
-        resp = rest_obj.get_all_report_details("DeviceService/Devices")
-        devices_list = resp["report_list"]
-        if devices_list:
-            service_tag_dict = {}
-            for item in devices_list:
-                if item["DeviceServiceTag"] in service_tags:
-                    service_tag_dict.update({item["Id"]: item["DeviceServiceTag"]})
-            return service_tag_dict
+        if get_device_index(rest_obj).devices:
+            devices = find_indexed_devices(rest_obj, service_tags, keys=("DeviceServiceTag",))
+            return dict((item["Id"], item["DeviceServiceTag"]) for item in devices.values())
         else:
             module.exit_json(msg="Unable to fetch the device information.", baseline_compliance_info=[])
     except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
@@ -400,7 +398,7 @@ def main():
     )
     try:
         validate_inputs(module)
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             baseline_name = module.params.get("baseline_name")
             if baseline_name is not None:
                 data = get_baseline_compliance_reports(rest_obj, module)
@@ -417,4 +415,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -102,6 +102,7 @@ baseline_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
@@ -130,7 +131,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=False) as rest_obj:
+        with RestOME(module.params, req_session=False, socket_path=module._socket_path) as rest_obj:
             baseline_name = module.params.get("baseline_name")
             resp = rest_obj.invoke_request('GET', "UpdateService/Baselines")
             data = resp.json_data
@@ -152,4 +153,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
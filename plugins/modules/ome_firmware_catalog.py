@@ -355,6 +355,7 @@ import time
 import os
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import remove_key
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
@@ -637,7 +638,7 @@ def main():
         supports_check_mode=True)
 
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             state = module.params['state']
             validate_names(state, module)
             requested_catalog_list, all_catalog = check_existing_catalog(module, rest_obj, state)
@@ -654,4 +655,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
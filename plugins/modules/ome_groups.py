@@ -195,6 +195,7 @@ import json
 import time
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -428,7 +429,7 @@ def main():
             group_set = set(str(v).lower() for v in module.params.get('group_id'))
         if len(group_set) != 1 and module.params['state'] == 'present':
             module.fail_json(msg=MULTIPLE_GROUPS_MSG)
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             valid_group_dict, parent, static_root = get_valid_groups(module, rest_obj, group_arg, group_set)
             if module.params["state"] == "absent":
                 if valid_group_dict:
@@ -449,4 +450,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
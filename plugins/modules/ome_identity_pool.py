@@ -264,6 +264,7 @@ import codecs
 import binascii
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.urls import ConnectionError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
@@ -581,7 +582,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             state = module.params["state"]
             if state == "present":
                 message = pool_create_modify(module, rest_obj)
@@ -600,4 +601,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_module(main)
@@ -293,6 +293,7 @@ job_info:
 
 import json
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict, remove_key
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
@@ -371,7 +372,7 @@ def main():
     )
 
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             resp_status = []
             if module.params.get("job_id") is not None:
                 # Fetch specific job
@@ -419,4 +420,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
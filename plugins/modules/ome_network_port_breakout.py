@@ -127,6 +127,7 @@ import json
 import re
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -263,7 +264,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             device_id = get_device_id(module, rest_obj)
             breakout_config, breakout_capability, interface_id = get_port_information(module, rest_obj, device_id)
             breakout_status = set_breakout(module, rest_obj, breakout_config,
@@ -280,4 +281,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
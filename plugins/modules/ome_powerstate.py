@@ -158,6 +158,7 @@ job_status:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -262,7 +263,7 @@ def main():
         if module.params['device_id'] is None and module.params['device_service_tag'] is None:
             module.fail_json(msg="device_id and device_service_tag attributes should not be None.")
         job_status = {}
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             payload = get_device_resource(module, rest_obj)
             job_status = spawn_update_job(rest_obj, payload)
     except HTTPError as err:
@@ -274,4 +275,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
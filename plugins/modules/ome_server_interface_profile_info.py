@@ -155,6 +155,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -245,7 +246,7 @@ def main():
     if not any([module.params.get("device_id"), module.params.get("device_service_tag")]):
         module.fail_json(msg=CONFIG_FAIL_MSG)
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             check_domain_service(module, rest_obj)
             sip_info = get_sip_info(module, rest_obj)
             module.exit_json(msg=SUCCESS_MSG, server_profiles=sip_info)
@@ -259,4 +260,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -194,6 +194,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -406,7 +407,7 @@ def main():
                          ('nic_teaming', 'nic_configuration')],
         supports_check_mode=True)
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             service_tags = get_valid_service_tags(module, rest_obj)
             profiles = get_server_profiles(module, rest_obj, service_tags)
             apply_data = get_payload(module, rest_obj, profiles)
@@ -422,4 +423,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
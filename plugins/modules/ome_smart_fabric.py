@@ -180,6 +180,7 @@ error_info:
 import json
 import socket
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -719,7 +720,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             fabric_actions(rest_obj, module)
     except HTTPError as err:
         if err.code == 501:
@@ -732,4 +733,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_module(main)
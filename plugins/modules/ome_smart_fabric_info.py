@@ -571,6 +571,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -664,7 +665,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             if module.params.get("fabric_id") is not None:
                 fabric_id = module.params.get("fabric_id")
                 smart_fabric_info = get_smart_fabric_details_via_id(module, rest_obj, fabric_id)
@@ -696,4 +697,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
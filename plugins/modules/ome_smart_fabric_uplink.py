@@ -271,6 +271,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.common.dict_transformations import recursive_diff
@@ -515,7 +516,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             fabric_id, fabrics = get_item_id(rest_obj, module.params["fabric_name"], FABRIC_URI)
             if not fabric_id:
                 module.fail_json(msg="Fabric with name {0} does not exist.".format(module.params["fabric_name"]))
@@ -541,4 +542,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_module(main)
@@ -547,10 +547,12 @@ import json
 import time
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import apply_diff_key, job_tracking
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_index import find_indexed_devices
 
 
 TEMPLATES_URI = "TemplateService/Templates"
@@ -625,16 +627,16 @@ def get_device_ids(module, rest_obj):
     """Getting the list of device ids filtered from the device inventory."""
     target_ids = []
     if module.params.get('device_service_tag') or module.params.get('device_id'):
-        # device_list = get_group_devices_all(rest_obj, DEVICE_URI)
-        device_list = rest_obj.get_all_report_details(DEVICE_URI)['report_list']
+        device_id = module.params.get('device_id') or []
+        service_tags = module.params.get('device_service_tag') or []
+        device_list = find_indexed_devices(rest_obj, list(device_id) + list(service_tags),
+                                           select=["Id", "DeviceServiceTag"]).values()
         device_tag_id_map = dict([(device.get('DeviceServiceTag'), device.get('Id')) for device in device_list])
-        device_id = module.params.get('device_id')
         invalid_ids = set(device_id) - set(device_tag_id_map.values())
         if invalid_ids:
             fail_module(module, msg="Unable to complete the operation because the entered target device"
                                     " id(s) '{0}' are invalid.".format(",".join(list(map(str, set(invalid_ids))))))
         target_ids.extend(device_id)
-        service_tags = module.params.get('device_service_tag')
         invalid_tags = set(service_tags) - set(device_tag_id_map.keys())
         if invalid_tags:
             fail_module(module, msg="Unable to complete the operation because the entered target service"
@@ -647,7 +649,7 @@ def get_device_ids(module, rest_obj):
 
 
 def get_view_id(rest_obj, viewstr):
-    resp = rest_obj.invoke_request('GET', "TemplateService/TemplateViewTypes")
+    resp = rest_obj.invoke_cached_request("TemplateService/TemplateViewTypes")
     if resp.success and resp.json_data.get('value'):
         tlist = resp.json_data.get('value', [])
         for xtype in tlist:
@@ -658,7 +660,7 @@ def get_view_id(rest_obj, viewstr):
 
 
 def get_type_id_valid(rest_obj, typeid):
-    resp = rest_obj.invoke_request('GET', "TemplateService/TemplateTypes")
+    resp = rest_obj.invoke_cached_request("TemplateService/TemplateTypes")
     if resp.success and resp.json_data.get('value'):
         tlist = resp.json_data.get('value', [])
         for xtype in tlist:
@@ -1035,7 +1037,7 @@ def main():
 
     try:
         _validate_inputs(module)
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             path, payload, rest_method = _get_resource_parameters(module, rest_obj)
             resp = rest_obj.invoke_request(rest_method, path, data=payload)
             job_wait = module.params["job_wait"]
@@ -1079,4 +1081,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
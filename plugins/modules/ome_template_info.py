@@ -106,6 +106,7 @@ template_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -139,7 +140,7 @@ def main():
     )
     template_uri = "TemplateService/Templates"
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             query_param = None
             if module.params.get("template_id") is not None:
                 # Fetch specific template
@@ -165,4 +166,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -193,6 +193,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
@@ -430,7 +431,7 @@ def main():
         supports_check_mode=True
     )
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             untag_dict, tagged_dict = validate_vlans(module, rest_obj)
             payload = get_vlan_payload(module, rest_obj, untag_dict, tagged_dict)
             resp = rest_obj.invoke_request("POST", UPDATE_NETWORK_CONFIG, data=payload)
@@ -445,4 +446,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    run_module(main)
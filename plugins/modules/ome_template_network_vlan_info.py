@@ -134,6 +134,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
@@ -218,7 +219,7 @@ def main():
                            supports_check_mode=True)
     try:
         templates = []
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             # all_templates = True
             if module.params.get("template_id") or module.params.get("template_name"):
                 tmplt = get_template_details(module, rest_obj)
@@ -248,4 +249,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -154,6 +154,7 @@ user_status:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -247,7 +248,7 @@ def main():
 
     try:
         _validate_inputs(module)
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             method, path, payload = _get_resource_parameters(module, rest_obj)
             resp = rest_obj.invoke_request(method, path, data=payload)
             if resp.success:
@@ -259,4 +260,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -99,6 +99,7 @@ user_info:
 import json
 from ssl import SSLError
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, ome_auth_params
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -135,7 +136,7 @@ def main():
     account_uri = "AccountService/Accounts"
     query_param = None
     try:
-        with RestOME(module.params, req_session=True) as rest_obj:
+        with RestOME(module.params, req_session=True, socket_path=module._socket_path) as rest_obj:
             if module.params.get("account_id") is not None:
                 # Fetch specific account
                 account_id = module.params.get("account_id")
@@ -166,4 +167,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
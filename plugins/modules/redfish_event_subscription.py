@@ -199,6 +199,7 @@ import os
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish, redfish_auth_params
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 
@@ -299,7 +300,7 @@ def main():
 
     try:
         _validate_inputs(module)
-        with Redfish(module.params, req_session=True) as obj:
+        with Redfish(module.params, req_session=True, socket_path=module._socket_path) as obj:
             subscription = get_subscription(obj, module.params["destination"])
             if subscription:
                 if module.params["state"] == "present":
@@ -332,4 +333,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -142,10 +142,11 @@ error_info:
 
 import json
 import os
-import time
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish, redfish_auth_params
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_poller import JobPoller
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 
@@ -225,13 +226,15 @@ def firmware_update(obj, module):
     return update_status
 
 
-def wait_for_job_completion(module, job_uri, job_wait_timeout=900, interval=30):
+def wait_for_job_completion(module, job_uri, job_wait_timeout=900, interval=None):
     try:
-        with Redfish(module.params, req_session=False) as obj:
-            track_counter = 0
+        with Redfish(module.params, req_session=False, socket_path=module._socket_path) as obj:
+            poller = JobPoller(job_wait_timeout, profile="firmware", max_interval=interval)
             final_jobstatus = ""
             job_msg = ""
-            while track_counter <= job_wait_timeout:
+            last_job = None
+            while True:
+                response = None
                 try:
                     response = obj.invoke_request("GET", "{0}{1}".format(obj.root_uri, job_uri))
                     if response.json_data.get("PercentComplete") == 100 and response.json_data.get("JobState") == "Completed":
@@ -242,15 +245,16 @@ def wait_for_job_completion(module, job_uri, job_wait_timeout=900, interval=30):
                             final_jobstatus = JOBSTATUS_FAILED
                             job_msg = FAIL_JOB_MSG
                         break
-                    track_counter += interval
-                    time.sleep(interval)
+                    last_job = response.json_data
                 except (HTTPError, URLError):
-                    track_counter += interval
-                    time.sleep(interval)
+                    pass
+                if poller.expired:
+                    break
+                poller.sleep(response.json_data if response is not None else None)
             # TIMED OUT
             # when job is scheduled
             if not final_jobstatus:
-                if response.json_data.get("PercentComplete") == 0 and response.json_data.get("JobState") == "Starting":
+                if last_job and last_job.get("PercentComplete") == 0 and last_job.get("JobState") == "Starting":
                     final_jobstatus = JOBSTATUS_SCHEDULED
                     job_msg = SCHEDULE_JOB_MSG
                 # when job timed out
@@ -279,7 +283,7 @@ def main():
         module.fail_json(msg=missing_required_lib("urllib3"))
     try:
         message = "Failed to submit the firmware update task."
-        with Redfish(module.params, req_session=True) as obj:
+        with Redfish(module.params, req_session=True, socket_path=module._socket_path) as obj:
             status = firmware_update(obj, module)
             if status.success:
                 message = "Successfully submitted the firmware update task."
@@ -306,4 +310,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -149,6 +149,7 @@ from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import wait_for_redfish_reboot_job, \
     wait_for_redfish_job_complete, strip_substr_dict, MANAGER_JOB_ID_URI, RESET_UNTRACK, MANAGERS_URI, RESET_SUCCESS
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 
@@ -250,7 +251,7 @@ def wait_for_redfish_idrac_reset(module, redfish_obj, wait_time_sec, interval=30
             break
         except HTTPError as err:
             if err.getcode() == 401:
-                new_redfish_obj = Redfish(module.params, req_session=True)
+                new_redfish_obj = Redfish(module.params, req_session=True, socket_path=module._socket_path)
                 sid, token = require_session(new_redfish_obj, module)
                 redfish_obj.session_id = sid
                 redfish_obj._headers.update({"X-Auth-Token": token})
@@ -329,7 +330,7 @@ def main():
     if module.params["reboot_timeout"] <= 0:
         module.fail_json(msg=NEGATIVE_TIMEOUT_MESSAGE)
     try:
-        with Redfish(module.params, req_session=True) as redfish_obj:
+        with Redfish(module.params, req_session=True, socket_path=module._socket_path) as redfish_obj:
             preview_uri, reboot_uri, update_uri = get_rollback_preview_target(redfish_obj, module)
             job_status, failed_count, resetting = rollback_firmware(redfish_obj, module, preview_uri, reboot_uri, update_uri)
             if not job_status or (failed_count == len(job_status)):
@@ -355,4 +356,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
@@ -120,6 +120,7 @@ import re
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish, redfish_auth_params
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 
@@ -247,7 +248,7 @@ def main():
         argument_spec=specs,
         supports_check_mode=True)
     try:
-        with Redfish(module.params) as redfish_obj:
+        with Redfish(module.params, socket_path=module._socket_path) as redfish_obj:
             run_change_power_state(redfish_obj, module)
     except HTTPError as err:
         module.fail_json(msg=str(err), error_info=json.load(err))
@@ -260,4 +261,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
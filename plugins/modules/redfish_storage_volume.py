@@ -374,6 +374,7 @@ import copy
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish, redfish_auth_params
 from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import MANAGER_JOB_ID_URI, wait_for_redfish_reboot_job, \
@@ -898,7 +899,7 @@ def main():
     try:
         validate_inputs(module)
         validate_negative_job_time_out(module)
-        with Redfish(module.params, req_session=True) as session_obj:
+        with Redfish(module.params, req_session=True, socket_path=module._socket_path) as session_obj:
             fetch_storage_resource(module, session_obj)
             controller_id = module.params.get("controller_id")
             volume_id = module.params.get("volume_id")
@@ -936,4 +937,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    run_module(main)
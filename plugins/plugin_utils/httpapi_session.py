@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import base64
+import json
+from ansible.module_utils.common.text.converters import to_bytes, to_native, to_text
+from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.plugins.httpapi import HttpApiBase
+
+JSON_HEADERS = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+
+
+class SessionHttpApiBase(HttpApiBase):
+    """
+    Base of the HttpApi plugins which create an X-Auth-Token session once and forward the
+    module requests for the persistent connection. Subclasses set the session resource URIs.
+    """
+
+    session_uri = None
+    session_id_uri = None
+
+    def __init__(self, connection):
+        super(SessionHttpApiBase, self).__init__(connection)
+        self.session_id = None
+
+    def _session_payload(self, username, password):
+        return {'UserName': username, 'Password': password}
+
+    def login(self, username, password):
+        payload = json.dumps(self._session_payload(username, password))
+        try:
+            response, response_data = self.connection.send(self.session_uri, payload, method='POST',
+                                                           headers=JSON_HEADERS)
+        except HTTPError as err:
+            raise ConnectionError("Could not create the session: {0}".format(to_native(err)), code=err.code)
+        token = response.headers.get('X-Auth-Token')
+        if not token:
+            raise ConnectionError("Could not create the session")
+        self.session_id = json.loads(to_text(response_data.getvalue())).get("Id")
+        self.connection._auth = {'X-Auth-Token': token}
+
+    def logout(self):
+        if self.session_id is not None:
+            try:
+                self.connection.send(self.session_id_uri.format(Id=self.session_id), None, method='DELETE',
+                                     headers=JSON_HEADERS)
+            except HTTPError:
+                pass
+            self.session_id = None
+            self.connection._auth = None
+
+    def update_auth(self, response, response_text):
+        # the X-Auth-Token stored at login stays valid for the whole session
+        return None
+
+    def handle_httperror(self, exc):
+        if exc.code == 401 and self.connection._auth:
+            self.connection._auth = None
+            self.session_id = None
+            self.login(self.connection.get_option('remote_user'), self.connection.get_option('password'))
+            return True
+        # any other HTTP error is handed back to the module along with the response body
+        return exc
+
+    def send_request(self, data, path, method='GET', headers=None):
+        """
+        Sends a request with the session token of the persistent connection.
+        :arg data: base64 encoded request body or None
+        :arg path: absolute request path including the query string
+        :arg method: HTTP verb
+        :arg headers: (optional) Dictionary of HTTP Headers
+        :returns: dict with status, reason, headers and the base64 encoded body of the response
+        """
+        req_headers = dict(JSON_HEADERS)
+        req_headers.update(headers or {})
+        req_headers.pop('X-Auth-Token', None)
+        if data is not None:
+            data = base64.b64decode(to_bytes(data))
+        response, response_data = self.connection.send(path, data, method=method, headers=req_headers)
+        return {
+            "status": response.getcode(),
+            "reason": to_text(response.reason),
+            "headers": dict(response.headers.items()),
+            "body": to_text(base64.b64encode(response_data.getvalue())),
+        }
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from ansible.errors import AnsibleParserError
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible_collections.dellemc.openmanage.plugins.inventory.ome_inventory import InventoryModule
+from mock import MagicMock
+
+INVENTORY_PATH = 'ansible_collections.dellemc.openmanage.plugins.inventory.ome_inventory.'
+SOURCE = "ome_inventory.yml"
+GROUP_LINK = "/api/GroupService/Groups({0})/{1}"
+
+DEFAULT_OPTIONS = {
+    "hostname": "192.168.0.1", "username": "username", "password": "password", "port": 443,
+    "validate_certs": False, "ca_path": None, "timeout": 30, "ome_group_name": None, "host_vars": None,
+    "group_vars": None, "workers": 4, "bulk_device_query": False, "device_fields": [], "appliances": None,
+    "cache": False, "compose": {}, "groups": {}, "keyed_groups": [], "strict": False,
+    "leading_separator": True, "use_extra_vars": False,
+}
+
+
+def _group(group_id, name, parent_id, visible=True):
+    return {"Id": group_id, "Name": name, "ParentId": parent_id, "Visible": visible,
+            "AllLeafDevices@odata.navigationLink": GROUP_LINK.format(group_id, "AllLeafDevices"),
+            "SubGroups@odata.navigationLink": GROUP_LINK.format(group_id, "SubGroups")}
+
+
+def _device(device_id, *addresses, **fields):
+    device = {"Id": device_id, "DeviceName": "device{0}".format(device_id),
+              "DeviceServiceTag": "TAG{0}".format(device_id), "Identifier": "TAG{0}".format(device_id),
+              "DeviceManagement": [{"NetworkAddress": address, "MacAddress": "00:00"} for address in addresses]}
+    device.update(fields)
+    return device
+
+
+def _ome_data(prefix="192.168.0"):
+    """Group tree All Devices > Servers and a hidden group, with one device that has no address."""
+    devices = [_device(10, "{0}.10".format(prefix), Model="PowerEdge R740"),
+               _device(11, "[fe80::11]", "{0}.11".format(prefix), Model="PowerEdge R650"),
+               _device(12)]
+    groups = [_group(1, "All Devices", 0), _group(2, "Servers", 1), _group(3, "Hidden", 1, visible=False)]
+    return {
+        "GroupService/Groups": groups,
+        "GroupService/Groups(1)/SubGroups": groups[1:],
+        "GroupService/Groups(2)/SubGroups": [],
+        "GroupService/Groups(1)/AllLeafDevices": devices,
+        "GroupService/Groups(2)/AllLeafDevices": devices[:1],
+        "GroupService/Groups(3)/AllLeafDevices": devices[1:2],
+        "DeviceService/Devices": devices,
+    }
+
+
+def _ome_mock(data):
+    ome = MagicMock()
+
+    def invoke_request(method, path, query_param=None, **kwargs):
+        return MagicMock(json_data={"value": [dict(item) for item in data[path]]})
+
+    ome.invoke_request.side_effect = invoke_request
+    ome.get_all_report_details.side_effect = lambda uri, **kwargs: {"report_list": list(data[uri])}
+    return ome
+
+
+class TestOmeInventory(object):
+
+    @pytest.fixture
+    def options(self):
+        return dict(DEFAULT_OPTIONS)
+
+    @pytest.fixture
+    def ome_mock(self):
+        return _ome_mock(_ome_data())
+
+    @pytest.fixture
+    def rest_mock(self, mocker, ome_mock):
+        rest_mock = mocker.patch(INVENTORY_PATH + 'RestOME')
+        rest_mock.return_value.__enter__.return_value = ome_mock
+        return rest_mock
+
+    @pytest.fixture
+    def plugin(self, mocker, options):
+        plugin = InventoryModule()
+        plugin._cache = {}
+        mocker.patch.object(plugin, "_read_config_data", side_effect=lambda path: dict(
+            (key, val) for key, val in options.items() if val != DEFAULT_OPTIONS[key]))
+        mocker.patch.object(plugin, "get_option", side_effect=lambda key: options[key])
+        return plugin
+
+    def _parse(self, plugin, cache=True):
+        inventory = InventoryData()
+        plugin.parse(inventory, DataLoader(), SOURCE, cache=cache)
+        return inventory
+
+    @pytest.mark.parametrize("bulk_device_query", [False, True])
+    def test_group_tree_and_host_vars(self, plugin, options, rest_mock, bulk_device_query):
+        options.update(bulk_device_query=bulk_device_query, host_vars={"ansible_connection": "local"},
+                       group_vars={"Servers": {"region": "east"}})
+        inventory = self._parse(plugin)
+        assert rest_mock.call_count == 1
+        assert rest_mock.call_args[1] == {"req_session": True}
+        assert set(inventory.groups) == {"all", "ungrouped", "All Devices", "Servers"}
+        assert [group.name for group in inventory.groups["All Devices"].child_groups] == ["Servers"]
+        assert sorted(host.name for host in inventory.groups["All Devices"].hosts) == ["192.168.0.10", "192.168.0.11"]
+        assert [host.name for host in inventory.groups["Servers"].hosts] == ["192.168.0.10"]
+        assert inventory.groups["Servers"].vars == {"region": "east"}
+        host_vars = inventory.get_host("192.168.0.11").vars
+        assert host_vars["idrac_ip"] == host_vars["baseuri"] == host_vars["hostname"] == "192.168.0.11"
+        assert host_vars["ansible_connection"] == "local"
+        assert "ome_appliance" not in host_vars
+
+    def test_group_name(self, plugin, options, rest_mock):
+        options["ome_group_name"] = "servers"
+        inventory = self._parse(plugin)
+        assert set(inventory.groups) == {"all", "ungrouped", "Servers"}
+        assert [host.name for host in inventory.groups["Servers"].hosts] == ["192.168.0.10"]
+
+    def test_missing_credentials(self, plugin, options, rest_mock):
+        options["password"] = None
+        with pytest.raises(AnsibleParserError, match="The password of the OpenManage Enterprise appliance is required."):
+            self._parse(plugin)
+        assert not rest_mock.called
+
+    def test_cache_hit(self, plugin, options, rest_mock):
+        options["cache"] = True
+        plugin._cache[plugin.get_cache_key(SOURCE)] = {
+            "groups": [{"Id": 5, "Name": "Cached", "Visible": True}], "sub_groups": {},
+            "group_devices": {"5": ["192.168.0.50"]}, "device_vars": {}}
+        inventory = self._parse(plugin)
+        assert not rest_mock.called
+        assert [host.name for host in inventory.groups["Cached"].hosts] == ["192.168.0.50"]
+
+    @pytest.mark.parametrize("cache_option, cache, cached", [(True, True, True), (True, False, True),
+                                                             (False, True, False)])
+    def test_cache_miss_and_refresh(self, plugin, options, rest_mock, cache_option, cache, cached):
+        options["cache"] = cache_option
+        cache_key = plugin.get_cache_key(SOURCE)
+        if not cache:
+            # ansible-inventory --flush-cache fetches the inventory again and replaces the cached data
+            plugin._cache[cache_key] = {"groups": [{"Id": 5, "Name": "Cached", "Visible": True}]}
+        inventory = self._parse(plugin, cache=cache)
+        assert rest_mock.call_count == 1
+        assert "Cached" not in inventory.groups
+        assert (cache_key in plugin._cache) is cached
+        if cached:
+            assert plugin._cache[cache_key]["group_devices"]["2"] == ["192.168.0.10"]
+
+    def test_bulk_device_query_requests(self, plugin, options, rest_mock, ome_mock):
+        options.update(bulk_device_query=True, device_fields=["Model", "Id"])
+        self._parse(plugin)
+        assert ome_mock.get_all_report_details.call_count == 1
+        assert ome_mock.get_all_report_details.call_args[1]["select"] == [
+            "Id", "DeviceName", "DeviceServiceTag", "Identifier", "Model", "DeviceManagement"]
+        requests = [(each[0][1], each[1].get("query_param")) for each in ome_mock.invoke_request.call_args_list]
+        assert sorted(requests[1:]) == [("GroupService/Groups(1)/AllLeafDevices", {"$select": "Id"}),
+                                        ("GroupService/Groups(2)/AllLeafDevices", {"$select": "Id"})]
+
+    @pytest.mark.parametrize("bulk_device_query", [False, True])
+    def test_device_fields_and_constructed(self, plugin, options, rest_mock, bulk_device_query):
+        options.update(bulk_device_query=bulk_device_query, device_fields=["Model", "DeviceServiceTag"],
+                       compose={"service_tag": "DeviceServiceTag | lower"},
+                       groups={"r740": "Model == 'PowerEdge R740'"},
+                       keyed_groups=[{"key": "Model | replace(' ', '_')", "prefix": "model"}])
+        inventory = self._parse(plugin)
+        host_vars = inventory.get_host("192.168.0.10").vars
+        assert host_vars["Model"] == "PowerEdge R740"
+        assert host_vars["DeviceServiceTag"] == "TAG10"
+        assert host_vars["service_tag"] == "tag10"
+        assert "DeviceName" not in host_vars
+        assert [host.name for host in inventory.groups["r740"].hosts] == ["192.168.0.10"]
+        assert [host.name for host in inventory.groups["model_PowerEdge_R650"].hosts] == ["192.168.0.11"]
+        assert rest_mock.call_count == 1
+
+    def test_appliances_group_prefix(self, plugin, options, mocker):
+        options["appliances"] = [{"hostname": "ome1.example.com", "group_prefix": "dc1_", "ome_group_name": None},
+                                 {"hostname": "ome2.example.com", "password": "password2", "port": 8443}]
+        data = {"ome1.example.com": _ome_data("192.168.1"), "ome2.example.com": _ome_data("192.168.2")}
+        data["ome2.example.com"]["GroupService/Groups(2)/AllLeafDevices"].append(_device(13, "192.168.1.10"))
+
+        def rest_ome(module_params, req_session):
+            rest = MagicMock()
+            rest.__enter__.return_value = _ome_mock(data[module_params["hostname"]])
+            return rest
+        rest_mock = mocker.patch(INVENTORY_PATH + 'RestOME', side_effect=rest_ome)
+        inventory = self._parse(plugin)
+        module_params = sorted((each[0][0] for each in rest_mock.call_args_list), key=lambda each: each["hostname"])
+        assert module_params == [
+            {"hostname": "ome1.example.com", "username": "username", "password": "password", "port": 443,
+             "validate_certs": False, "timeout": 30},
+            {"hostname": "ome2.example.com", "username": "username", "password": "password2", "port": 8443,
+             "validate_certs": False, "timeout": 30}]
+        assert {"dc1_All Devices", "dc1_Servers", "All Devices", "Servers"} <= set(inventory.groups)
+        assert [group.name for group in inventory.groups["dc1_All Devices"].child_groups] == ["dc1_Servers"]
+        assert [host.name for host in inventory.groups["dc1_Servers"].hosts] == ["192.168.1.10"]
+        assert sorted(host.name for host in inventory.groups["Servers"].hosts) == ["192.168.1.10", "192.168.2.10"]
+        assert inventory.get_host("192.168.1.11").vars["ome_appliance"] == "ome1.example.com"
+        assert inventory.get_host("192.168.2.11").vars["ome_appliance"] == "ome2.example.com"
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import os
+import time
+import pytest
+from ansible_collections.dellemc.openmanage.plugins.module_utils.device_index import DeviceIndex, \
+    DeviceIndexCache, get_device_index, find_indexed_devices, invalidate_device_index
+from mock import MagicMock
+
+DEVICES = [{"Id": 11, "DeviceServiceTag": "TAG1", "DeviceManagement": [{"NetworkAddress": "192.168.0.11"}]},
+           {"Id": 12, "DeviceServiceTag": "TAG2", "DeviceManagement": [{"NetworkAddress": "[fe80::12]"}]}]
+
+
+class TestDeviceIndex(object):
+
+    @pytest.fixture
+    def rest_obj(self):
+        rest_obj = MagicMock(hostname="192.168.0.1", port=443, username="admin", _device_index=None)
+        rest_obj.get_all_report_details.return_value = {"report_list": [dict(each) for each in DEVICES]}
+        return rest_obj
+
+    @pytest.fixture
+    def cache_env(self, tmpdir, monkeypatch):
+        monkeypatch.setenv("OMAM_DEVICE_CACHE", "true")
+        monkeypatch.setenv("OMAM_DEVICE_CACHE_DIR", str(tmpdir))
+        return str(tmpdir)
+
+    def test_lookup(self):
+        index = DeviceIndex(DEVICES)
+        assert index.get(11)["DeviceServiceTag"] == "TAG1"
+        assert index.get("TAG2")["Id"] == 12
+        assert index.get("fe80::12", keys=("NetworkAddress",))["Id"] == 12
+        assert index.get("TAG2", keys=("Id",)) is None
+        found, missing = index.lookup([11, "TAG2", "TAG3"])
+        assert sorted(found.keys()) == ["11", "TAG2"]
+        assert missing == ["TAG3"]
+
+    def test_index_is_built_once(self, rest_obj, monkeypatch):
+        monkeypatch.delenv("OMAM_DEVICE_CACHE", raising=False)
+        index = get_device_index(rest_obj)
+        assert get_device_index(rest_obj) is index
+        assert len(index) == 2
+        assert rest_obj.get_all_report_details.call_count == 1
+        assert "select" in rest_obj.get_all_report_details.call_args[1]
+
+    def test_disk_cache_is_shared(self, rest_obj, cache_env):
+        get_device_index(rest_obj)
+        other = MagicMock(hostname="192.168.0.1", port=443, username="admin", _device_index=None)
+        index = get_device_index(other)
+        assert index.from_cache is True
+        assert index.get("TAG1")["Id"] == 11
+        other.get_all_report_details.assert_not_called()
+        assert all(os.stat(os.path.join(cache_env, each)).st_mode & 0o777 == 0o600 for each in os.listdir(cache_env))
+
+    def test_disk_cache_ttl(self, rest_obj, cache_env):
+        cache = DeviceIndexCache("192.168.0.1", 443, "admin", ttl=60)
+        cache.save(DeviceIndex(DEVICES, created=int(time.time()) - 120))
+        assert cache.load() is None
+        cache.save(DeviceIndex(DEVICES))
+        assert len(cache.load()) == 2
+        invalidate_device_index(rest_obj)
+        assert cache.load() is None
+
+    def test_refresh_on_miss(self, rest_obj, cache_env):
+        DeviceIndexCache("192.168.0.1", 443, "admin").save(DeviceIndex(DEVICES[:1]))
+        found = find_indexed_devices(rest_obj, ["TAG1", "TAG2"])
+        assert sorted(found.keys()) == ["TAG1", "TAG2"]
+        assert rest_obj.get_all_report_details.call_count == 1
+        assert DeviceIndexCache("192.168.0.1", 443, "admin").load().get("TAG2")["Id"] == 12
+
+    def test_find_devices_without_index(self, rest_obj, monkeypatch):
+        monkeypatch.delenv("OMAM_DEVICE_CACHE", raising=False)
+        rest_obj.find_devices.return_value = {"TAG1": DEVICES[0]}
+        assert find_indexed_devices(rest_obj, ["TAG1"], select=["Id"]) == {"TAG1": DEVICES[0]}
+        rest_obj.find_devices.assert_called_once_with(["TAG1"], keys=("Id", "DeviceServiceTag"), select=["Id"])
+        rest_obj.get_all_report_details.assert_not_called()
+        assert find_indexed_devices(rest_obj, ["192.168.0.11"], keys=("NetworkAddress",))["192.168.0.11"]["Id"] == 11
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import socket
+import pytest
+from ansible_collections.dellemc.openmanage.plugins.module_utils import host_resolver
+from ansible_collections.dellemc.openmanage.plugins.module_utils.host_resolver import resolve, is_ipv6, \
+    is_ipv6_host, is_ip_literal, normalize_ipv6, clear_resolver_cache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+IPV4_INFO = [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('192.168.0.1', 443))]
+IPV6_INFO = [(socket.AF_INET6, socket.SOCK_STREAM, 6, '', ('2001:db8::1', 443, 0, 0))]
+
+
+class TestHostResolver(object):
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        clear_resolver_cache()
+        yield
+        clear_resolver_cache()
+
+    def test_names_are_cached(self, mocker):
+        getaddrinfo = mocker.patch(MODULE_UTIL_PATH + 'host_resolver.socket.getaddrinfo', return_value=IPV4_INFO)
+        assert resolve("ome.example.com", 443) == IPV4_INFO
+        assert resolve("ome.example.com", 443) == IPV4_INFO
+        assert getaddrinfo.call_count == 1
+        resolve("ome.example.com", 8443)
+        assert getaddrinfo.call_count == 2
+
+    def test_cache_expiry(self, mocker, monkeypatch):
+        getaddrinfo = mocker.patch(MODULE_UTIL_PATH + 'host_resolver.socket.getaddrinfo', return_value=IPV4_INFO)
+        time_mock = mocker.patch(MODULE_UTIL_PATH + 'host_resolver.time.time', return_value=1000)
+        resolve("ome.example.com", 443)
+        time_mock.return_value = 1000 + host_resolver.DEFAULT_DNS_CACHE_TTL + 1
+        resolve("ome.example.com", 443)
+        assert getaddrinfo.call_count == 2
+        monkeypatch.setenv("OMAM_DNS_CACHE_TTL", "0")
+        clear_resolver_cache()
+        resolve("ome.example.com", 443)
+        resolve("ome.example.com", 443)
+        assert getaddrinfo.call_count == 4
+
+    def test_errors_are_not_cached(self, mocker):
+        getaddrinfo = mocker.patch(MODULE_UTIL_PATH + 'host_resolver.socket.getaddrinfo',
+                                   side_effect=[socket.gaierror("unknown"), IPV6_INFO])
+        with pytest.raises(socket.gaierror):
+            resolve("ome.example.com", 443)
+        assert is_ipv6_host("ome.example.com", 443) is True
+        assert getaddrinfo.call_count == 2
+
+    @pytest.mark.parametrize("host, expected", [
+        ("192.168.0.1", False), ("2001:db8::1", True), ("2001:DB8:0:0:0:0:0:1", True)])
+    def test_literal_addresses(self, host, expected):
+        assert is_ip_literal(host) is True
+        assert is_ipv6_host(host, 443) is expected
+
+    def test_literal_resolution(self, mocker, monkeypatch):
+        getaddrinfo = mocker.patch(MODULE_UTIL_PATH + 'host_resolver.socket.getaddrinfo', return_value=IPV6_INFO)
+        resolve("2001:db8::1", 443)
+        assert getaddrinfo.call_args[0][5] == socket.AI_NUMERICHOST
+        monkeypatch.setenv("OMAM_DNS_SKIP_LITERAL", "false")
+        resolve("2001:db8::1", 443)
+        assert getaddrinfo.call_args[0] == ("2001:db8::1", 443)
+        assert is_ip_literal("ome.example.com") is False
+
+    def test_helpers(self):
+        assert is_ipv6(IPV6_INFO) is True
+        assert is_ipv6(IPV4_INFO) is False
+        assert is_ipv6([]) is False
+        assert normalize_ipv6("2001:DB8:0:0:0:0:0:1") == "2001:db8::1"
+
+    def test_clients_share_resolution(self, mocker):
+        getaddrinfo = mocker.patch(MODULE_UTIL_PATH + 'host_resolver.socket.getaddrinfo', return_value=IPV6_INFO)
+        ome_obj = RestOME({"hostname": "ome.example.com", "username": "user", "password": "pwd", "port": 443})
+        RestOME({"hostname": "ome.example.com", "username": "other", "password": "pwd", "port": 443})
+        assert ome_obj.hostname == "[2001:db8::1]"
+        assert getaddrinfo.call_count == 1
+        idrac_obj = iDRACRedfishAPI({"idrac_ip": "2001:DB8::1", "idrac_user": "user", "idrac_password": "pwd",
+                                     "idrac_port": 443})
+        assert idrac_obj.ipaddress == "[2001:db8::1]"
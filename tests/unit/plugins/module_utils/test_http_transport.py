@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import base64
+import json
+import threading
+import pytest
+from ansible.module_utils.six.moves import BaseHTTPServer, http_client, socketserver
+from ansible.module_utils.connection import ConnectionError as PersistentConnectionError
+from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
+from ansible_collections.dellemc.openmanage.plugins.module_utils import http_transport
+from ansible_collections.dellemc.openmanage.plugins.module_utils.http_transport import keepalive_open_url, \
+    keepalive_enabled, get_connection_pool, close_all_pools, connection_open_url, HTTPConnectionPool
+from mock import MagicMock
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+    redirect_to = "/api/data"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, code, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, val in (headers or {}).items():
+            self.send_header(key, val)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        _Handler.connections.add(self.client_address)
+        if self.path == "/redirect":
+            self._reply(302, {}, {"Location": _Handler.redirect_to})
+        elif self.path == "/missing":
+            self._reply(404, {"error": "not found"})
+        else:
+            self._reply(200, {"path": self.path, "auth": self.headers.get("Authorization"),
+                              "token": self.headers.get("X-Auth-Token")})
+
+    def do_POST(self):
+        _Handler.connections.add(self.client_address)
+        length = int(self.headers.get("Content-Length", 0))
+        self._reply(201, json.loads(self.rfile.read(length)))
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class TestHttpTransport(object):
+
+    @pytest.fixture
+    def server(self):
+        _Handler.connections = set()
+        httpd = _Server(("127.0.0.1", 0), _Handler)
+        thread = threading.Thread(target=httpd.serve_forever)
+        thread.daemon = True
+        thread.start()
+        yield "http://127.0.0.1:{0}".format(httpd.server_address[1])
+        close_all_pools()
+        httpd.shutdown()
+        httpd.server_close()
+
+    def test_connection_is_reused(self, server):
+        for count in range(5):
+            resp = keepalive_open_url(server + "/api/data?$top={0}".format(count), method="GET")
+            assert resp.getcode() == 200
+            assert json.loads(resp.read())["path"] == "/api/data?$top={0}".format(count)
+        assert len(_Handler.connections) == 1
+
+    def test_post_and_basic_auth(self, server):
+        resp = keepalive_open_url(server + "/api/data", data=json.dumps({"key": "value"}), method="POST")
+        assert resp.getcode() == 201
+        assert json.loads(resp.read()) == {"key": "value"}
+        resp = keepalive_open_url(server + "/api/data", method="GET", url_username="user",
+                                  url_password="pwd", force_basic_auth=True)
+        assert json.loads(resp.read())["auth"] == "Basic dXNlcjpwd2Q="
+
+    def test_follow_redirects(self, server):
+        resp = keepalive_open_url(server + "/redirect", method="GET", follow_redirects="all")
+        assert json.loads(resp.read())["path"] == "/api/data"
+        assert resp.geturl() == server + "/api/data"
+
+    def test_http_error(self, server):
+        with pytest.raises(HTTPError) as err:
+            keepalive_open_url(server + "/missing", method="GET")
+        assert err.value.code == 404
+        assert json.load(err.value) == {"error": "not found"}
+
+    def test_proxy_fallback(self, mocker):
+        open_url_mock = mocker.patch(MODULE_UTIL_PATH + 'http_transport.open_url', return_value="resp")
+        mocker.patch(MODULE_UTIL_PATH + 'http_transport.getproxies', return_value={"https": "http://proxy:3128"})
+        mocker.patch(MODULE_UTIL_PATH + 'http_transport.proxy_bypass', return_value=False)
+        assert keepalive_open_url("https://192.168.0.1:443/api", method="GET") == "resp"
+        assert open_url_mock.called
+
+    def test_get_connection_pool(self):
+        pool = get_connection_pool("https", "192.168.0.1", 443, validate_certs=False)
+        assert get_connection_pool("https", "192.168.0.1", 443, validate_certs=False) is pool
+        assert get_connection_pool("https", "192.168.0.1", 443, validate_certs=True) is not pool
+        close_all_pools()
+        assert http_transport._POOLS == {}
+
+    @pytest.mark.parametrize("env, expected", [("true", True), ("", False), ("1", True), ("off", False)])
+    def test_keepalive_enabled(self, env, expected, monkeypatch):
+        monkeypatch.setenv("OMAM_HTTP_KEEPALIVE", env)
+        assert keepalive_enabled() is expected
+
+    @pytest.mark.parametrize("method, sent", [("GET", 2), ("DELETE", 2), ("POST", 1), ("PATCH", 1)])
+    def test_stale_connection_retry(self, method, sent, mocker):
+        pool = HTTPConnectionPool("http", "192.168.0.1", 80)
+        stale = MagicMock(sock=MagicMock())
+        stale.request.side_effect = http_client.BadStatusLine("")
+        pool._idle.append(stale)
+        fresh = MagicMock(sock=MagicMock())
+        fresh.getresponse.return_value = MagicMock(status=200, reason="OK", msg={}, will_close=True)
+        fresh.getresponse.return_value.read.return_value = b"{}"
+        mocker.patch.object(pool, "_new_connection", return_value=fresh)
+        if sent == 1:
+            with pytest.raises(http_client.BadStatusLine):
+                pool.urlopen(method, "/api/Jobs")
+        else:
+            assert pool.urlopen(method, "/api/Jobs")[0] == 200
+        assert stale.request.call_count + fresh.request.call_count == sent
+
+    def test_redirect_to_other_host_drops_credentials(self, server):
+        other = server.replace("127.0.0.1", "localhost")
+        _Handler.redirect_to = other + "/api/data"
+        resp = keepalive_open_url(server + "/redirect", method="GET", url_username="user", url_password="pwd",
+                                  force_basic_auth=True, headers={"X-Auth-Token": "token"},
+                                  follow_redirects="all")
+        assert json.loads(resp.read()) == {"path": "/api/data", "auth": None, "token": None}
+        _Handler.redirect_to = "/api/data"
+        resp = keepalive_open_url(server + "/redirect", method="GET", headers={"X-Auth-Token": "token"},
+                                  follow_redirects="all")
+        assert json.loads(resp.read())["token"] == "token"
+
+    @pytest.fixture
+    def connection_mock(self, mocker):
+        mocker.patch.dict(MODULE_UTIL_PATH + 'http_transport._CONNECTION_HOSTS', clear=True)
+        connection_mock = mocker.patch(MODULE_UTIL_PATH + 'http_transport.Connection')
+        connection_mock.return_value.get_option.side_effect = {"host": "host"}.get
+        return connection_mock
+
+    def test_connection_open_url(self, connection_mock):
+        send_request = connection_mock.return_value.send_request
+        send_request.return_value = {"status": 200, "reason": "OK", "headers": {"X-Test": "1"},
+                                     "body": base64.b64encode(b'{"value": []}').decode()}
+        resp = connection_open_url("/socket", "https://host:443/api/DeviceService/Devices?$top=1",
+                                   data='{"key": 1}', method="POST", headers={"Accept": "application/json"},
+                                   url_username="user", force_basic_auth=True)
+        assert json.loads(resp.read()) == {"value": []}
+        assert resp.headers["X-Test"] == "1"
+        data, path = send_request.call_args[0]
+        assert base64.b64decode(data) == b'{"key": 1}'
+        assert path == "/api/DeviceService/Devices?$top=1"
+        assert send_request.call_args[1]["method"] == "POST"
+
+    def test_connection_open_url_errors(self, connection_mock):
+        send_request = connection_mock.return_value.send_request
+        send_request.return_value = {"status": 400, "reason": "Bad Request", "headers": {},
+                                     "body": base64.b64encode(b'{"error": {}}').decode()}
+        with pytest.raises(HTTPError) as err:
+            connection_open_url("/socket", "https://host:443/api/Jobs", method="GET")
+        assert json.load(err.value) == {"error": {}}
+        send_request.side_effect = PersistentConnectionError("socket closed")
+        with pytest.raises(URLError):
+            connection_open_url("/socket", "https://host:443/api/Jobs", method="GET")
+
+    @pytest.mark.parametrize("connection_host, url, sent", [
+        ("HOST", "https://host:443/api/Jobs", True),
+        ("[fe80::1]", "https://[FE80::1]:443/api/Jobs", True),
+        ("other", "https://host:443/api/Jobs", False),
+    ])
+    def test_connection_open_url_host(self, connection_mock, connection_host, url, sent):
+        connection_mock.return_value.get_option.side_effect = {"host": connection_host}.get
+        send_request = connection_mock.return_value.send_request
+        send_request.return_value = {"status": 200, "reason": "OK", "headers": {}, "body": ""}
+        if sent:
+            connection_open_url("/socket", url, method="GET")
+        else:
+            with pytest.raises(ValueError, match="The host host of the task does not match the host other"):
+                connection_open_url("/socket", url, method="GET")
+        assert send_request.called is sent
+        connection_open_url("/socket", url.replace("host", connection_host), method="GET")
+        assert connection_mock.return_value.get_option.call_count == 1
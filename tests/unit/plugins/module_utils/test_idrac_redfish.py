@@ -23,12 +23,12 @@ import json
 import os
 
 MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
-OPEN_URL = 'idrac_redfish.open_url'
+OPEN_URL = 'rest_transport.open_url'
 TEST_PATH = "/testpath"
 INVOKE_REQUEST = 'idrac_redfish.iDRACRedfishAPI.invoke_request'
 JOB_COMPLETE = 'idrac_redfish.iDRACRedfishAPI.wait_for_job_complete'
 API_TASK = '/api/tasks'
-SLEEP_TIME = 'idrac_redfish.time.sleep'
+SLEEP_TIME = 'job_poller.time.sleep'
 
 
 class TestIdracRedfishRest(object):
@@ -53,6 +53,30 @@ class TestIdracRedfishRest(object):
         idrac_redfish_obj = iDRACRedfishAPI(module_params)
         return idrac_redfish_obj
 
+    def test_invoke_request_with_connection(self, mock_response, mocker, module_params):
+        getaddrinfo_mock = mocker.patch(MODULE_UTIL_PATH + 'idrac_redfish.socket.getaddrinfo')
+        connection_mock = mocker.patch(MODULE_UTIL_PATH + 'rest_transport.connection_open_url',
+                                       return_value=mock_response)
+        invoke_mock = mocker.spy(iDRACRedfishAPI, 'invoke_request')
+        with iDRACRedfishAPI(module_params, True, socket_path="/socket") as obj:
+            response = obj.invoke_request(TEST_PATH, "GET")
+        assert response.json_data == {"value": "data"}
+        assert connection_mock.call_args[0][:2] == ("/socket", "https://192.168.0.1:443/testpath")
+        assert invoke_mock.call_count == 1
+        assert not getaddrinfo_mock.called
+
+    def test_connection_supplies_auth_args(self, mocker):
+        connection = mocker.patch(MODULE_UTIL_PATH + 'http_transport.Connection').return_value
+        connection.get_option.side_effect = {"host": "192.168.0.2", "remote_user": "root"}.get
+        with iDRACRedfishAPI({"idrac_ip": None, "idrac_user": None, "idrac_password": None, "idrac_port": 443}, True, socket_path="/socket") as obj:
+            assert obj.ipaddress == "192.168.0.2"
+            assert obj.username == "root"
+
+    def test_auth_args_required_without_connection(self):
+        with pytest.raises(ValueError, match="missing required arguments: idrac_password."):
+            iDRACRedfishAPI({"idrac_ip": "192.168.0.1", "idrac_user": "root", "idrac_password": None,
+                             "idrac_port": 443}, True)
+
     def test_invoke_request_with_session(self, mock_response, mocker, module_params):
         mocker.patch(MODULE_UTIL_PATH + OPEN_URL,
                      return_value=mock_response)
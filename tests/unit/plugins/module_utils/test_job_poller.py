@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_poller import JobPoller
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import job_tracking, multi_job_tracking, \
+    idrac_redfish_job_tracking
+from mock import MagicMock
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+SLEEP_TIME = 'job_poller.time.sleep'
+
+
+class TestJobPoller(object):
+
+    @pytest.fixture
+    def sleep_mock(self, mocker):
+        return mocker.patch(MODULE_UTIL_PATH + SLEEP_TIME, return_value=None)
+
+    def test_backoff_is_bounded(self, sleep_mock):
+        poller = JobPoller(100, profile="default", jitter=0)
+        intervals = [poller.sleep() for each in range(10)]
+        assert intervals[:3] == [2, 3, 4.5]
+        assert max(intervals) == 30
+        assert poller.waited == 100
+        assert poller.expired is True
+        assert sum(each[0][0] for each in sleep_mock.call_args_list) == 100
+
+    def test_jitter_range(self, sleep_mock):
+        poller = JobPoller(profile="default", jitter=0.5)
+        for each in range(20):
+            assert 1 <= poller.next_interval() <= 3
+
+    def test_progress_caps_interval(self, sleep_mock):
+        poller = JobPoller(profile="firmware", jitter=0)
+        poller.attempts = 5
+        assert poller.next_interval({"PercentComplete": 10}) == 60
+        poller.waited = 60
+        assert poller.next_interval({"PercentComplete": 90}) == 10
+        assert poller.next_interval({"PercentComplete": 100}) == 10
+        assert poller.next_interval({"PercentComplete": "NA"}) == 60
+
+    def test_start_and_overrides(self, sleep_mock):
+        poller = JobPoller(3, profile="discovery", initial_wait=10, max_interval=1)
+        assert poller.start() == 3
+        assert poller.min_interval == 1
+        assert poller.expired is True
+
+    @pytest.mark.parametrize("responses, expected", [
+        ([{"LastRunStatus": {"Id": 2050}}, {"LastRunStatus": {"Id": 2060}}], (False, "Job tracking completed.")),
+        ([{"LastRunStatus": {"Id": 2070}}], (True, "Job is in Failed state.")),
+        ([{"LastRunStatus": {"Id": 2050}}] * 50, (True, "Job tracking started.")),
+    ])
+    def test_job_tracking(self, responses, expected, sleep_mock):
+        rest_obj = MagicMock()
+        rest_obj.invoke_request.side_effect = [MagicMock(json_data=each) for each in responses]
+        job_failed, msg, job_dict, wait_time = job_tracking(rest_obj, "JobService/Jobs(1)", max_job_wait_sec=60)
+        assert (job_failed, msg) == expected
+        assert wait_time <= 60
+
+    def test_idrac_redfish_job_tracking_unresponsive(self, sleep_mock, mocker):
+        mocker.patch(MODULE_UTIL_PATH + 'job_poller.random.uniform', return_value=1)
+        rest_obj = MagicMock()
+        rest_obj.invoke_request.side_effect = ValueError("no response")
+        job_failed, msg, job_dict, wait_time = idrac_redfish_job_tracking(rest_obj, "/Jobs/JID_1",
+                                                                          max_unresponsive_wait=5)
+        assert job_failed is True
+        assert msg == "Exception in job tracking no response"
+        assert rest_obj.invoke_request.call_count == 3
+
+    def test_multi_job_tracking(self, sleep_mock):
+        def job(job_id, status):
+            return {"Id": job_id, "LastRunStatus": {"Id": status}}
+
+        rest_obj = MagicMock()
+        rest_obj.invoke_request.side_effect = [
+            MagicMock(json_data={"value": [job(1, 2050), job(2, 2070), job(3, 2050)]}),
+            MagicMock(json_data={"value": [job(1, 2060), job(3, 2050)]}),
+        ] + [MagicMock(json_data={"value": [job(3, 2050)]})] * 50
+        result = list(multi_job_tracking(rest_obj, [1, 2, 3], max_job_wait_sec=60))
+        assert [(each[0], each[1]) for each in result] == [(2, True), (1, False), (3, True)]
+        assert result[2][2] == "Job tracking started."
+        query_param = rest_obj.invoke_request.call_args_list[0][1]["query_param"]
+        assert query_param == {"$filter": "Id eq 1 or Id eq 2 or Id eq 3", "$top": 3}
+        assert rest_obj.invoke_request.call_args_list[1][1]["query_param"]["$filter"] == "Id eq 1 or Id eq 3"
+
+    def test_multi_job_tracking_chunks(self, sleep_mock):
+        rest_obj = MagicMock()
+        rest_obj.invoke_request.return_value = MagicMock(json_data={"value": [
+            {"Id": job_id, "LastRunStatus": {"Id": 2060}} for job_id in range(100)]})
+        result = list(multi_job_tracking(rest_obj, list(range(100))))
+        assert len(result) == 100
+        assert rest_obj.invoke_request.call_count == 3
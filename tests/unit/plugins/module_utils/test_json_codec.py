@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import pytest
+from ansible_collections.dellemc.openmanage.plugins.module_utils import json_codec
+from ansible_collections.dellemc.openmanage.plugins.module_utils.json_codec import json_loads
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import OpenURLResponse
+from mock import MagicMock
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+
+
+class TestJsonCodec(object):
+
+    @pytest.mark.parametrize("decoder", ["", "ujson", "json"])
+    def test_json_loads(self, decoder, monkeypatch):
+        monkeypatch.setenv("OMAM_JSON_DECODER", decoder)
+        assert json_loads(b'{"value": [1, 2.5, "a", null]}') == {"value": [1, 2.5, "a", None]}
+        with pytest.raises(ValueError):
+            json_loads("invalid json")
+
+    def test_json_loads_pinned_to_json(self, monkeypatch):
+        monkeypatch.setenv("OMAM_JSON_DECODER", "json")
+        assert json_loads('{"Id": 123456789012345678901234567890}') == {"Id": 123456789012345678901234567890}
+
+    def test_json_loads_fallback(self, mocker):
+        decoder = MagicMock(side_effect=OverflowError("too large"))
+        mocker.patch(MODULE_UTIL_PATH + 'json_codec._get_decoder', return_value=decoder)
+        assert json_loads(b'{"key": 1}') == {"key": 1}
+        assert decoder.called
+
+    def test_json_data_is_decoded_once(self, mocker):
+        resp = MagicMock()
+        resp.read.return_value = b'{"value": [{"Id": 1}]}'
+        loads_mock = mocker.patch(MODULE_UTIL_PATH + 'json_codec.json_loads', side_effect=json_codec.json_loads)
+        obj = OpenURLResponse(resp)
+        assert obj.json_data is obj.json_data
+        assert loads_mock.call_count == 1
+        assert obj._body is None
+        assert json.loads(obj.body) == {"value": [{"Id": 1}]}
+        obj.body = b'{"value": []}'
+        assert obj.json_data == {"value": []}
+        assert loads_mock.call_count == 2
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import os
+import pstats
+import pytest
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module, \
+    get_profile_modes
+from mock import MagicMock
+
+
+def _build_payload():
+    return [{"Name": "attr{0}".format(each), "Value": str(each)} for each in range(5000)]
+
+
+class TestModuleRunner(object):
+
+    @pytest.fixture
+    def profile_dir(self, tmpdir, monkeypatch):
+        path = str(tmpdir.join("profile"))
+        monkeypatch.setenv("OMAM_PROFILE_DIR", path)
+        monkeypatch.setenv("OMAM_PERF", "")
+        return path
+
+    @pytest.mark.parametrize("env, expected", [
+        ("", ()), ("true", ("cpu", "memory")), ("cpu", ("cpu",)), ("memory, cpu", ("cpu", "memory")),
+        ("other", ()),
+    ])
+    def test_get_profile_modes(self, env, expected, monkeypatch):
+        monkeypatch.setenv("OMAM_PROFILE", env)
+        assert get_profile_modes() == expected
+
+    def test_profile_in_result(self, profile_dir, monkeypatch, mocker):
+        monkeypatch.setenv("OMAM_PROFILE", "cpu,memory")
+        monkeypatch.setenv("OMAM_PROFILE_TOP", "3")
+        exit_json = mocker.patch.object(AnsibleModule, "exit_json")
+
+        def main():
+            payload = _build_payload()
+            AnsibleModule.exit_json(MagicMock(), changed=False, count=len(payload))
+        run_module(main)
+        profile = exit_json.call_args[1]["profile"]
+        assert len(profile["cpu"]) == 3
+        assert any("_build_payload" in each["function"] for each in profile["cpu"])
+        assert len(profile["memory"]) == 3
+        assert profile["peak_memory"] > 0
+        assert [os.path.dirname(each) for each in profile["files"]] == [profile_dir, profile_dir]
+        assert os.path.basename(profile["files"][0]).startswith("test_module_runner_")
+        assert pstats.Stats(profile["files"][0]).total_calls > 0
+        assert "perf" not in exit_json.call_args[1]
+
+    def test_profile_without_exit(self, profile_dir, monkeypatch):
+        monkeypatch.setenv("OMAM_PROFILE", "cpu")
+        monkeypatch.setenv("OMAM_PERF", "true")
+
+        def main():
+            return len(_build_payload())
+        assert run_module(main) == 5000
+        assert [name.endswith(".prof") for name in os.listdir(profile_dir)] == [True]
+
+    def test_disabled(self, profile_dir, monkeypatch, mocker):
+        monkeypatch.setenv("OMAM_PROFILE", "")
+        exit_json = mocker.patch.object(AnsibleModule, "exit_json")
+
+        def main():
+            AnsibleModule.exit_json(MagicMock(), changed=False)
+        run_module(main)
+        assert exit_json.call_args[1] == {"changed": False}
+        assert not os.path.exists(profile_dir)
@@ -22,7 +22,7 @@ from mock import MagicMock
 import json
 
 MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
-OME_OPENURL = 'ome.open_url'
+OME_OPENURL = 'rest_transport.open_url'
 TEST_PATH = "/testpath"
 INVOKE_REQUEST = 'ome.RestOME.invoke_request'
 JOB_SUBMISSION = 'ome.RestOME.job_submission'
@@ -80,6 +80,43 @@ class TestOMERest(object):
         assert response.json_data == {"value": "data"}
         assert response.success is True
 
+    def test_invoke_request_with_keepalive(self, mock_response, mocker, module_params, monkeypatch):
+        open_url_mock = mocker.patch(MODULE_UTIL_PATH + OME_OPENURL,
+                                     return_value=mock_response)
+        keepalive_mock = mocker.patch(MODULE_UTIL_PATH + 'rest_transport.keepalive_open_url',
+                                      return_value=mock_response)
+        monkeypatch.setenv("OMAM_HTTP_KEEPALIVE", "true")
+        with RestOME(module_params, False) as obj:
+            response = obj.invoke_request(TEST_PATH, "GET")
+        assert response.json_data == {"value": "data"}
+        assert keepalive_mock.called
+        assert not open_url_mock.called
+
+    def test_invoke_request_with_connection(self, mock_response, mocker, module_params):
+        getaddrinfo_mock = mocker.patch(MODULE_UTIL_PATH + 'ome.resolve')
+        connection_mock = mocker.patch(MODULE_UTIL_PATH + 'rest_transport.connection_open_url', return_value=mock_response)
+        invoke_mock = mocker.spy(RestOME, 'invoke_request')
+        with RestOME(module_params, True, socket_path="/socket") as obj:
+            response = obj.invoke_request("GET", TEST_PATH)
+        assert response.json_data == {"value": "data"}
+        assert connection_mock.call_args[0][:2] == ("/socket", "https://192.168.0.1:443/api//testpath")
+        assert invoke_mock.call_count == 1
+        assert not getaddrinfo_mock.called
+
+    def test_connection_supplies_auth_args(self, mock_response, mocker):
+        connection = mocker.patch(MODULE_UTIL_PATH + 'http_transport.Connection').return_value
+        connection.get_option.side_effect = {"host": "ome.example.com", "remote_user": "admin"}.get
+        module_params = {"hostname": None, "username": None, "password": None, "port": 443}
+        with RestOME(module_params, True, socket_path="/socket") as obj:
+            assert obj.hostname == "ome.example.com"
+            assert obj.username == "admin"
+        assert module_params["hostname"] == "ome.example.com"
+
+    def test_auth_args_required_without_connection(self):
+        module_params = {"hostname": "192.168.0.1", "username": None, "password": None, "port": 443}
+        with pytest.raises(ValueError, match="missing required arguments: username, password."):
+            RestOME(module_params, True)
+
     def test_invoke_request_without_session_with_header(self, mock_response, mocker, module_params):
         mocker.patch(MODULE_UTIL_PATH + OME_OPENURL,
                      return_value=mock_response)
@@ -133,6 +170,47 @@ class TestOMERest(object):
         assert reports == {"resp_obj": mock_response,
                            "report_list": list(range(50)) + (list(range(50)))}
 
+    def test_get_all_report_details_concurrent(self, mocker, module_params, monkeypatch):
+        pages = {0: list(range(0, 50)), 50: list(range(50, 100)), 100: list(range(100, 120))}
+
+        def invoke_request(method, uri, query_param=None):
+            skip = query_param["$skip"] if query_param else 0
+            resp = MagicMock()
+            resp.json_data = {ODATA_COUNT: 120, "value": list(pages[skip])}
+            return resp
+
+        invoke_mock = mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=invoke_request)
+        monkeypatch.setenv("OMAM_PAGE_WORKERS", "4")
+        reports = RestOME(module_params).get_all_report_details(DEVICE_API)
+        assert reports["report_list"] == list(range(120))
+        assert reports["resp_obj"].json_data["value"] == pages[100]
+        assert invoke_mock.call_count == 3
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_get_all_report_details_select(self, workers, mocker, module_params):
+        devices = [{"Id": each, "DeviceServiceTag": "TAG{0}".format(each), "Model": "R740"} for each in range(120)]
+
+        def invoke_request(method, uri, query_param=None):
+            skip = query_param.get("$skip", 0)
+            resp = MagicMock()
+            resp.json_data = {ODATA_COUNT: 120, "value": devices[skip:skip + 50]}
+            return resp
+
+        invoke_mock = mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=invoke_request)
+        reports = RestOME(module_params).get_all_report_details(DEVICE_API, workers=workers,
+                                                                select=["Id", "DeviceServiceTag"])
+        assert reports["report_list"] == [{"Id": each, "DeviceServiceTag": "TAG{0}".format(each)}
+                                          for each in range(120)]
+        assert all(each[1]["query_param"]["$select"] == "Id,DeviceServiceTag" for each in invoke_mock.call_args_list)
+
+    @pytest.mark.parametrize("env, expected", [(None, 1), ("4", 4), ("invalid", 1), ("-2", 1)])
+    def test_get_page_workers(self, env, expected, monkeypatch, module_params):
+        if env is None:
+            monkeypatch.delenv("OMAM_PAGE_WORKERS", raising=False)
+        else:
+            monkeypatch.setenv("OMAM_PAGE_WORKERS", env)
+        assert RestOME(module_params).page_workers == expected
+
     def test_get_report_list_error_case(self, mock_response, mocker, ome_object):
         mocker.patch(MODULE_UTIL_PATH + OME_OPENURL,
                      return_value=mock_response)
@@ -226,6 +304,44 @@ class TestOMERest(object):
         reports = ome_object.get_all_items_with_pagination(DEVICE_API)
         assert reports == {"total_count": 100, "value": list(range(100))}
 
+    def test_iter_items(self, mocker, ome_object):
+        pages = {DEVICE_API: {"value": [1, 2], "@odata.nextLink": "/api/DeviceService/Devices?$skip=2"},
+                 "/DeviceService/Devices?$skip=2": {"value": [3]}}
+
+        def invoke_request(method, uri, query_param=None):
+            resp = MagicMock()
+            resp.json_data = pages[uri]
+            return resp
+
+        invoke_mock = mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=invoke_request)
+        items = ome_object.iter_items(DEVICE_API)
+        assert next(items) == 1
+        assert invoke_mock.call_count == 1
+        assert list(items) == [2, 3]
+        assert invoke_mock.call_count == 2
+
+    @pytest.mark.parametrize("identifiers, keys, expected, pages_left", [
+        (["TAG1", 11], ("Id", "DeviceServiceTag"), ["11", "TAG1"], 1),
+        (["TAG3"], ("DeviceServiceTag",), ["TAG3"], 0),
+        ([12, "TAG9"], ("Id", "DeviceServiceTag"), ["12"], 0),
+        ([], ("Id",), [], 2),
+    ])
+    def test_find_devices(self, identifiers, keys, expected, pages_left, mocker, ome_object):
+        pages = iter([{"value": [{"Id": 11, "DeviceServiceTag": "TAG1"}, {"Id": 12, "DeviceServiceTag": "TAG2"}]},
+                      {"value": [{"Id": 13, "DeviceServiceTag": "TAG3"}]}])
+        mocker.patch(MODULE_UTIL_PATH + 'ome.RestOME.iter_pages', return_value=pages)
+        devices = ome_object.find_devices(identifiers, keys=keys)
+        assert sorted(devices.keys()) == expected
+        assert len(list(pages)) == pages_left
+
+    def test_find_devices_select(self, mocker, ome_object):
+        iter_mock = mocker.patch(MODULE_UTIL_PATH + 'ome.RestOME.iter_pages', return_value=iter(
+            [{"value": [{"Id": 11, "DeviceServiceTag": "TAG1", "DeviceManagement": [], "Model": "R740"}]}]))
+        devices = ome_object.find_devices(["TAG1"], select=["DeviceManagement/NetworkAddress"])
+        assert devices == {"TAG1": {"Id": 11, "DeviceServiceTag": "TAG1", "DeviceManagement": []}}
+        assert iter_mock.call_args[1]["query_param"] == {
+            "$select": "DeviceManagement/NetworkAddress,Id,DeviceServiceTag"}
+
     def test_get_all_items_with_pagination_error_case(self, mock_response, mocker, ome_object):
         mocker.patch(MODULE_UTIL_PATH + OME_OPENURL,
                      return_value=mock_response)
@@ -319,17 +435,26 @@ class TestOMERest(object):
         (True, False, "My Message"),
         (False, True, "The job is not complete after 2 seconds.")])
     def test_job_tracking(self, mocker, mock_response, ret_val, ome_object):
-        mocker.patch(MODULE_UTIL_PATH + 'ome.time.sleep',
+        mocker.patch(MODULE_UTIL_PATH + 'job_poller.time.sleep',
                      return_value=())
         mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST,
                      return_value=mock_response)
 
-        mocker.patch(MODULE_UTIL_PATH + 'ome.RestOME.get_job_info',
-                     return_value=ret_val)
+        mocker.patch(MODULE_UTIL_PATH + 'ome.RestOME._get_job_details',
+                     return_value=ret_val + ({"PercentComplete": 50},))
         job_failed, message = ome_object.job_tracking(12345, 2, 1)
         assert job_failed is ret_val[1]
         assert message == ret_val[2]
 
+    def test_job_tracking_sleep_with_job(self, mocker, mock_response, ome_object):
+        sleep_mock = mocker.patch(MODULE_UTIL_PATH + 'ome.JobPoller.sleep')
+        mocker.patch(MODULE_UTIL_PATH + 'ome.JobPoller.start')
+        mock_response.json_data = {'LastRunStatus': {'Id': 2050}, 'PercentComplete': 40}
+        completed = MagicMock(json_data={'LastRunStatus': {'Id': 2060}})
+        mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=[mock_response, completed])
+        assert ome_object.job_tracking(12345, 600, 1) == (False, "Job Completed successfully.")
+        sleep_mock.assert_called_once_with({'LastRunStatus': {'Id': 2050}, 'PercentComplete': 40})
+
     def test_strip_substr_dict(self, mocker, mock_response, ome_object):
         data_dict = {"@odata.context": "/api/$metadata#Collection(DeviceService.DeviceType)",
                      ODATA_COUNT: 5,
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import io
+import pytest
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import request_timer, \
+    path_template, perf_summary, get_records, clear_records, note_phase
+from ansible_collections.dellemc.openmanage.plugins.module_utils.http_transport import HTTPConnectionPool
+from ansible_collections.dellemc.openmanage.plugins.module_utils.module_runner import run_module
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from mock import MagicMock
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+BASE_URL = "https://192.168.0.1:443"
+
+
+class TestPerfStats(object):
+
+    @pytest.fixture(autouse=True)
+    def records(self, monkeypatch):
+        monkeypatch.setenv("OMAM_PERF", "true")
+        clear_records()
+        yield
+        clear_records()
+
+    @pytest.mark.parametrize("url, expected", [
+        (BASE_URL + "/api/DeviceService/Devices(10074)/InventoryDetails?$top=1",
+         "/api/DeviceService/Devices({id})/InventoryDetails"),
+        (BASE_URL + "/api/SessionService/Sessions('abc-12')", "/api/SessionService/Sessions({id})"),
+        (BASE_URL + "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_123456789",
+         "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/{id}"),
+        (BASE_URL + "/redfish/v1/Systems/System.Embedded.1/Storage/1/Volumes",
+         "/redfish/v1/Systems/System.Embedded.1/Storage/{id}/Volumes"),
+    ])
+    def test_path_template(self, url, expected):
+        assert path_template(url) == expected
+
+    def test_request_timer(self, mocker):
+        resp = MagicMock(status_code=200, body=b'{"value": []}')
+        with request_timer("GET", BASE_URL + "/api/JobService/Jobs(1)") as timer:
+            note_phase("connect", 0.25)
+            note_phase("server", 0.5)
+            timer.received()
+            timer.finished(resp)
+        with pytest.raises(HTTPError):
+            with request_timer("POST", BASE_URL + "/api/JobService/Jobs"):
+                raise HTTPError(BASE_URL, 503, "busy", {}, io.BytesIO(b""))
+        records = get_records()
+        assert [(each["method"], each["path"], each["status"], each["bytes"]) for each in records] == [
+            ("GET", "/api/JobService/Jobs({id})", 200, 13), ("POST", "/api/JobService/Jobs", 503, None)]
+        assert records[0]["connect"] == 0.25 and records[0]["server"] == 0.5
+        assert "connect" not in records[1]
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setenv("OMAM_PERF", "")
+        with request_timer("GET", BASE_URL + "/api/JobService/Jobs") as timer:
+            timer.finished(MagicMock())
+        assert get_records() == []
+
+    def test_perf_summary(self):
+        records = [{"method": "GET", "path": "/api/Jobs({id})", "status": 200, "bytes": 10, "time": 0.1}] * 18 + [
+            {"method": "GET", "path": "/api/Devices", "status": 200, "bytes": 100, "time": 1.0, "connect": 0.2},
+            {"method": "POST", "path": "/api/Jobs", "status": 400, "bytes": 5, "time": 2.0, "server": 1.5}]
+        summary = perf_summary(records)
+        assert (summary["calls"], summary["total"], summary["p50"], summary["p95"]) == (20, 4.8, 0.1, 1.0)
+        assert (summary["bytes"], summary["connect"], summary["server"], summary["errors"]) == (285, 0.2, 1.5, 1)
+        assert summary["slowest"][0] == {"method": "POST", "path": "/api/Jobs", "count": 1, "total": 2.0, "max": 2.0}
+        assert summary["slowest"][1]["count"] == 18
+        assert perf_summary([])["calls"] == 0
+
+    def test_pool_phases(self):
+        conn = MagicMock(sock=None)
+        pool = HTTPConnectionPool("https", "192.168.0.1", 443)
+        with request_timer("GET", BASE_URL + "/api/Jobs"):
+            pool._send(conn, "GET", "/api/Jobs", None, None)
+        assert conn.connect.called
+        assert "connect" in get_records()[0] and "server" in get_records()[0]
+
+    def test_rest_ome_records(self, mocker):
+        resp = MagicMock()
+        resp.read.return_value = b'{"value": []}'
+        resp.getcode.return_value = 200
+        mocker.patch(MODULE_UTIL_PATH + 'rest_transport.open_url', return_value=resp)
+        obj = RestOME({'hostname': '192.168.0.1', 'username': 'username', 'password': 'password', "port": 443})
+        obj.invoke_request("GET", "DeviceService/Devices(10)")
+        assert get_records()[0]["path"] == "/api/DeviceService/Devices({id})"
+        assert get_records()[0]["status"] == 200
+
+    def test_run_module(self, mocker):
+        exit_json = mocker.patch.object(AnsibleModule, "exit_json")
+        fail_json = mocker.patch.object(AnsibleModule, "fail_json")
+        module = MagicMock()
+        run_module(lambda: AnsibleModule.exit_json(module, changed=False))
+        assert exit_json.call_args[1]["perf"]["calls"] == 0
+        run_module(lambda: AnsibleModule.fail_json(module, "failed"))
+        assert fail_json.call_args[0][1] == "failed"
+        assert "perf" in fail_json.call_args[1]
+        assert AnsibleModule.exit_json is exit_json
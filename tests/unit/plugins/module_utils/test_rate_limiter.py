@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import multiprocessing
+import os
+import stat
+import time
+import pytest
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rate_limiter import RateLimiter, \
+    get_rate_limiter, get_rate_limit, parse_rate_limits
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from mock import MagicMock
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+
+
+def _take_tokens(state_dir, count):
+    limiter = RateLimiter("192.168.0.1", 443, 50, burst=1, state_dir=state_dir)
+    for each in range(count):
+        limiter.acquire()
+
+
+class TestRateLimiter(object):
+
+    @pytest.fixture
+    def state_dir(self, tmpdir, monkeypatch):
+        path = str(tmpdir.join("buckets"))
+        monkeypatch.setenv("OMAM_RATE_LIMIT_DIR", path)
+        return path
+
+    def test_parse_rate_limits(self):
+        assert parse_rate_limits("10") == {None: 10}
+        assert parse_rate_limits("ome1.example.com=5, 192.168.0.2=2.5,10,bad=x,off=0") == {
+            "ome1.example.com": 5, "192.168.0.2": 2.5, None: 10}
+        assert parse_rate_limits(None) == {}
+
+    def test_get_rate_limit(self, monkeypatch):
+        monkeypatch.setenv("OMAM_RATE_LIMIT", "ome1.example.com=5,10")
+        assert get_rate_limit("ome1.example.com") == 5
+        assert get_rate_limit("ome2.example.com") == 10
+        monkeypatch.setenv("OMAM_RATE_LIMIT", "ome1.example.com=5")
+        assert get_rate_limit("ome2.example.com") is None
+        assert get_rate_limiter("ome2.example.com", 443) is None
+        monkeypatch.setenv("OMAM_RATE_LIMIT_BURST", "7")
+        assert get_rate_limiter("ome1.example.com", 443).burst == 7
+
+    def test_burst_then_rate(self, state_dir, mocker):
+        now = [1000.0]
+        mocker.patch(MODULE_UTIL_PATH + 'rate_limiter.time.time', side_effect=lambda: now[0])
+
+        def sleep(seconds):
+            now[0] += seconds
+        sleep_mock = mocker.patch(MODULE_UTIL_PATH + 'rate_limiter.time.sleep', side_effect=sleep)
+        limiter = RateLimiter("192.168.0.1", 443, 2, burst=3)
+        assert [limiter.acquire() for each in range(3)] == [0, 0, 0]
+        assert not sleep_mock.called
+        assert limiter.acquire() == pytest.approx(0.5)
+        now[0] += 10
+        assert RateLimiter("192.168.0.1", 443, 2, burst=3).acquire() == 0
+        assert stat.S_IMODE(os.stat(limiter.path).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(state_dir).st_mode) == 0o700
+
+    def test_corrupt_state(self, state_dir):
+        limiter = RateLimiter("192.168.0.1", 443, 1)
+        os.makedirs(state_dir)
+        with open(limiter.path, "w") as state_file:
+            state_file.write("garbage")
+        assert limiter.acquire() == 0
+
+    def test_shared_across_processes(self, state_dir):
+        start = time.time()
+        procs = [multiprocessing.Process(target=_take_tokens, args=(state_dir, 5)) for each in range(3)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+        # 15 requests at 50 per second with a single token burst need at least 14 refills
+        assert time.time() - start >= 14 / 50.0
+
+    def test_rest_ome_acquires_token(self, mocker, monkeypatch):
+        monkeypatch.setenv("OMAM_RATE_LIMIT", "192.168.0.1=5")
+        module_params = {'hostname': '192.168.0.1', 'username': 'username', 'password': 'password',
+                         "port": 443}
+        acquire_mock = mocker.patch(MODULE_UTIL_PATH + 'rate_limiter.RateLimiter.acquire', return_value=0)
+        resp = MagicMock()
+        resp.read.return_value = b'{}'
+        mocker.patch(MODULE_UTIL_PATH + 'rest_transport.open_url', return_value=resp)
+        obj = RestOME(module_params)
+        obj.invoke_request("GET", "DeviceService/Devices")
+        assert acquire_mock.call_count == 1
@@ -22,7 +22,7 @@ from mock import MagicMock
 import json
 
 MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
-OPEN_URL = 'redfish.open_url'
+OPEN_URL = 'rest_transport.open_url'
 TEST_PATH = "/testpath"
 
 
@@ -48,6 +48,29 @@ class TestRedfishRest(object):
         redfish_obj = Redfish(module_params=module_params)
         return redfish_obj
 
+    def test_invoke_request_with_connection(self, mock_response, mocker, module_params):
+        getaddrinfo_mock = mocker.patch(MODULE_UTIL_PATH + 'redfish.socket.getaddrinfo')
+        connection_mock = mocker.patch(MODULE_UTIL_PATH + 'rest_transport.connection_open_url',
+                                       return_value=mock_response)
+        invoke_mock = mocker.spy(Redfish, 'invoke_request')
+        with Redfish(module_params, True, socket_path="/socket") as obj:
+            response = obj.invoke_request("GET", TEST_PATH)
+        assert response.json_data == {"value": "data"}
+        assert connection_mock.call_args[0][0] == "/socket"
+        assert invoke_mock.call_count == 1
+        assert not getaddrinfo_mock.called
+
+    def test_connection_supplies_auth_args(self, mocker):
+        connection = mocker.patch(MODULE_UTIL_PATH + 'http_transport.Connection').return_value
+        connection.get_option.side_effect = {"host": "192.168.0.2", "remote_user": "root"}.get
+        with Redfish({"baseuri": None, "username": None, "password": None}, True, socket_path="/socket") as obj:
+            assert obj.hostname == "192.168.0.2"
+            assert obj.username == "root"
+
+    def test_auth_args_required_without_connection(self):
+        with pytest.raises(ValueError, match="missing required arguments: baseuri."):
+            Redfish({"baseuri": None, "username": "root", "password": "pwd"}, True)
+
     def test_invoke_request_with_session(self, mock_response, mocker, module_params):
         mocker.patch(MODULE_UTIL_PATH + OPEN_URL,
                      return_value=mock_response)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import io
+import os
+import stat
+import pytest
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.http_transport import PooledResponse
+from ansible_collections.dellemc.openmanage.plugins.module_utils.response_cache import ResponseCache, \
+    get_response_cache, response_cache_enabled
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OpenURLResponse
+from mock import MagicMock
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+URL = "https://192.168.0.1:443/api/JobService/JobTypes"
+
+
+def _response(status=200, body=b'{"value": [{"Id": 5, "Name": "Update_Task"}]}', headers=None):
+    return OpenURLResponse(PooledResponse(URL, status, "OK", headers or {}, body))
+
+
+class TestResponseCache(object):
+
+    @pytest.fixture
+    def cache_dir(self, tmpdir, monkeypatch):
+        path = str(tmpdir.join("responses"))
+        monkeypatch.setenv("OMAM_RESPONSE_CACHE_DIR", path)
+        return path
+
+    @pytest.fixture
+    def cache(self, cache_dir):
+        return ResponseCache("192.168.0.1", 443, "user")
+
+    def test_etag_revalidation(self, cache, cache_dir):
+        fetch = MagicMock(return_value=_response(headers={"ETag": '"v1"'}))
+        assert cache.get(URL, fetch, OpenURLResponse).json_data["value"][0]["Id"] == 5
+        assert fetch.call_args[0][0] is None
+        path = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+        fetch.return_value = _response(status=304, body=b"")
+        resp = cache.get(URL, fetch, OpenURLResponse)
+        assert fetch.call_args[0][0] == {"If-None-Match": '"v1"'}
+        assert resp.status_code == 200
+        assert resp.json_data["value"][0]["Name"] == "Update_Task"
+        fetch.side_effect = HTTPError(URL, 304, "Not Modified", {}, io.BytesIO(b""))
+        assert cache.get(URL, fetch, OpenURLResponse).json_data["value"][0]["Id"] == 5
+
+    def test_changed_resource_is_stored(self, cache):
+        fetch = MagicMock(return_value=_response(headers={"ETag": '"v1"'}))
+        cache.get(URL, fetch, OpenURLResponse)
+        fetch.return_value = _response(body=b'{"value": []}', headers={"ETag": '"v2"'})
+        assert cache.get(URL, fetch, OpenURLResponse).json_data == {"value": []}
+        assert cache.load(URL)["etag"] == '"v2"'
+
+    def test_ttl_without_etag(self, cache):
+        fetch = MagicMock(return_value=_response())
+        cache.get(URL, fetch, OpenURLResponse)
+        assert cache.get(URL, fetch, OpenURLResponse).json_data["value"][0]["Id"] == 5
+        assert fetch.call_count == 1
+        cache.ttl = -1
+        cache.get(URL, fetch, OpenURLResponse)
+        assert fetch.call_count == 2
+
+    def test_errors_are_not_cached(self, cache):
+        fetch = MagicMock(side_effect=HTTPError(URL, 404, "Not Found", {}, io.BytesIO(b"{}")))
+        with pytest.raises(HTTPError):
+            cache.get(URL, fetch, OpenURLResponse)
+        assert cache.load(URL) is None
+
+    def test_eviction(self, cache_dir):
+        cache = ResponseCache("192.168.0.1", 443, "user", max_entries=2)
+        for index in range(3):
+            cache.save("{0}/{1}".format(URL, index), None, b"{}")
+            os.utime(cache._path("{0}/{1}".format(URL, index)), (index, index))
+        cache.save(URL, None, b"{}")
+        assert len(os.listdir(cache_dir)) == 2
+        assert cache.load("{0}/0".format(URL)) is None
+        assert cache.load(URL) is not None
+
+    def test_user_is_part_of_key(self, cache):
+        cache.save(URL, '"v1"', b"{}")
+        assert ResponseCache("192.168.0.1", 443, "other").load(URL) is None
+        cache.invalidate(URL)
+        assert cache.load(URL) is None
+
+    @pytest.mark.parametrize("env, expected", [("true", True), ("1", True), ("", False), ("false", False)])
+    def test_response_cache_enabled(self, env, expected, monkeypatch):
+        monkeypatch.setenv("OMAM_RESPONSE_CACHE", env)
+        assert response_cache_enabled() is expected
+        assert (get_response_cache("host", 443, "user") is not None) is expected
+
+    def test_rest_ome_cached_request(self, cache_dir, mocker, monkeypatch):
+        monkeypatch.setenv("OMAM_RESPONSE_CACHE", "true")
+        module_params = {'hostname': '192.168.0.1', 'username': 'username', 'password': 'password',
+                         "port": 443}
+        open_url_mock = mocker.patch(MODULE_UTIL_PATH + 'rest_transport.open_url',
+                                     return_value=PooledResponse(URL, 200, "OK", {"ETag": '"v1"'},
+                                                                 b'{"value": [{"Id": 5, "Name": "Update_Task"}]}'))
+        obj = RestOME(module_params)
+        assert obj.get_job_type_id("Update_Task") == 5
+        open_url_mock.side_effect = HTTPError(URL, 304, "Not Modified", {}, io.BytesIO(b""))
+        assert obj.get_job_type_id("Update_Task") == 5
+        assert open_url_mock.call_args[1]["headers"]["If-None-Match"] == '"v1"'
+        open_url_mock.side_effect = None
+        obj.invoke_request("GET", "DeviceService/Devices")
+        assert "If-None-Match" not in open_url_mock.call_args[1]["headers"]
+        assert "If-None-Match" not in obj._headers
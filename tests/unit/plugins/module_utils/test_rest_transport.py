@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import pytest
+from ansible.module_utils.urls import ConnectionError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+from mock import MagicMock
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+OME_PARAMS = {'hostname': '192.168.0.1', 'username': 'username', 'password': 'password', 'port': 443}
+REDFISH_PARAMS = {'baseuri': '192.168.0.1:443', 'username': 'username', 'password': 'password'}
+IDRAC_PARAMS = {'idrac_ip': '192.168.0.1', 'idrac_user': 'username', 'idrac_password': 'password',
+                'idrac_port': 443}
+
+
+class TestRestTransport(object):
+
+    @pytest.fixture
+    def open_url_mock(self, mocker):
+        mocker.patch(MODULE_UTIL_PATH + 'ome.resolve', return_value=[(2, 1, 6, '', ('192.168.0.1', 443))])
+        mocker.patch(MODULE_UTIL_PATH + 'redfish.resolve', return_value=[(2, 1, 6, '', ('192.168.0.1', 443))])
+        mocker.patch(MODULE_UTIL_PATH + 'idrac_redfish.is_ipv6_host', return_value=False)
+        response = MagicMock()
+        response.getcode.return_value = 201
+        response.headers = {'X-Auth-Token': 'token'}
+        response.read.return_value = json.dumps({"Id": "session_id"})
+        return mocker.patch(MODULE_UTIL_PATH + 'rest_transport.open_url', return_value=response)
+
+    @pytest.mark.parametrize("client, params, session_uri, payload", [
+        (RestOME, OME_PARAMS, "https://192.168.0.1:443/api/SessionService/Sessions",
+         {"UserName": "username", "Password": "password", "SessionType": "API"}),
+        (Redfish, REDFISH_PARAMS, "https://192.168.0.1:443/redfish/v1/Sessions",
+         {"UserName": "username", "Password": "password"}),
+        (iDRACRedfishAPI, IDRAC_PARAMS, "https://192.168.0.1:443/redfish/v1/Sessions",
+         {"UserName": "username", "Password": "password"}),
+    ])
+    def test_session_created_and_deleted(self, open_url_mock, client, params, session_uri, payload):
+        with client(dict(params), True) as obj:
+            assert obj.session_id == "session_id"
+            assert obj._headers["X-Auth-Token"] == "token"
+        (post_url,), post_kwargs = open_url_mock.call_args_list[0]
+        assert post_url == session_uri
+        assert post_kwargs["method"] == "POST"
+        assert json.loads(post_kwargs["data"]) == payload
+        (delete_url,), delete_kwargs = open_url_mock.call_args_list[1]
+        assert delete_kwargs["method"] == "DELETE"
+        assert delete_url.endswith("session_id')" if client is RestOME else "/session_id")
+        assert delete_kwargs["headers"]["X-Auth-Token"] == "token"
+
+    def test_session_not_created(self, open_url_mock):
+        open_url_mock.return_value.getcode.return_value = 400
+        with pytest.raises(ConnectionError, match="Could not create the session"):
+            with RestOME(dict(OME_PARAMS), True):
+                pass
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import io
+import socket
+import ssl
+import pytest
+from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.retry_policy import RetryPolicy, \
+    get_retry_policy, parse_retry_after, reset_retry_budget
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from mock import MagicMock
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+URL = "https://192.168.0.1:443/api/DeviceService/Devices"
+
+
+def _http_error(code, headers=None):
+    return HTTPError(URL, code, "error", headers or {}, io.BytesIO(b"{}"))
+
+
+class TestRetryPolicy(object):
+
+    @pytest.fixture(autouse=True)
+    def budget(self):
+        reset_retry_budget()
+        yield
+        reset_retry_budget()
+
+    @pytest.fixture
+    def sleep_mock(self, mocker):
+        return mocker.patch(MODULE_UTIL_PATH + 'retry_policy.time.sleep', return_value=None)
+
+    @pytest.mark.parametrize("method, err, expected", [
+        ("GET", _http_error(503), True),
+        ("GET", _http_error(504), True),
+        ("GET", _http_error(404), False),
+        ("POST", _http_error(429), True),
+        ("POST", _http_error(502), False),
+        ("PATCH", _http_error(503), True),
+        ("GET", URLError(ConnectionResetError("reset")), True),
+        ("GET", URLError(socket.timeout("timed out")), True),
+        ("POST", URLError(ConnectionResetError("reset")), False),
+        ("GET", URLError(ssl.SSLError("certificate verify failed")), False),
+        ("GET", URLError(socket.gaierror("unknown host")), False),
+        ("GET", URLError("Unable to connect"), False),
+    ])
+    def test_is_retryable(self, method, err, expected):
+        assert RetryPolicy(3).is_retryable(method, err) is expected
+
+    def test_backoff_with_jitter(self, mocker):
+        policy = RetryPolicy(5, backoff=1, max_delay=6)
+        for each in range(20):
+            assert 0.5 <= policy.get_delay(0) <= 1
+            assert 3 <= policy.get_delay(4) <= 6
+        mocker.patch(MODULE_UTIL_PATH + 'retry_policy.random.uniform', side_effect=lambda low, high: high)
+        assert [policy.get_delay(attempt) for attempt in range(5)] == [1, 2, 4, 6, 6]
+
+    def test_retry_after(self):
+        policy = RetryPolicy(3, max_delay=30)
+        assert policy.get_delay(0, _http_error(503, {"Retry-After": "7"})) == 7
+        assert policy.get_delay(0, _http_error(503, {"Retry-After": "120"})) is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_call_retries(self, sleep_mock):
+        func = MagicMock(side_effect=[_http_error(503, {"Retry-After": "2"}), _http_error(503), "resp"])
+        assert RetryPolicy(3, backoff=0).call("GET", func, "arg") == "resp"
+        assert func.call_count == 3
+        assert func.call_args[0] == ("arg",)
+        assert sleep_mock.call_args_list[0][0][0] == 2
+
+    def test_call_gives_up(self, sleep_mock):
+        func = MagicMock(side_effect=_http_error(503))
+        with pytest.raises(HTTPError):
+            RetryPolicy(2, backoff=0).call("GET", func)
+        assert func.call_count == 3
+        func = MagicMock(side_effect=_http_error(400))
+        with pytest.raises(HTTPError):
+            RetryPolicy(2, backoff=0).call("GET", func)
+        assert func.call_count == 1
+
+    def test_budget_is_shared(self, sleep_mock):
+        func = MagicMock(side_effect=_http_error(503))
+        with pytest.raises(HTTPError):
+            RetryPolicy(5, backoff=0, budget=3).call("GET", func)
+        assert func.call_count == 4
+        with pytest.raises(HTTPError):
+            RetryPolicy(5, backoff=0, budget=3).call("GET", func)
+        assert func.call_count == 5
+
+    @pytest.mark.parametrize("env, expected", [("3", 3), ("0", None), ("", None), ("many", None)])
+    def test_get_retry_policy(self, env, expected, monkeypatch):
+        monkeypatch.setenv("OMAM_RETRIES", env)
+        policy = get_retry_policy()
+        assert (policy.retries if policy else None) == expected
+
+    def test_rest_ome_retries(self, sleep_mock, mocker, monkeypatch):
+        monkeypatch.setenv("OMAM_RETRIES", "2")
+        module_params = {'hostname': '192.168.0.1', 'username': 'username', 'password': 'password',
+                         "port": 443}
+        resp = MagicMock()
+        resp.read.return_value = b'{"value": []}'
+        open_url_mock = mocker.patch(MODULE_UTIL_PATH + 'rest_transport.open_url', side_effect=[_http_error(503), resp])
+        obj = RestOME(module_params)
+        assert obj.invoke_request("GET", "DeviceService/Devices").json_data == {"value": []}
+        assert open_url_mock.call_count == 2
+        open_url_mock.side_effect = [_http_error(502), resp]
+        with pytest.raises(HTTPError):
+            obj.invoke_request("POST", "DeviceService/Devices", data={})
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import os
+import stat
+import pytest
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.session_cache import SessionCache, \
+    get_session_cache, session_cache_enabled
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from mock import MagicMock
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+INVOKE_REQUEST = 'ome.RestOME.invoke_request'
+TEST_HOST = 'http://testhost.com/'
+
+
+class TestSessionCache(object):
+
+    @pytest.fixture
+    def cache_dir(self, tmpdir, monkeypatch):
+        path = str(tmpdir.join("sessions"))
+        monkeypatch.setenv("OMAM_SESSION_CACHE_DIR", path)
+        monkeypatch.setenv("OMAM_SESSION_CACHE", "true")
+        return path
+
+    @pytest.fixture
+    def module_params(self):
+        return {'hostname': '192.168.0.1', 'username': 'username', 'password': 'password', "port": 443}
+
+    @pytest.fixture
+    def session_response(self):
+        resp = MagicMock()
+        resp.success = True
+        resp.json_data = {"Id": "session_id"}
+        resp.token_header = "token"
+        return resp
+
+    def test_save_and_load(self, cache_dir):
+        cache = SessionCache("192.168.0.1", 443, "user", "password")
+        assert cache.load() is None
+        with cache.lock():
+            cache.save("1234", "token")
+        assert cache.load()["token"] == "token"
+        assert stat.S_IMODE(os.stat(cache.path).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+        assert SessionCache("192.168.0.1", 443, "user", "changed").load() is None
+        assert SessionCache("192.168.0.1", 443, "user", "changed").path == cache.path
+        with open(cache.path) as cache_file:
+            assert "password" not in cache_file.read()
+        cache.invalidate()
+        assert cache.load() is None
+
+    @pytest.mark.parametrize("env, expected", [("true", True), ("yes", True), ("", False), ("false", False)])
+    def test_session_cache_enabled(self, env, expected, monkeypatch):
+        monkeypatch.setenv("OMAM_SESSION_CACHE", env)
+        assert session_cache_enabled() is expected
+        assert (get_session_cache("host", 443, "user", "pwd") is not None) is expected
+
+    def test_session_created_and_reused(self, cache_dir, module_params, session_response, mocker):
+        invoke_mock = mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, return_value=session_response)
+        with RestOME(module_params, True) as ome:
+            assert ome._headers["X-Auth-Token"] == "token"
+        assert [each[0][0] for each in invoke_mock.call_args_list] == ['POST']
+        invoke_mock.reset_mock()
+        with RestOME(module_params, True) as ome:
+            assert ome.session_id == "session_id"
+        assert [each[0][0] for each in invoke_mock.call_args_list] == ['GET']
+
+    def test_session_recreated_on_unauthorized(self, cache_dir, module_params, session_response, mocker):
+        SessionCache("192.168.0.1", 443, "username", "password").save("old_id", "old_token")
+
+        def invoke_request(method, path, **kwargs):
+            if method == 'GET':
+                raise HTTPError(TEST_HOST, 401, "Unauthorized", {}, None)
+            return session_response
+
+        mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=invoke_request)
+        with RestOME(module_params, True) as ome:
+            assert ome._headers["X-Auth-Token"] == "token"
+        assert SessionCache("192.168.0.1", 443, "username", "password").load()["session_id"] == "session_id"
+
+    def test_session_kept_on_server_error(self, cache_dir, module_params, session_response, mocker):
+        SessionCache("192.168.0.1", 443, "username", "password").save("old_id", "old_token")
+        mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST,
+                     side_effect=HTTPError(TEST_HOST, 503, "Service Unavailable", {}, None))
+        with pytest.raises(HTTPError):
+            with RestOME(module_params, True):
+                pass
+        assert SessionCache("192.168.0.1", 443, "username", "password").load()["session_id"] == "old_id"
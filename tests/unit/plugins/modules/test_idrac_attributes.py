@@ -38,6 +38,7 @@ UTILS_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.utils.
 def idrac_redfish_mock_for_attr(mocker, redfish_response_mock):
     connection_class_mock = mocker.patch(MODULE_PATH + 'iDRACRedfishAPI')
     idrac_connection_mock_obj = connection_class_mock.return_value.__enter__.return_value
+    idrac_connection_mock_obj.invoke_cached_request.return_value = redfish_response_mock
     idrac_connection_mock_obj.invoke_request.return_value = redfish_response_mock
     return idrac_connection_mock_obj
 
@@ -50,6 +50,7 @@ def idrac_redfish_mock_for_bios(mocker, ome_response_mock):
     connection_class_mock = mocker.patch(MODULE_PATH + 'iDRACRedfishAPI')
     ome_connection_mock_obj = connection_class_mock.return_value.__enter__.return_value
     ome_connection_mock_obj.invoke_request.return_value = ome_response_mock
+    ome_connection_mock_obj.invoke_cached_request.return_value = ome_response_mock
     return ome_connection_mock_obj
 
 
@@ -117,8 +117,6 @@ class TestExportLcLogs(FakeAnsibleModule):
     def test_run_export_lc_logs(self, idrac_connection_export_lc_logs_mock, idrac_default_args, idrac_file_manager_export_lc_logs_mock, mocker):
         idrac_default_args.update({"idrac_port": 443, "share_name": "sharename", "share_user": "share@user",
                                    "share_password": "sharepassword", "job_wait": True})
-        obj = MagicMock()
-        obj._name_ = "AF_INET6"
         my_share = MagicMock()
         my_share.new_file.return_value = "idrac_ip_file"
         mocker.patch(
@@ -126,7 +124,7 @@ class TestExportLcLogs(FakeAnsibleModule):
         mocker.patch(
             MODULE_PATH + "idrac_lifecycle_controller_logs.get_user_credentials", return_value=(my_share))
         mocker.patch(
-            MODULE_PATH + "idrac_lifecycle_controller_logs.socket.getaddrinfo", return_value=([[obj]]))
+            MODULE_PATH + "idrac_lifecycle_controller_logs.is_ipv6_host", return_value=True)
         mocker.patch(
             MODULE_PATH + "idrac_lifecycle_controller_logs.copy.deepcopy", return_value=("idrac_ip"))
         # mocker.patch(
@@ -143,9 +141,8 @@ class TestExportLcLogs(FakeAnsibleModule):
 
         idrac_default_args.update({"idrac_port": 443, "share_name": "sharename", "share_user": "shareuser",
                                    "share_password": "sharepassword", "job_wait": True})
-        obj._name_ = "AF_INET4"
         mocker.patch(
-            MODULE_PATH + "idrac_lifecycle_controller_logs.socket.getaddrinfo", return_value=([[obj]]))
+            MODULE_PATH + "idrac_lifecycle_controller_logs.is_ipv6_host", return_value=False)
         msg = self.module.run_export_lc_logs(
             idrac_connection_export_lc_logs_mock, f_module)
         assert msg['Status'] == "Success"
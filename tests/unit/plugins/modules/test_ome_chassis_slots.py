@@ -182,6 +182,7 @@ class TestOmeChassisSlots(FakeAnsibleModule):
             'json_data']
         ome_connection_mock_for_chassis_slots.job_tracking.return_value = (
             False, "job_track_msg")
+        mocker.patch(MODULE_PATH + 'multi_job_tracking', return_value=[(1, False, "job_track_msg", {})])
         mocker.patch(
             MODULE_PATH +
             'trigger_refresh_inventory',
@@ -267,6 +268,27 @@ class TestOmeChassisSlots(FakeAnsibleModule):
             ome_connection_mock_for_chassis_slots, params.get('slot_data'))
         assert jobs == params['jobs']
 
+    @pytest.mark.parametrize("params", [
+        {"refresh_states": [2060, 2020], "message": SUCCESS_MSG},
+        {"refresh_states": [2090, 2100], "message": SUCCESS_REFRESH_MSG}])
+    def test_exit_slot_config_refresh_states(self, params, ome_connection_mock_for_chassis_slots,
+                                             ome_response_mock, mocker):
+        mocker.patch(MODULE_PATH + 'trigger_refresh_inventory', return_value=[1, 2])
+        mocker.patch(MODULE_PATH + 'trigger_all_inventory_task', return_value=3)
+        mocker.patch('ansible_collections.dellemc.openmanage.plugins.module_utils.job_poller.time.sleep')
+        ome_response_mock.json_data = {"value": [
+            {"Id": job_id, "LastRunStatus": {"Id": state}}
+            for job_id, state in zip([1, 2], params["refresh_states"])]}
+        ome_connection_mock_for_chassis_slots.job_tracking.return_value = (False, "Job completed.")
+        f_module = self.get_module_mock()
+        f_module.exit_json.side_effect = SystemExit
+        slot_data = {"ABC1234": {"ChassisId": "123", "SlotNumber": "1", "ChassisServiceTag": "ABC1234",
+                                 "SlotName": "s1", "JobId": 12}}
+        with pytest.raises(SystemExit):
+            self.module.exit_slot_config(f_module, ome_connection_mock_for_chassis_slots, {}, {}, slot_data)
+        assert f_module.exit_json.call_args[1]["msg"] == params["message"]
+        assert ome_connection_mock_for_chassis_slots.invoke_request.call_count == 1
+
     @pytest.mark.parametrize("exc_type",
                              [IOError, ValueError, SSLError, TypeError, ConnectionError, HTTPError, URLError])
     def test_ome_groups_main_exception_failure_case(self, exc_type, mocker, ome_default_args,
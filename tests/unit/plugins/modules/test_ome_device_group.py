@@ -17,6 +17,7 @@ import json
 from ssl import SSLError
 from io import StringIO
 from ansible_collections.dellemc.openmanage.plugins.modules import ome_device_group
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
 from ansible_collections.dellemc.openmanage.tests.unit.plugins.modules.common import FakeAnsibleModule, Constants
 from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -43,6 +44,9 @@ def ome_connection_mock_for_device_group(mocker, ome_response_mock):
     ome_connection_mock_obj = connection_class_mock.return_value.__enter__.return_value
     ome_connection_mock_obj.invoke_request.return_value = ome_response_mock
     ome_connection_mock_obj.get_all_report_details.return_value = {"report_list": []}
+    ome_connection_mock_obj.iter_items.return_value = []
+    ome_connection_mock_obj.find_devices.side_effect = \
+        lambda *args, **kwargs: RestOME.find_devices(ome_connection_mock_obj, *args, **kwargs)
     return ome_connection_mock_obj
 
 
@@ -85,7 +89,7 @@ class TestOMEDeviceGroup(FakeAnsibleModule):
 
     def test_ome_device_group_get_device_id(self, ome_connection_mock_for_device_group):
         report_list = [{"Id": 25011, "DeviceServiceTag": "SEFRG2"}, {"Id": 25012, "DeviceServiceTag": "SEFRG3"}]
-        ome_connection_mock_for_device_group.get_all_report_details.return_value = {"report_list": report_list}
+        ome_connection_mock_for_device_group.iter_items.return_value = report_list
         f_module = self.get_module_mock(params={"name": "Storage Services",
                                                 "device_ids": [25011, 25012]})
         device_list, key = self.module.get_device_id(ome_connection_mock_for_device_group, f_module)
@@ -403,6 +407,19 @@ class TestOMEDeviceGroup(FakeAnsibleModule):
         res = self.module.get_device_id_from_ip(ip_addresses, device_list, f_module)
         assert res == output
 
+    def test_get_ip_intervals(self):
+        intervals = self.module._get_ip_intervals([IPNetwork("192.168.3.0/24"), IPAddress("192.168.4.0"),
+                                                   IPRange("192.168.1.10", "192.168.1.20"),
+                                                   IPRange("192.168.1.15", "192.168.1.30"),
+                                                   IPAddress("fe80::1")])
+        assert intervals[4] == ([int(IPAddress("192.168.1.10")), int(IPAddress("192.168.3.0"))],
+                                [int(IPAddress("192.168.1.30")), int(IPAddress("192.168.4.0"))])
+        assert intervals[6] == ([int(IPAddress("fe80::1"))], [int(IPAddress("fe80::1"))])
+        assert self.module._ip_in_intervals(IPAddress("192.168.1.25"), intervals) is True
+        assert self.module._ip_in_intervals(IPAddress("192.168.2.1"), intervals) is False
+        assert self.module._ip_in_intervals(IPAddress("192.168.1.9"), intervals) is False
+        assert self.module._ip_in_intervals(IPAddress("::1"), intervals) is False
+
     def test_get_device_id_from_ip_failure_case(self):
         device_list = [
             {
@@ -13,7 +13,9 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import pytest
+from mock import MagicMock
 from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.parse import quote
 from ansible_collections.dellemc.openmanage.plugins.modules import ome_device_info
 from ansible_collections.dellemc.openmanage.tests.unit.plugins.modules.common import FakeAnsibleModule, Constants
 
@@ -173,6 +175,23 @@ class TestOmeDeviceInfo(FakeAnsibleModule):
         else:
             assert res is None
 
+    @pytest.mark.parametrize("module_params,data", [({"system_query_options": None}, None),
+                                                    ({"system_query_options": {"select": []}}, None),
+                                                    ({"system_query_options": {"select": ["Id"]}}, ["Id"])])
+    def test_get_select_attributes(self, module_params, data):
+        assert self.module._get_select_attributes(module_params) == data
+
+    def test_main_basic_inventory_select(self, ome_default_args, module_mock, validate_device_inputs_mock,
+                                         ome_connection_mock, get_device_resource_parameters_mock, ome_response_mock):
+        ome_response_mock.json_data = {"@odata.context": "/api/$metadata#Collection(DeviceService.Device)"}
+        ome_connection_mock.get_all_report_details.return_value = {"resp_obj": ome_response_mock,
+                                                                   "report_list": [{"Id": Constants.device_id1}]}
+        ome_response_mock.status_code = 200
+        ome_default_args.update({"system_query_options": {"select": ["Id"]}})
+        result = self._run_module(ome_default_args)
+        assert result["device_info"]["value"] == [{"Id": Constants.device_id1}]
+        assert ome_connection_mock.get_all_report_details.call_args[1]["select"] == ["Id"]
+
     @pytest.mark.parametrize("module_params", params)
     def test_get_device_identifier_map(self, module_params, ome_connection_mock, mocker):
         get_device_id_from_service_tags_mock = mocker.patch(MODULE_PATH +
@@ -186,22 +205,56 @@ class TestOmeDeviceInfo(FakeAnsibleModule):
                                                {Constants.device_id1: Constants.service_tag1})
         assert self.module.device_fact_error_report[Constants.service_tag1] == "Duplicate report of device_id: 1234"
 
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_fetch_device_facts(self, workers, ome_connection_mock):
+        def invoke_request(method, path):
+            if path.startswith("DeviceService/Devices(3)"):
+                raise HTTPError('http://testhost.com', 404, 'Not Found', {}, None)
+            resp = MagicMock(status_code=200)
+            resp.json_data = {"path": path}
+            return resp
+
+        ome_connection_mock.invoke_request.side_effect = invoke_request
+        device_facts = {"device_id": dict((device_id, "DeviceService/Devices({0})/SubSystemHealth".format(device_id))
+                                          for device_id in range(1, 9)),
+                        "device_service_tag": {"TAG1": "DeviceService/Devices(10)/SubSystemHealth"}}
+        resp_status = self.module._fetch_device_facts(ome_connection_mock, device_facts, workers)
+        assert resp_status == [200] * 8
+        assert list(device_facts["device_id"].keys()) == list(range(1, 9))
+        assert device_facts["device_id"][1] == {"path": "DeviceService/Devices(1)/SubSystemHealth"}
+        assert device_facts["device_id"][3] == "HTTP Error 404: Not Found"
+        assert device_facts["device_service_tag"]["TAG1"] == {"path": "DeviceService/Devices(10)/SubSystemHealth"}
+
     @pytest.mark.parametrize("val,expected_res", [(123, True), ("abc", False)])
     def test_is_int(self, val, expected_res):
         actual_res = self.module.is_int(val)
         assert actual_res == expected_res
 
-    def test_get_device_id_from_service_tags(self, ome_connection_mock, ome_response_mock, mocker):
-        mocker.patch(MODULE_PATH + 'ome_device_info.update_device_details_with_filtering')
-        ome_response_mock.json_data.update({"@odata.context": "/api/$metadata#Collection(DeviceService.Device)"})
-        ome_response_mock.json_data.update({"@odata.count": 1})
-        ome_connection_mock.get_all_report_details.return_value = {"resp_obj": ome_response_mock, "report_list": [
-            {"DeviceServiceTag": Constants.service_tag1,
-             "Id": Constants.device_id1}]}
-        self.module._get_device_id_from_service_tags([Constants.service_tag1, "INVALID"], ome_connection_mock)
+    def test_get_device_id_from_service_tags(self, ome_connection_mock, ome_response_mock):
+        ome_response_mock.json_data = {"value": [{"DeviceServiceTag": Constants.service_tag1,
+                                                  "Id": Constants.device_id1, "Model": "PowerEdge R740"}]}
+        service_tag_dict = self.module._get_device_id_from_service_tags([Constants.service_tag1, "INVALID"],
+                                                                        ome_connection_mock)
+        assert service_tag_dict == {Constants.device_id1: Constants.service_tag1}
+        assert self.module.device_fact_error_report["INVALID"] == self.module.DESC_HTTP_ERROR
+        assert ome_connection_mock.invoke_request.call_count == 1
+        query_param = ome_connection_mock.invoke_request.call_args[1]["query_param"]
+        assert query_param["$filter"] == "DeviceServiceTag eq '{0}' or DeviceServiceTag eq 'INVALID'".format(
+            Constants.service_tag1)
+        assert query_param["$select"] == "Id,DeviceServiceTag"
+        ome_connection_mock.get_all_report_details.assert_not_called()
+
+    def test_get_device_id_from_service_tags_chunks(self, ome_connection_mock, ome_response_mock):
+        ome_response_mock.json_data = {"value": []}
+        service_tags = ["TAG{0:05d}".format(each) for each in range(200)]
+        self.module._get_device_id_from_service_tags(service_tags, ome_connection_mock)
+        calls = ome_connection_mock.invoke_request.call_args_list
+        assert 1 < len(calls) < 10
+        assert sum(each[1]["query_param"]["$top"] for each in calls) == 200
+        assert all(len(quote(each[1]["query_param"]["$filter"])) <= 1500 for each in calls)
 
     def test_get_device_id_from_service_tags_error_case(self, ome_connection_mock, ome_response_mock):
-        ome_connection_mock.get_all_report_details.side_effect = HTTPError('http://testhost.com', 400, '', {}, None)
+        ome_connection_mock.invoke_request.side_effect = HTTPError('http://testhost.com', 400, '', {}, None)
         with pytest.raises(HTTPError) as ex:
             self.module._get_device_id_from_service_tags(["INVALID"], ome_connection_mock)
 
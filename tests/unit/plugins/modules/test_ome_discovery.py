@@ -160,7 +160,7 @@ class TestOmeDiscovery(FakeAnsibleModule):
                                         {"json_data": {'JobStatusId': 2070}, 'job_wait_sec': 60, 'job_failed': True,
                                          "msg": JOB_TRACK_FAIL.format('Failed')},
                                         {"json_data": {'JobStatusId': 2050}, 'job_wait_sec': 60, 'job_failed': True,
-                                         "msg": JOB_TRACK_INCOMPLETE.format(1, 2)}, ])
+                                         "msg": JOB_TRACK_INCOMPLETE.format(1, 5)}, ])
     def test_discovery_job_tracking(self, params, mocker, ome_connection_mock_for_discovery, ome_response_mock):
         ome_response_mock.success = params.get("success", True)
         ome_response_mock.json_data = params["json_data"]
@@ -20,6 +20,7 @@ import pytest
 from ansible.module_utils._text import to_text
 from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
 from ansible_collections.dellemc.openmanage.plugins.modules import ome_firmware_baseline
 from ansible_collections.dellemc.openmanage.tests.unit.plugins.modules.common import FakeAnsibleModule
 
@@ -289,21 +290,20 @@ class TestOmeFirmwareBaseline(FakeAnsibleModule):
     def test_get_dev_ids(self, ome_connection_mock_for_firmware_baseline,
                          ome_response_mock, params):
         f_module = self.get_module_mock(params=params["inp"])
-        ome_connection_mock_for_firmware_baseline.get_all_items_with_pagination.return_value = {
-            "value":
-                [
-                    {
-                        "Id": 12,
-                        "Type": 1000,
-                        "DeviceServiceTag": "R840PT3"
-                    },
-                    {
-                        "Id": 23,
-                        "Type": 1000,
-                        "DeviceServiceTag": "R940PT3"
-                    }
-                ]
-        }
+        ome_connection_mock_for_firmware_baseline.iter_items.return_value = iter([
+            {
+                "Id": 12,
+                "Type": 1000,
+                "DeviceServiceTag": "R840PT3"
+            },
+            {
+                "Id": 23,
+                "Type": 1000,
+                "DeviceServiceTag": "R940PT3"
+            }
+        ])
+        ome_connection_mock_for_firmware_baseline.find_devices.side_effect = \
+            lambda *args, **kwargs: RestOME.find_devices(ome_connection_mock_for_firmware_baseline, *args, **kwargs)
         targets = self.module.get_dev_ids(f_module, ome_connection_mock_for_firmware_baseline,
                                           "device_service_tags", "DeviceServiceTag")
         assert targets == params["out"]
@@ -21,6 +21,7 @@ from ansible.module_utils._text import to_text
 from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.modules import ome_template
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
 from ansible_collections.dellemc.openmanage.tests.unit.plugins.modules.common import FakeAnsibleModule, Constants
 
 MODULE_PATH = 'ansible_collections.dellemc.openmanage.plugins.modules.ome_template.'
@@ -31,8 +32,12 @@ def ome_connection_mock_for_template(mocker, ome_response_mock):
     connection_class_mock = mocker.patch(MODULE_PATH + 'RestOME')
     ome_connection_mock_obj = connection_class_mock.return_value.__enter__.return_value
     ome_connection_mock_obj.invoke_request.return_value = ome_response_mock
+    ome_connection_mock_obj.invoke_cached_request.return_value = ome_response_mock
     ome_connection_mock_obj.get_all_report_details.return_value = {
         "report_list": []}
+    ome_connection_mock_obj.iter_items.return_value = []
+    ome_connection_mock_obj.find_devices.side_effect = \
+        lambda *args, **kwargs: RestOME.find_devices(ome_connection_mock_obj, *args, **kwargs)
     return ome_connection_mock_obj
 
 
@@ -49,9 +54,8 @@ class TestOmeTemplate(FakeAnsibleModule):
         return response_class_mock
 
     def test_get_service_tags_success_case(self, ome_connection_mock_for_template, ome_response_mock):
-        ome_connection_mock_for_template.get_all_report_details.return_value = {
-            "report_list": [{"Id": Constants.device_id1,
-                             "DeviceServiceTag": Constants.service_tag1}]}
+        ome_connection_mock_for_template.iter_items.return_value = [
+            {"Id": Constants.device_id1, "DeviceServiceTag": Constants.service_tag1}]
         f_module = self.get_module_mock(
             {'device_id': [], 'device_service_tag': [Constants.service_tag1]})
         data = self.module.get_device_ids(
@@ -203,12 +207,9 @@ class TestOmeTemplate(FakeAnsibleModule):
 
     def test_get_device_ids_failure_case_02(self, ome_connection_mock_for_template, ome_response_mock,
                                             ome_default_args):
-        ome_connection_mock_for_template.get_all_report_details.return_value = {
-            "report_list": [{"Id": Constants.device_id1,
-                             "DeviceServiceTag": Constants.service_tag1},
-                            {"Id": Constants.device_id2,
-                             "DeviceServiceTag": "tag2"}
-                            ]}
+        ome_connection_mock_for_template.iter_items.return_value = [
+            {"Id": Constants.device_id1, "DeviceServiceTag": Constants.service_tag1},
+            {"Id": Constants.device_id2, "DeviceServiceTag": "tag2"}]
         f_module = self.get_module_mock(
             params={'device_id': [Constants.device_id2], 'device_service_tag': ["abcd"]})
         with pytest.raises(Exception) as exc:
@@ -219,10 +220,8 @@ class TestOmeTemplate(FakeAnsibleModule):
 
     def test_get_device_ids_for_no_device_failue_case_03(self, ome_connection_mock_for_template, ome_response_mock,
                                                          ome_default_args):
-        ome_connection_mock_for_template.get_all_report_details.return_value = {
-            "report_list": [{"Id": Constants.device_id1,
-                             "DeviceServiceTag": Constants.service_tag1}
-                            ], "resp_obj": ome_response_mock}
+        ome_connection_mock_for_template.iter_items.return_value = [
+            {"Id": Constants.device_id1, "DeviceServiceTag": Constants.service_tag1}]
         f_module = self.get_module_mock(
             params={'device_service_tag': [Constants.service_tag1], 'device_id': []})
         with pytest.raises(Exception) as exc:
@@ -694,6 +693,7 @@ class TestOmeTemplate(FakeAnsibleModule):
         ome_response_mock.json_data = params['json_data']
         ome_connection_mock_for_template.get_all_report_details.return_value = params[
             'json_data']
+        ome_connection_mock_for_template.iter_items.return_value = params['json_data']['report_list']
         ome_default_args.update(params['mparams'])
         mocks = ["job_tracking", "get_device_ids"]
         for m in mocks:
@@ -732,6 +732,7 @@ class TestOmeTemplate(FakeAnsibleModule):
         ome_response_mock.json_data = params['json_data']
         ome_connection_mock_for_template.get_all_report_details.return_value = params[
             'json_data']
+        ome_connection_mock_for_template.iter_items.return_value = params['json_data']['report_list']
         ome_default_args.update(params['mparams'])
         mocks = ["job_tracking", "get_device_ids"]
         for m in mocks:
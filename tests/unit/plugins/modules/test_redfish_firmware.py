@@ -276,3 +276,27 @@ class TestRedfishFirmware(FakeAnsibleModule):
         with patch("{0}.open".format(builtin_module_name), mock_open(read_data="data")) as mock_file:
             result = self.module.firmware_update(redfish_firmware_connection_mock, f_module)
         assert result == redfish_response_mock
+
+    def test_wait_for_job_completion_after_error(self, redfish_default_args, redfish_firmware_connection_mock,
+                                                 mocker):
+        poller_mock = mocker.patch(MODULE_PATH + "redfish_firmware.JobPoller").return_value
+        poller_mock.expired = False
+        running = MagicMock(json_data={"PercentComplete": 0, "JobState": "Starting"})
+        redfish_firmware_connection_mock.invoke_request.side_effect = [
+            running, HTTPError("https://testhost.com", 503, "Service Unavailable", {}, None),
+            MagicMock(json_data={"PercentComplete": 100, "JobState": "Completed", "JobStatus": "OK"})]
+        f_module = self.get_module_mock(params=redfish_default_args)
+        result = self.module.wait_for_job_completion(f_module, JOB_URI.format(job_id="JID_123"))
+        assert result == (redfish_firmware.JOBSTATUS_SUCCESS, redfish_firmware.SUCCESS_JOB_MSG)
+        assert [each[0][0] for each in poller_mock.sleep.call_args_list] == [running.json_data, None]
+
+    def test_wait_for_job_completion_scheduled(self, redfish_default_args, redfish_firmware_connection_mock,
+                                               mocker):
+        poller_mock = mocker.patch(MODULE_PATH + "redfish_firmware.JobPoller").return_value
+        type(poller_mock).expired = mocker.PropertyMock(side_effect=[False, True])
+        redfish_firmware_connection_mock.invoke_request.side_effect = [
+            MagicMock(json_data={"PercentComplete": 0, "JobState": "Starting"}),
+            URLError("connection refused")]
+        f_module = self.get_module_mock(params=redfish_default_args)
+        result = self.module.wait_for_job_completion(f_module, JOB_URI.format(job_id="JID_123"))
+        assert result == (redfish_firmware.JOBSTATUS_SCHEDULED, redfish_firmware.SCHEDULE_JOB_MSG)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 8.5.0
+# Copyright (C) 2023 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import io
+import json
+import pytest
+from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.plugin_utils.httpapi_session import SessionHttpApiBase
+from ansible_collections.dellemc.openmanage.plugins.module_utils.http_transport import connection_open_url
+from mock import MagicMock
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+SESSION_URI = "/redfish/v1/Sessions"
+
+
+class _SessionHttpApi(SessionHttpApiBase):
+    session_uri = SESSION_URI
+    session_id_uri = SESSION_URI + "/{Id}"
+
+
+def _response(status=200, body=b"", headers=None):
+    response = MagicMock()
+    response.getcode.return_value = status
+    response.reason = "OK"
+    response.headers = dict(headers or {})
+    return response, io.BytesIO(body)
+
+
+class TestSessionHttpApiBase(object):
+
+    @pytest.fixture
+    def connection(self):
+        connection = MagicMock()
+        connection._auth = None
+        connection.get_option.side_effect = {"remote_user": "root", "password": "pwd"}.get
+        connection.send.return_value = _response(201, b'{"Id": "10"}', {"X-Auth-Token": "token"})
+        return connection
+
+    def test_login_and_logout(self, connection):
+        httpapi = _SessionHttpApi(connection)
+        httpapi.login("root", "pwd")
+        assert httpapi.session_id == "10"
+        assert connection._auth == {"X-Auth-Token": "token"}
+        path, payload = connection.send.call_args[0]
+        assert path == SESSION_URI
+        assert json.loads(payload) == {"UserName": "root", "Password": "pwd"}
+        httpapi.logout()
+        assert connection.send.call_args[0] == (SESSION_URI + "/10", None)
+        assert connection.send.call_args[1]["method"] == "DELETE"
+        assert httpapi.session_id is None
+        assert connection._auth is None
+
+    @pytest.mark.parametrize("side_effect", [
+        HTTPError(SESSION_URI, 401, "Unauthorized", {}, None),
+        [_response(201, b'{"Id": "10"}')],
+    ])
+    def test_login_failure(self, connection, side_effect):
+        connection.send.side_effect = side_effect
+        with pytest.raises(ConnectionError):
+            _SessionHttpApi(connection).login("root", "pwd")
+
+    def test_handle_httperror_login_again(self, connection):
+        httpapi = _SessionHttpApi(connection)
+        httpapi.login("root", "pwd")
+        connection.send.return_value = _response(201, b'{"Id": "11"}', {"X-Auth-Token": "new_token"})
+        assert httpapi.handle_httperror(HTTPError(SESSION_URI, 401, "Unauthorized", {}, None)) is True
+        assert httpapi.session_id == "11"
+        assert connection._auth == {"X-Auth-Token": "new_token"}
+        assert json.loads(connection.send.call_args[0][1]) == {"UserName": "root", "Password": "pwd"}
+
+    @pytest.mark.parametrize("code, auth", [(401, None), (404, {"X-Auth-Token": "token"})])
+    def test_handle_httperror_returned(self, connection, code, auth):
+        connection._auth = auth
+        exc = HTTPError(SESSION_URI, code, "Error", {}, None)
+        assert _SessionHttpApi(connection).handle_httperror(exc) is exc
+        connection.send.assert_not_called()
+
+    def test_send_request_round_trip(self, connection, mocker):
+        httpapi = _SessionHttpApi(connection)
+        connection.send.return_value = _response(200, b'{"Name": "\xc3\xa9"}', {"ETag": "1"})
+        mocker.patch.dict(MODULE_UTIL_PATH + 'http_transport._CONNECTION_HOSTS', {"/socket": "192.168.0.1"})
+        persistent = mocker.patch(MODULE_UTIL_PATH + 'http_transport.Connection').return_value
+        persistent.send_request.side_effect = httpapi.send_request
+        resp = connection_open_url("/socket", "https://192.168.0.1:443/redfish/v1/Systems?$top=1",
+                                   data=b'{"Key": "\xc3\xa9"}', method="patch",
+                                   headers={"X-Auth-Token": "module_token", "If-Match": "1"})
+        path, data = connection.send.call_args[0]
+        assert path == "/redfish/v1/Systems?$top=1"
+        assert data == b'{"Key": "\xc3\xa9"}'
+        assert connection.send.call_args[1]["method"] == "PATCH"
+        headers = connection.send.call_args[1]["headers"]
+        assert "X-Auth-Token" not in headers
+        assert headers["If-Match"] == "1"
+        assert resp.getcode() == 200
+        assert resp.read() == b'{"Name": "\xc3\xa9"}'
+        assert resp.headers.get("ETag") == "1"
+
+    def test_send_request_http_error(self, connection, mocker):
+        httpapi = _SessionHttpApi(connection)
+        connection.send.return_value = _response(404, b'{"error": "not found"}')
+        mocker.patch.dict(MODULE_UTIL_PATH + 'http_transport._CONNECTION_HOSTS', {"/socket": "192.168.0.1"})
+        persistent = mocker.patch(MODULE_UTIL_PATH + 'http_transport.Connection').return_value
+        persistent.send_request.side_effect = httpapi.send_request
+        with pytest.raises(HTTPError) as err:
+            connection_open_url("/socket", "https://192.168.0.1/redfish/v1/Systems/1")
+        assert err.value.code == 404
+        assert err.value.read() == b'{"error": "not found"}'
+        assert connection.send.call_args[0] == ("/redfish/v1/Systems/1", None)